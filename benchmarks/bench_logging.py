@@ -0,0 +1,62 @@
+"""
+Logging overhead load test, POST /attempt throughput with LOG_LEVEL=INFO vs DEBUG.
+
+Starts gunicorn (sync workers) with each logging configuration, server logs are written to a file, then keeps N
+concurrent clients posting valid attempts for a few seconds and reports throughput, latency percentiles and log
+volume.
+
+Usage: python -m benchmarks.bench_logging [--concurrency 10] [--duration 5] [--workers 1]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+
+from benchmarks.bench_serving import ATTEMPT_REQUESTS
+from benchmarks.server import gunicorn_command, load, run_server
+
+CONFIGURATIONS = {
+    "INFO": {"LOG_LEVEL": "INFO"},
+    "DEBUG": {"LOG_LEVEL": "DEBUG", "LOG_REQUEST_SAMPLE_RATE": "1"},
+    "DEBUG (1% sampled)": {"LOG_LEVEL": "DEBUG", "LOG_REQUEST_SAMPLE_RATE": "0.01"},
+    "DEBUG (JSON)": {
+        "LOG_LEVEL": "DEBUG",
+        "LOG_REQUEST_SAMPLE_RATE": "1",
+        "LOG_JSON": "true",
+    },
+}
+
+
+def _run(env_values: dict, port: int, workers: int, concurrency: int, duration: float):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        log_file = os.path.join(tmpdir, "server.log")
+        with (
+            open(log_file, "w") as log,
+            run_server(gunicorn_command(port, workers), port, stderr=log, **env_values),
+        ):
+            result = asyncio.run(load(port, ATTEMPT_REQUESTS, concurrency, duration))
+        result["log_kb"] = os.path.getsize(log_file) // 1024
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=5125)
+    args = parser.parse_args()
+
+    print(
+        f"{'logging':<20} {'requests':>9} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'log (kB)':>9}"
+    )
+    for name, env_values in CONFIGURATIONS.items():
+        r = _run(env_values, args.port, args.workers, args.concurrency, args.duration)
+        print(
+            f"{name:<20} {r['requests']:>9} {r['rps']:>9} {r['p50_ms']:>9} {r['p99_ms']:>9} {r['log_kb']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
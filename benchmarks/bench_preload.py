@@ -0,0 +1,130 @@
+"""
+Preload mode benchmark, gunicorn with and without --preload (Linux only, reads /proc).
+
+Starts gunicorn with N sync workers (precomputed feedback enabled so startup builds tables) and reports time to first
+response, total CPU time spent starting, and per-worker memory: RSS, PSS (shared pages divided between processes)
+and private memory.
+
+Usage: python -m benchmarks.bench_preload [--workers 4]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+HOST = "127.0.0.1"
+
+
+def _children(pid: int) -> list[int]:
+    with open(f"/proc/{pid}/task/{pid}/children") as f:
+        return [int(child) for child in f.read().split()]
+
+
+def _memory_kb(pid: int) -> dict[str, int]:
+    memory = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("Rss", "Pss", "Private_Clean", "Private_Dirty"):
+                memory[key] = int(value.split()[0])
+    return {
+        "rss": memory["Rss"],
+        "pss": memory["Pss"],
+        "private": memory["Private_Clean"] + memory["Private_Dirty"],
+    }
+
+
+def _cpu_seconds(pid: int) -> float:
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    # utime, stime (clock ticks) are fields 14 and 15, i.e. 12 and 13 after process name
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def _wait_for_response(port: int, timeout: float = 60) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(f"http://{HOST}:{port}/openapi/openapi.json")
+            return
+        except (urllib.error.URLError, ConnectionError):
+            time.sleep(0.05)
+    raise TimeoutError(f"server did not start on port {port}")
+
+
+def _run(preload: bool, workers: int, port: int) -> dict:
+    command = [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "--bind",
+        f"{HOST}:{port}",
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        *(["--preload"] if preload else []),
+        "wordleapi.wsgi:app",
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env = dict(os.environ)
+        env.update(
+            {
+                "DATABASE_URI": f"sqlite:///{os.path.join(tmpdir, 'bench.db')}",
+                "WHITELIST_FILE_6_LETTERS": "whitelist_files/whitelist_6_fr.txt",
+                "WHITELIST_FILE_7_LETTERS": "whitelist_files/whitelist_7_fr.txt",
+                "WHITELIST_FILE_8_LETTERS": "whitelist_files/whitelist_8_fr.txt",
+                "PRECOMPUTED_FEEDBACK": "true",
+                "LOGURU_LEVEL": "WARNING",
+            }
+        )
+        start = time.perf_counter()
+        server = subprocess.Popen(command, cwd=ROOT_DIR, env=env)
+        try:
+            _wait_for_response(port)
+            first_response = time.perf_counter() - start
+            # let every worker finish its startup
+            time.sleep(5)
+            worker_pids = _children(server.pid)
+            memories = [_memory_kb(pid) for pid in worker_pids]
+            cpu = _cpu_seconds(server.pid) + sum(_cpu_seconds(p) for p in worker_pids)
+        finally:
+            server.terminate()
+            server.wait()
+    return {
+        "first_response_s": first_response,
+        "cpu_s": cpu,
+        "workers": len(worker_pids),
+        **{
+            f"{key}_kb": sum(m[key] for m in memories) // len(memories)
+            for key in ("rss", "pss", "private")
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--port", type=int, default=5124)
+    args = parser.parse_args()
+
+    print(
+        f"{'mode':<10} {'workers':>7} {'1st resp (s)':>12} {'cpu (s)':>8} "
+        f"{'RSS/worker (kB)':>16} {'PSS/worker (kB)':>16} {'private/worker (kB)':>20}"
+    )
+    for preload in (False, True):
+        r = _run(preload, args.workers, args.port)
+        print(
+            f"{'preload' if preload else 'default':<10} {r['workers']:>7} {r['first_response_s']:>12.2f} "
+            f"{r['cpu_s']:>8.2f} {r['rss_kb']:>16} {r['pss_kb']:>16} {r['private_kb']:>20}"
+        )
+
+
+if __name__ == "__main__":
+    main()
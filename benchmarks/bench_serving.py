@@ -0,0 +1,51 @@
+"""
+Serving mode load test, WSGI (gunicorn sync workers) vs ASGI (uvicorn).
+
+Starts each server on a local SQLite database, then keeps N concurrent clients posting valid attempts for a few
+seconds and reports throughput and latency percentiles.
+
+Usage: python -m benchmarks.bench_serving [--concurrency 10 100 1000] [--duration 5] [--workers 1]
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.server import gunicorn_command, load, run_server, uvicorn_command
+
+ATTEMPT_REQUESTS = [
+    ("POST", "/attempt", json.dumps({"attempt": attempt}).encode())
+    for attempt in ("abacas", "abaissa", "abaisser")
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--port", type=int, default=5123)
+    args = parser.parse_args()
+
+    results = {}
+    for name, command in (
+        ("wsgi (gunicorn sync)", gunicorn_command(args.port, args.workers)),
+        ("asgi (uvicorn)", uvicorn_command(args.port, args.workers)),
+    ):
+        with run_server(command, args.port):
+            for concurrency in args.concurrency:
+                results[(name, concurrency)] = asyncio.run(
+                    load(args.port, ATTEMPT_REQUESTS, concurrency, args.duration)
+                )
+
+    print(
+        f"{'mode':<22} {'clients':>7} {'requests':>9} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9}"
+    )
+    for (name, concurrency), r in results.items():
+        print(
+            f"{name:<22} {concurrency:>7} {r['requests']:>9} {r['rps']:>9} {r['p50_ms']:>9} {r['p99_ms']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Whitelist microbenchmark.
+
+Compares load time and membership test cost of a plain tuple (previous load_whitelist_file return type), Whitelist
+and MappedWhitelist (compiled whitelist file) for hits and misses on each whitelist file.
+
+Usage: python -m benchmarks.bench_whitelist
+"""
+
+import os
+import tempfile
+import time
+import timeit
+
+from wordleapi.core import (
+    AVAILABLE_WORD_LENGTHS,
+    MappedWhitelist,
+    Whitelist,
+    compile_whitelist_file,
+)
+
+WHITELIST_DIR = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "..", "whitelist_files"
+)
+NUMBER = 200
+
+
+def _whitelist_file(word_length: int) -> str:
+    return os.path.join(WHITELIST_DIR, f"whitelist_{word_length}_fr.txt")
+
+
+def _read_words(word_length: int) -> list[str]:
+    with open(_whitelist_file(word_length)) as f:
+        return [word for word in f.read().split("\n") if word != ""]
+
+
+def _bench(container, probes: list[str]) -> float:
+    """Returns mean time per membership test (in ns)"""
+    elapsed = timeit.timeit(
+        "for p in probes: p in container",
+        globals={"probes": probes, "container": container},
+        number=NUMBER,
+    )
+    return elapsed / (NUMBER * len(probes)) * 1e9
+
+
+def _timed(callback) -> tuple[object, float]:
+    """Returns callback result and duration (in ms)"""
+    start = time.perf_counter()
+    result = callback()
+    return result, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    print(
+        f"{'length':>6} {'words':>6} {'case':>5} {'tuple (ns)':>12} {'Whitelist (ns)':>15} {'Mapped (ns)':>12}"
+    )
+    load_times = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for word_length in AVAILABLE_WORD_LENGTHS:
+            compiled_file = os.path.join(tmpdir, f"whitelist_{word_length}.bin")
+            compile_whitelist_file(_whitelist_file(word_length), compiled_file)
+
+            words, tuple_load = _timed(
+                lambda word_length=word_length: _read_words(word_length)
+            )
+            as_tuple = tuple(words)
+            as_whitelist, whitelist_load = _timed(lambda words=words: Whitelist(words))
+            as_mapped, mapped_load = _timed(
+                lambda compiled_file=compiled_file: MappedWhitelist(compiled_file)
+            )
+            load_times.append(
+                (word_length, tuple_load, tuple_load + whitelist_load, mapped_load)
+            )
+
+            # first, middle and last words so tuple scan cost is averaged over the list
+            hits = [words[0], words[len(words) // 2], words[-1]]
+            misses = ["z" * word_length, "a" * word_length, words[-1][::-1].upper()]
+            for case, probes in (("hit", hits), ("miss", misses)):
+                print(
+                    f"{word_length:>6} {len(words):>6} {case:>5} "
+                    f"{_bench(as_tuple, probes):>12.1f} {_bench(as_whitelist, probes):>15.1f} "
+                    f"{_bench(as_mapped, probes):>12.1f}"
+                )
+
+    print()
+    print(
+        f"{'length':>6} {'tuple load (ms)':>16} {'Whitelist load (ms)':>20} {'Mapped load (ms)':>17}"
+    )
+    for word_length, tuple_load, whitelist_load, mapped_load in load_times:
+        print(
+            f"{word_length:>6} {tuple_load:>16.2f} {whitelist_load:>20.2f} {mapped_load:>17.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Compare two benchmark results files (see benchmarks.run).
+
+Prints each metric of both runs and its relative change, changes worse than threshold are flagged as regressions
+(exit code 1 if any).
+
+Usage: python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold 10]
+"""
+
+import argparse
+import json
+import sys
+
+# metric name => True if higher is better
+_METRICS = {
+    "mean_us": False,
+    "best_us": False,
+    "rps": True,
+    "p50_ms": False,
+    "p99_ms": False,
+}
+
+
+def _rows(baseline: dict, candidate: dict):
+    for section in ("micro", "load"):
+        for name, base_values in baseline.get(section, {}).items():
+            values = candidate.get(section, {}).get(name)
+            if values is None:
+                continue
+            for metric, higher_is_better in _METRICS.items():
+                if metric in base_values and metric in values:
+                    yield (
+                        f"{section}.{name}.{metric}",
+                        base_values[metric],
+                        values[metric],
+                        higher_is_better,
+                    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument(
+        "--threshold", type=float, default=10, help="regression threshold (in %%)"
+    )
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(
+        f"{'metric':<52} {baseline['commit']:>14} {candidate['commit']:>14} {'change':>9}"
+    )
+    regressions = 0
+    for name, base, value, higher_is_better in _rows(baseline, candidate):
+        change = (value - base) / base * 100 if base else 0.0
+        regression = (-change if higher_is_better else change) > args.threshold
+        regressions += regression
+        print(
+            f"{name:<52} {base:>14} {value:>14} {change:>+8.1f}%"
+            f"{'  REGRESSION' if regression else ''}"
+        )
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+End-to-end HTTP load scenarios against a local server (gunicorn sync workers, SQLite database).
+
+- steady: clients keep posting whitelisted attempts (today words already generated)
+- rollover: burst of concurrent first requests while today words are not generated yet, each server starts on an empty
+  database so the burst hits daily word generation like requests right after midnight
+- invalid_flood: clients keep posting non-whitelisted words and invalid payloads
+- method_flood: clients keep sending GET /attempt (HTTP 405)
+
+Usage: python -m benchmarks.load [--concurrency 10] [--duration 5] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks.server import gunicorn_command, load, run_server
+
+
+def _attempt(attempt) -> tuple[str, str, bytes]:
+    return "POST", "/attempt", json.dumps({"attempt": attempt}).encode()
+
+
+STEADY_REQUESTS = [_attempt(a) for a in ("abacas", "abaissa", "abaisser")]
+INVALID_REQUESTS = [
+    _attempt("zzzzzz"),
+    _attempt("abc"),
+    _attempt(123456),
+    ("POST", "/attempt", b"{}"),
+]
+METHOD_REQUESTS = [("GET", "/attempt", b"")]
+ROLLOVER_BURST = 64
+
+
+def run(port: int, concurrency: int, duration: float, workers: int) -> dict[str, dict]:
+    """
+    Returns:
+        Load statistics by scenario name
+    """
+    results = {}
+    command = gunicorn_command(port, workers)
+    with run_server(command, port):
+        # warm up (generates today words)
+        asyncio.run(load(port, STEADY_REQUESTS, 1, 0.5))
+        for name, requests in (
+            ("steady", STEADY_REQUESTS),
+            ("invalid_flood", INVALID_REQUESTS),
+            ("method_flood", METHOD_REQUESTS),
+        ):
+            results[name] = asyncio.run(load(port, requests, concurrency, duration))
+
+    with run_server(command, port):
+        # one request per client (duration 0)
+        results["rollover"] = asyncio.run(
+            load(port, STEADY_REQUESTS, ROLLOVER_BURST, 0)
+        )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=5126)
+    args = parser.parse_args()
+
+    print(
+        f"{'scenario':<14} {'requests':>9} {'req/s':>9} {'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9}  statuses"
+    )
+    for name, r in run(
+        args.port, args.concurrency, args.duration, args.workers
+    ).items():
+        print(
+            f"{name:<14} {r['requests']:>9} {r['rps']:>9} {r['p50_ms']:>9} {r['p99_ms']:>9} {r['max_ms']:>9}  "
+            f"{r['statuses']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
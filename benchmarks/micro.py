@@ -0,0 +1,164 @@
+"""
+Microbenchmarks of attempt processing building blocks.
+
+compute_attempt_result, load_whitelist_file (each whitelist file), get_today_word (daily word cache hit and database
+fetch on a temporary SQLite database) and daily word selection (pick_random_element, previous pick reseeding random
+generator on each call and DeterministicWordSelector) hard mode constraints (compiling 5 previous attempts results and
+checking an attempt) and candidate words queries (CandidateIndex of 8 letters whitelist and linear scan). Reports mean and best time per call over several repeats.
+
+Usage: python -m benchmarks.micro [--repeat 5]
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import timeit
+
+import flask
+
+from wordleapi.core import (
+    AVAILABLE_WORD_LENGTHS,
+    CandidateIndex,
+    DailyWordCache,
+    DeterministicWordSelector,
+    HardModeConstraints,
+    compute_attempt_result,
+    get_today_word,
+    load_whitelist_file,
+)
+from wordleapi.db.model import db
+from wordleapi.log import configure_logging
+from wordleapi.utils import pick_random_element
+
+WHITELIST_DIR = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "..", "whitelist_files"
+)
+
+
+def _whitelist_file(word_length: int) -> str:
+    return os.path.join(WHITELIST_DIR, f"whitelist_{word_length}_fr.txt")
+
+
+def _timeit(callback, number: int, repeat: int) -> dict:
+    """Returns mean and best time per call (in us)"""
+    timings = [
+        t / number * 1e6 for t in timeit.repeat(callback, number=number, repeat=repeat)
+    ]
+    return {
+        "mean_us": round(sum(timings) / len(timings), 3),
+        "best_us": round(min(timings), 3),
+    }
+
+
+def _pick_random_element_reseed(seq):
+    """pick_random_element reseeding global random generator from OS entropy on each call (previous implementation)"""
+    random.seed()
+    return seq[random.randrange(len(seq))]
+
+
+def run(repeat: int = 5) -> dict[str, dict]:
+    """
+    Returns:
+        Timings by benchmark name
+    """
+    # production log level, request logs are disabled
+    configure_logging("WARNING")
+    results = {}
+    whitelists = {
+        word_length: load_whitelist_file(_whitelist_file(word_length))
+        for word_length in AVAILABLE_WORD_LENGTHS
+    }
+
+    for word_length in AVAILABLE_WORD_LENGTHS:
+        results[f"load_whitelist_file[{word_length}]"] = _timeit(
+            lambda word_length=word_length: load_whitelist_file(
+                _whitelist_file(word_length)
+            ),
+            5,
+            repeat,
+        )
+
+    whitelist = whitelists[6]
+    results["compute_attempt_result[incorrect]"] = _timeit(
+        lambda: compute_attempt_result(whitelist[1], whitelist[0]), 20000, repeat
+    )
+    results["compute_attempt_result[correct]"] = _timeit(
+        lambda: compute_attempt_result(whitelist[0], whitelist[0]), 20000, repeat
+    )
+    results["pick_random_element"] = _timeit(
+        lambda: pick_random_element(whitelist), 20000, repeat
+    )
+    results["pick_random_element[reseed]"] = _timeit(
+        lambda: _pick_random_element_reseed(whitelist), 20000, repeat
+    )
+    selector = DeterministicWordSelector("bench")
+    # builds permutation
+    selector.select(whitelist, "20230831")
+    results["deterministic_word_selector"] = _timeit(
+        lambda: selector.select(whitelist, "20230831"), 20000, repeat
+    )
+    previous_results = [
+        (attempt, compute_attempt_result(attempt, whitelist[0]))
+        for attempt in whitelist[1:6]
+    ]
+    results["hard_mode_constraints[compile]"] = _timeit(
+        lambda: HardModeConstraints(6, previous_results), 20000, repeat
+    )
+    constraints = HardModeConstraints(6, previous_results)
+    results["hard_mode_constraints[check]"] = _timeit(
+        lambda: constraints.violation(whitelist[0]), 20000, repeat
+    )
+
+    whitelist = whitelists[8]
+    results["candidate_index[build]"] = _timeit(
+        lambda: CandidateIndex(whitelist), 1, repeat
+    )
+    index = CandidateIndex(whitelist)
+    constraints = HardModeConstraints(
+        8,
+        [
+            (attempt, compute_attempt_result(attempt, whitelist[100]))
+            for attempt in (whitelist[5], whitelist[9000])
+        ],
+    )
+    results["candidate_index[query]"] = _timeit(
+        lambda: index.query(constraints, 0, 20), 1000, repeat
+    )
+    results["candidate_index[linear_scan]"] = _timeit(
+        lambda: [word for word in whitelist if constraints.violation(word) is None],
+        1,
+        repeat,
+    )
+
+    whitelist = whitelists[6]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        app = flask.Flask(__name__)
+        app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmpdir}/bench.db"
+        db.init_app(app)
+        with app.app_context():
+            db.create_all()
+            cache = DailyWordCache()
+            # generates today word
+            get_today_word(whitelist, cache)
+            results["get_today_word[cache_hit]"] = _timeit(
+                lambda: get_today_word(whitelist, cache), 20000, repeat
+            )
+            results["get_today_word[db_fetch]"] = _timeit(
+                lambda: get_today_word(whitelist), 500, repeat
+            )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'benchmark':<36} {'mean (us)':>12} {'best (us)':>12}")
+    for name, r in run(args.repeat).items():
+        print(f"{name:<36} {r['mean_us']:>12.3f} {r['best_us']:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
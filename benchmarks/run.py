@@ -0,0 +1,87 @@
+"""
+Benchmark suite, runs microbenchmarks (benchmarks.micro) and HTTP load scenarios (benchmarks.load) and saves results
+as JSON, with current commit and environment, to compare them between commits (see benchmarks.compare).
+
+Usage: python -m benchmarks.run [--output benchmarks/results/<commit>.json] [--duration 5] [--skip-load]
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+
+from benchmarks import load, micro
+from benchmarks.server import ROOT_DIR
+
+RESULTS_DIR = os.path.join(ROOT_DIR, "benchmarks", "results")
+
+
+def _git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--output", help="results file (default: results dir/<commit>.json)"
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=5)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--port", type=int, default=5126)
+    parser.add_argument(
+        "--skip-load", action="store_true", help="only run microbenchmarks"
+    )
+    args = parser.parse_args()
+
+    commit = _git_commit()
+    results = {
+        "commit": commit,
+        "date": datetime.datetime.now(datetime.UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "parameters": {
+            "repeat": args.repeat,
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "workers": args.workers,
+        },
+    }
+    print("Run microbenchmarks")
+    results["micro"] = micro.run(args.repeat)
+    if not args.skip_load:
+        print("Run load scenarios")
+        results["load"] = load.run(
+            args.port, args.concurrency, args.duration, args.workers
+        )
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(results, f, indent=4)
+    print(f"Results saved to '{output}'")
+
+
+if __name__ == "__main__":
+    main()
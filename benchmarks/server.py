@@ -0,0 +1,176 @@
+"""
+Local API server and HTTP load generation helpers shared by end-to-end benchmarks.
+"""
+
+import asyncio
+import contextlib
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+HOST = "127.0.0.1"
+
+
+def gunicorn_command(port: int, workers: int = 1) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "gunicorn",
+        "--bind",
+        f"{HOST}:{port}",
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "wordleapi.wsgi:app",
+    ]
+
+
+def uvicorn_command(port: int, workers: int = 1) -> list[str]:
+    return [
+        sys.executable,
+        "-m",
+        "uvicorn",
+        "--host",
+        HOST,
+        "--port",
+        str(port),
+        "--workers",
+        str(workers),
+        "--log-level",
+        "warning",
+        "wordleapi.asgi:app",
+    ]
+
+
+def server_env(tmpdir: str, **env_values: str) -> dict[str, str]:
+    """
+    Returns:
+        Server env variables, database is a new SQLite database in tmpdir
+    """
+    env = dict(os.environ)
+    env.update(
+        {
+            "DATABASE_URI": f"sqlite:///{os.path.join(tmpdir, 'bench.db')}",
+            "WHITELIST_FILE_6_LETTERS": "whitelist_files/whitelist_6_fr.txt",
+            "WHITELIST_FILE_7_LETTERS": "whitelist_files/whitelist_7_fr.txt",
+            "WHITELIST_FILE_8_LETTERS": "whitelist_files/whitelist_8_fr.txt",
+            "LOGURU_LEVEL": "WARNING",
+            "LOG_LEVEL": "WARNING",
+        }
+    )
+    env.update(env_values)
+    return env
+
+
+@contextlib.contextmanager
+def run_server(command: list[str], port: int, stderr=None, **env_values: str):
+    """
+    Start server on a new SQLite database and wait until it responds.
+
+    Args:
+        command: server command (see gunicorn_command and uvicorn_command)
+        port: server port
+        stderr: server stderr (inherited if None)
+        env_values: additional server env variables
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        server = subprocess.Popen(
+            command, cwd=ROOT_DIR, env=server_env(tmpdir, **env_values), stderr=stderr
+        )
+        try:
+            _wait_for_server(port)
+            yield server
+        finally:
+            server.terminate()
+            server.wait()
+
+
+def _wait_for_server(port: int, timeout: float = 30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            asyncio.run(load(port, [("POST", "/attempt", b"{}")], 1, 0.1))
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise TimeoutError(f"server did not start on port {port}")
+
+
+async def _request(reader, writer, method: str, path: str, body: bytes):
+    """Send request, returns (status code, True if server kept connection alive)"""
+    writer.write(
+        b"%s %s HTTP/1.1\r\nHost: bench\r\nContent-Type: application/json\r\n"
+        b"Content-Length: %d\r\n\r\n%s"
+        % (method.encode(), path.encode(), len(body), body)
+    )
+    await writer.drain()
+    headers = (await reader.readuntil(b"\r\n\r\n")).lower()
+    status = int(headers.split(b" ", 2)[1])
+    content_length = int(headers.split(b"content-length:")[1].split(b"\r\n")[0])
+    await reader.readexactly(content_length)
+    return status, b"connection: close" not in headers
+
+
+async def _client(port: int, requests: list, deadline: float, latencies, statuses):
+    reader = writer = None
+    i = 0
+    while True:
+        if writer is None:
+            reader, writer = await asyncio.open_connection(HOST, port)
+        start = time.perf_counter()
+        status, keep_alive = await _request(
+            reader, writer, *requests[i % len(requests)]
+        )
+        latencies.append(time.perf_counter() - start)
+        statuses[status] += 1
+        i += 1
+        if not keep_alive:
+            writer.close()
+            reader = writer = None
+        if time.perf_counter() >= deadline:
+            break
+    if writer is not None:
+        writer.close()
+
+
+def _stats(latencies: list[float], statuses: Counter, duration: float) -> dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": round(statistics.median(latencies) * 1e3, 2),
+        "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1e3, 2),
+        "max_ms": round(latencies[-1] * 1e3, 2),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+    }
+
+
+async def load(port: int, requests: list, concurrency: int, duration: float) -> dict:
+    """
+    Keep concurrent clients sending requests (each client sends at least one request).
+
+    Args:
+        port: server port
+        requests: (method, path, body) requests sent in turn by each client
+        concurrency: number of clients
+        duration: load duration (in seconds)
+
+    Returns:
+        Throughput, latency percentiles and response count by status code
+    """
+    latencies = []
+    statuses = Counter()
+    start = time.perf_counter()
+    await asyncio.gather(
+        *(
+            _client(port, requests, start + duration, latencies, statuses)
+            for _ in range(concurrency)
+        )
+    )
+    return _stats(latencies, statuses, time.perf_counter() - start)
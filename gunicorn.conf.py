@@ -0,0 +1,25 @@
+"""
+Gunicorn configuration (loaded from working directory by default).
+
+Prometheus multiprocess mode: when PROMETHEUS_MULTIPROC_DIR env variable is set, workers write their metrics to this
+directory and /metrics aggregates them (see wordleapi/metrics.py). Metrics files of a previous run are removed when
+gunicorn starts.
+"""
+
+import glob
+import os
+
+from prometheus_client import multiprocess
+
+
+def on_starting(server):
+    multiproc_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if multiproc_dir:
+        os.makedirs(multiproc_dir, exist_ok=True)
+        for filename in glob.glob(os.path.join(multiproc_dir, "*.db")):
+            os.remove(filename)
+
+
+def child_exit(server, worker):
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(worker.pid)
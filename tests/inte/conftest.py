@@ -0,0 +1,79 @@
+import os
+
+import flask
+import pytest
+
+from wordleapi.api import create_app
+from wordleapi.core import load_whitelist
+from wordleapi.db.model import add_played_word, commit, db
+from wordleapi.env import DotEnvKey
+
+
+@pytest.fixture()
+def whitelist_6() -> tuple[str]:
+    assert os.getenv(DotEnvKey.WHITELIST_FILE_6_LETTERS.value)
+    return load_whitelist(os.getenv(DotEnvKey.WHITELIST_FILE_6_LETTERS.value))
+
+
+@pytest.fixture()
+def whitelist_7() -> tuple[str]:
+    assert os.getenv(DotEnvKey.WHITELIST_FILE_7_LETTERS.value)
+    return load_whitelist(os.getenv(DotEnvKey.WHITELIST_FILE_7_LETTERS.value))
+
+
+@pytest.fixture()
+def whitelist_8() -> tuple[str]:
+    assert os.getenv(DotEnvKey.WHITELIST_FILE_8_LETTERS.value)
+    return load_whitelist(os.getenv(DotEnvKey.WHITELIST_FILE_8_LETTERS.value))
+
+
+@pytest.fixture()
+def correct_word_6(whitelist_6) -> str:
+    return whitelist_6[0]
+
+
+@pytest.fixture()
+def correct_word_7(whitelist_7) -> str:
+    return whitelist_7[0]
+
+
+@pytest.fixture()
+def correct_word_8(whitelist_8) -> str:
+    return whitelist_8[0]
+
+
+@pytest.fixture()
+def incorrect_word_6(whitelist_6) -> str:
+    return whitelist_6[1]
+
+
+@pytest.fixture()
+def incorrect_word_7(whitelist_7) -> str:
+    return whitelist_7[1]
+
+
+@pytest.fixture()
+def incorrect_word_8(whitelist_8) -> str:
+    return whitelist_8[1]
+
+
+@pytest.fixture()
+def app() -> flask.Flask:
+    app = create_app()
+    app.testing = True
+    yield app
+
+
+@pytest.fixture()
+def test_client(
+    app: flask.Flask, correct_word_6: str, correct_word_7: str, correct_word_8: str
+):
+    # init database
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        add_played_word(correct_word_6, 6)
+        add_played_word(correct_word_7, 7)
+        add_played_word(correct_word_8, 8)
+        commit()
+    yield app.test_client()
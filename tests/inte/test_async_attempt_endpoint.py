@@ -0,0 +1,187 @@
+import asyncio
+import json
+import threading
+from unittest.mock import Mock, patch
+
+import flask
+import pytest
+from flask.testing import FlaskClient
+
+from wordleapi.async_api import create_async_app
+from wordleapi.core import AVAILABLE_WORD_LENGTHS, get_today_word
+from wordleapi.schemas import ErrorCode
+
+
+def _request(app, method: str, path: str, body: bytes = b"") -> tuple[int, dict, dict]:
+    """Send request to ASGI app, returns response status code, headers and JSON data"""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+        ],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+    asyncio.run(app(scope, receive, send))
+    start = next(m for m in messages if m["type"] == "http.response.start")
+    data = b"".join(
+        m.get("body", b"") for m in messages if m["type"] == "http.response.body"
+    )
+    return start["status"], dict(start["headers"]), json.loads(data)
+
+
+@pytest.fixture()
+def async_app(app: flask.Flask, test_client: FlaskClient):
+    # test_client fixture initializes database
+    yield create_async_app(app)
+
+
+def test__when_attempt_is_correct__returns_http_200(
+    async_app, correct_word_6, correct_word_7, correct_word_8
+):
+    for attempt in (correct_word_6, correct_word_7, correct_word_8):
+        status_code, headers, data = _request(
+            async_app, "POST", "/attempt", json.dumps({"attempt": attempt}).encode()
+        )
+
+        assert status_code == 200
+        assert headers[b"content-type"] == b"application/json"
+        assert data == {"result": [0] * len(attempt)}
+
+
+def test__when_attempt_is_incorrect__returns_http_200(async_app, incorrect_word_6):
+    status_code, _, data = _request(
+        async_app,
+        "POST",
+        "/attempt",
+        json.dumps({"attempt": incorrect_word_6.upper()}).encode(),
+    )
+
+    assert status_code == 200
+    assert len(data.get("result")) == len(incorrect_word_6)
+    assert data.get("result") != [0] * len(incorrect_word_6)
+
+
+def test__when_today_word_is_cached__does_not_resolve_it_again(
+    async_app, correct_word_6
+):
+    body = json.dumps({"attempt": correct_word_6}).encode()
+    _request(async_app, "POST", "/attempt", body)
+    with patch("wordleapi.processor.get_today_word", wraps=get_today_word) as mock:
+        status_code, _, _ = _request(async_app, "POST", "/attempt", body)
+
+    assert status_code == 200
+    mock.assert_not_called()
+
+
+def test__when_feedback_table_is_not_built__builds_it_out_of_event_loop(
+    app: flask.Flask, async_app, correct_word_6
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    body = json.dumps({"attempt": correct_word_6}).encode()
+    # today word is cached, its feedback table is not built yet
+    _request(async_app, "POST", "/attempt", body)
+    attempt_processor.precomputed_feedback = True
+    build_threads = []
+    build_feedback_table = attempt_processor._build_feedback_table
+
+    def record_build_thread(*args):
+        build_threads.append(threading.current_thread())
+        return build_feedback_table(*args)
+
+    with patch.object(
+        attempt_processor, "_build_feedback_table", side_effect=record_build_thread
+    ):
+        status_code, _, data = _request(async_app, "POST", "/attempt", body)
+
+    assert status_code == 200
+    assert data == {"result": [0] * 6}
+    assert len(build_threads) == 1
+    assert build_threads[0] is not threading.main_thread()
+
+
+def test__when_today_word_is_cached__records_it_as_played(
+    app: flask.Flask, async_app, correct_word_6
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    body = json.dumps({"attempt": correct_word_6}).encode()
+    _request(async_app, "POST", "/attempt", body)
+    attempt_processor.played_word_recorder = Mock()
+
+    status_code, _, _ = _request(async_app, "POST", "/attempt", body)
+
+    assert status_code == 200
+    attempt_processor.played_word_recorder.record.assert_called_once_with(
+        correct_word_6
+    )
+
+
+@pytest.mark.parametrize(
+    "body,error_msg",
+    (
+        (
+            {"attempt": "azert"},
+            f"Field 'attempt' is invalid or missing (String should have at least {min(AVAILABLE_WORD_LENGTHS)} characters)",
+        ),
+        ({}, "Field 'attempt' is invalid or missing (Field required)"),
+        (None, "Field 'attempt' is invalid or missing (Field required)"),
+    ),
+)
+def test__when_attempt_is_invalid__returns_http_422(
+    async_app, body: dict | None, error_msg: str
+):
+    status_code, _, data = _request(
+        async_app,
+        "POST",
+        "/attempt",
+        b"" if body is None else json.dumps(body).encode(),
+    )
+
+    assert status_code == 422
+    assert data == {"code": ErrorCode.INVALID_PAYLOAD.value, "error_msg": error_msg}
+
+
+def test__when_attempt_not_in_whitelist__returns_http_422(async_app):
+    status_code, _, data = _request(
+        async_app, "POST", "/attempt", json.dumps({"attempt": "abcdef"}).encode()
+    )
+
+    assert status_code == 422
+    assert data == {
+        "code": ErrorCode.ATTEMPT_NOT_IN_WHITELIST.value,
+        "error_msg": "'abcdef' is not in whitelist",
+    }
+
+
+def test__other_routes__are_served_by_flask_app(async_app, correct_word_6):
+    status_code, _, data = _request(async_app, "GET", "/attempt")
+
+    assert status_code == 405
+    assert data.get("code") == ErrorCode.METHOD_NOT_ALLOWED.value
+
+    status_code, _, data = _request(
+        async_app,
+        "POST",
+        "/attempts",
+        json.dumps({"attempts": [correct_word_6]}).encode(),
+    )
+
+    assert status_code == 200
+    assert data == {"results": [{"result": [0] * 6}]}
@@ -0,0 +1,44 @@
+import json
+
+import flask
+import pytest
+from flask.testing import FlaskClient
+
+from wordleapi.api import create_app
+from wordleapi.core import DeterministicWordSelector
+from wordleapi.utils import now_yyyymmdd
+
+
+@pytest.fixture()
+def app(monkeypatch) -> flask.Flask:
+    monkeypatch.setenv("WORD_SELECTION", "deterministic")
+    monkeypatch.setenv("WORD_SELECTION_SECRET", "secret")
+    app = create_app()
+    app.testing = True
+    yield app
+
+
+def test__when_attempt_is_selected_word__returns_http_200(
+    test_client: FlaskClient, whitelist_7: tuple[str]
+):
+    word = DeterministicWordSelector("secret").select(whitelist_7, now_yyyymmdd())
+
+    resp = test_client.post(path="/attempt", json={"attempt": word})
+
+    assert resp.status_code == 200
+    assert json.loads(resp.data) == {"result": [0] * 7}
+
+
+def test__when_secret_is_missing__app_is_not_created(monkeypatch):
+    monkeypatch.setenv("WORD_SELECTION", "deterministic")
+    monkeypatch.delenv("WORD_SELECTION_SECRET", raising=False)
+
+    assert create_app() is None
+
+
+def test__when_whitelist_reload_is_enabled__app_is_not_created(monkeypatch):
+    monkeypatch.setenv("WORD_SELECTION", "deterministic")
+    monkeypatch.setenv("WORD_SELECTION_SECRET", "secret")
+    monkeypatch.setenv("WHITELIST_RELOAD_INTERVAL", "10")
+
+    assert create_app() is None
@@ -0,0 +1,75 @@
+import json
+
+import flask
+import pytest
+from flask.testing import FlaskClient
+
+from wordleapi.api import create_app
+from wordleapi.schemas import ErrorCode
+
+
+@pytest.fixture()
+def app(monkeypatch) -> flask.Flask:
+    monkeypatch.setenv("FAST_VALIDATION", "true")
+    app = create_app()
+    app.testing = True
+    yield app
+
+
+def test__when_attempt_is_correct__returns_http_200(
+    test_client: FlaskClient, correct_word_6: str
+):
+    resp = test_client.post(path="/attempt", json={"attempt": correct_word_6})
+
+    assert resp.status_code == 200
+    assert json.loads(resp.data) == {"result": [0] * 6}
+
+
+@pytest.mark.parametrize(
+    "body,error_msg",
+    (
+        ({"attempt": "azert"}, "String should have at least 6 characters"),
+        ({"attempt": "azertyuio"}, "String should have at most 8 characters"),
+        ({"attempt": "azerty1"}, "String should match pattern '^[a-zA-Z]+$'"),
+        ({"attempt": 123456}, "Input should be a valid string"),
+        ({}, "Field required"),
+    ),
+)
+def test__when_attempt_is_invalid__returns_http_422(
+    test_client: FlaskClient, body: dict, error_msg: str
+):
+    resp = test_client.post(path="/attempt", json=body)
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.INVALID_PAYLOAD.value,
+        "error_msg": f"Field 'attempt' is invalid or missing ({error_msg})",
+    }
+
+
+def test__when_body_is_empty__returns_http_422(test_client: FlaskClient):
+    resp = test_client.post(path="/attempt")
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.INVALID_PAYLOAD.value,
+        "error_msg": "Field 'attempt' is invalid or missing (Field required)",
+    }
+
+
+def test__when_attempt_not_in_whitelist__returns_http_422(test_client: FlaskClient):
+    resp = test_client.post(path="/attempt", json={"attempt": "ABCDEF"})
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.ATTEMPT_NOT_IN_WHITELIST.value,
+        "error_msg": "'ABCDEF' is not in whitelist",
+    }
+
+
+def test__openapi_spec__documents_attempt_request_body(test_client: FlaskClient):
+    resp = test_client.get(path="/openapi/openapi.json")
+
+    assert resp.status_code == 200
+    request_body = json.loads(resp.data)["paths"]["/attempt"]["post"]["requestBody"]
+    assert "AttemptRequest" in json.dumps(request_body)
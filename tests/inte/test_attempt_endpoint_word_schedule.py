@@ -0,0 +1,62 @@
+import json
+import os
+
+import dotenv
+import flask
+import pytest
+from flask.testing import FlaskClient
+
+from wordleapi.api import create_app
+from wordleapi.core import load_whitelist, write_word_schedule
+from wordleapi.utils import now_yyyymmdd
+
+
+@pytest.fixture()
+def app(monkeypatch, tmp_path) -> flask.Flask:
+    # scheduled word differs from today word stored in database
+    dotenv.load_dotenv()
+    incorrect_word_6 = load_whitelist(os.getenv("WHITELIST_FILE_6_LETTERS"))[1]
+    schedule_file = str(tmp_path / "schedule.json")
+    write_word_schedule(
+        schedule_file, {6: {now_yyyymmdd(): incorrect_word_6}}, "secret"
+    )
+    monkeypatch.setenv("WORD_SELECTION", "schedule")
+    monkeypatch.setenv("WORD_SELECTION_SECRET", "secret")
+    monkeypatch.setenv("WORD_SCHEDULE_FILE", schedule_file)
+    app = create_app()
+    app.testing = True
+    yield app
+
+
+def test__when_attempt_is_scheduled_word__returns_http_200(
+    test_client: FlaskClient, incorrect_word_6: str
+):
+    resp = test_client.post(path="/attempt", json={"attempt": incorrect_word_6})
+
+    assert resp.status_code == 200
+    assert json.loads(resp.data) == {"result": [0] * 6}
+
+
+def test__when_no_word_is_scheduled__falls_back_to_database(
+    test_client: FlaskClient, correct_word_7: str
+):
+    resp = test_client.post(path="/attempt", json={"attempt": correct_word_7})
+
+    assert resp.status_code == 200
+    assert json.loads(resp.data) == {"result": [0] * 7}
+
+
+@pytest.mark.parametrize(
+    "secret,words",
+    (("other secret", None), ("secret", {6: {"20230831": "zzzzzz"}})),
+)
+def test__when_schedule_is_invalid__app_is_not_created(
+    monkeypatch, tmp_path, secret: str, words: dict | None
+):
+    schedule_file = str(tmp_path / "schedule.json")
+    write_word_schedule(schedule_file, words or {6: {}}, "secret")
+    monkeypatch.setenv("WORD_SELECTION", "schedule")
+    monkeypatch.setenv("WORD_SELECTION_SECRET", secret)
+    monkeypatch.setenv("WORD_SCHEDULE_FILE", schedule_file)
+
+    assert create_app() is None
@@ -0,0 +1,114 @@
+import json
+from unittest.mock import patch
+
+from flask.testing import FlaskClient
+
+from wordleapi.core import AVAILABLE_WORD_LENGTHS, get_today_word
+from wordleapi.schemas import MAX_BATCH_ATTEMPTS, ErrorCode
+
+
+def test__when_attempts_are_valid__returns_http_200(
+    test_client: FlaskClient,
+    correct_word_6,
+    correct_word_7,
+    correct_word_8,
+    incorrect_word_6,
+):
+    attempts = [correct_word_6, correct_word_7, correct_word_8, incorrect_word_6]
+    resp = test_client.post(path="/attempts", json={"attempts": attempts})
+    resp_json_data = json.loads(resp.data)
+
+    assert resp.status_code == 200
+    results = resp_json_data.get("results")
+    assert len(results) == len(attempts)
+    assert results[0] == {"result": [0] * 6}
+    assert results[1] == {"result": [0] * 7}
+    assert results[2] == {"result": [0] * 8}
+    assert len(results[3].get("result")) == 6
+    assert results[3].get("result") != [0] * 6
+
+
+def test__when_some_attempts_are_invalid__returns_per_attempt_errors(
+    test_client: FlaskClient, correct_word_6
+):
+    attempts = ["azert", "abcdef", correct_word_6.upper()]
+    resp = test_client.post(path="/attempts", json={"attempts": attempts})
+    resp_json_data = json.loads(resp.data)
+
+    assert resp.status_code == 200
+    assert resp_json_data == {
+        "results": [
+            {
+                "code": ErrorCode.INVALID_PAYLOAD.value,
+                "error_msg": f"Field 'attempt' is invalid or missing (String should have at least {min(AVAILABLE_WORD_LENGTHS)} characters)",
+            },
+            {
+                "code": ErrorCode.ATTEMPT_NOT_IN_WHITELIST.value,
+                "error_msg": "'abcdef' is not in whitelist",
+            },
+            {"result": [0] * 6},
+        ]
+    }
+
+
+def test__when_some_attempts_are_not_strings__returns_per_attempt_errors(
+    test_client: FlaskClient, correct_word_6
+):
+    attempts = [123456, None, correct_word_6]
+    resp = test_client.post(path="/attempts", json={"attempts": attempts})
+    resp_json_data = json.loads(resp.data)
+
+    assert resp.status_code == 200
+    assert resp_json_data == {
+        "results": [
+            {
+                "code": ErrorCode.INVALID_PAYLOAD.value,
+                "error_msg": "Field 'attempt' is invalid or missing (Input should be a valid string)",
+            },
+            {
+                "code": ErrorCode.INVALID_PAYLOAD.value,
+                "error_msg": "Field 'attempt' is invalid or missing (Input should be a valid string)",
+            },
+            {"result": [0] * 6},
+        ]
+    }
+
+
+def test__when_attempts_have_same_length__resolves_today_word_once(
+    test_client: FlaskClient, correct_word_6, incorrect_word_6
+):
+    attempts = [incorrect_word_6, correct_word_6, incorrect_word_6]
+    with patch("wordleapi.processor.get_today_word", wraps=get_today_word) as mock:
+        resp = test_client.post(path="/attempts", json={"attempts": attempts})
+
+    assert resp.status_code == 200
+    mock.assert_called_once()
+
+
+def test__when_attempts_is_empty__returns_http_422(test_client: FlaskClient):
+    resp = test_client.post(path="/attempts", json={"attempts": []})
+    resp_json_data = json.loads(resp.data)
+
+    assert resp.status_code == 422
+    assert resp_json_data.get("code") == ErrorCode.INVALID_PAYLOAD.value
+
+
+def test__when_too_many_attempts__returns_http_422(
+    test_client: FlaskClient, correct_word_6
+):
+    attempts = [correct_word_6] * (MAX_BATCH_ATTEMPTS + 1)
+    resp = test_client.post(path="/attempts", json={"attempts": attempts})
+    resp_json_data = json.loads(resp.data)
+
+    assert resp.status_code == 422
+    assert resp_json_data.get("code") == ErrorCode.INVALID_PAYLOAD.value
+
+
+def test__when_http_method_is_not_allowed__returns_http_405(
+    test_client: FlaskClient,
+):
+    resp = test_client.get(path="/attempts")
+    resp_json_data = json.loads(resp.data)
+
+    assert resp.status_code == 405
+    assert resp_json_data.get("code") == ErrorCode.METHOD_NOT_ALLOWED.value
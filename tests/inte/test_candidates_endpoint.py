@@ -0,0 +1,107 @@
+import json
+
+import flask
+from flask.testing import FlaskClient
+
+from wordleapi.core import HardModeConstraints, compute_attempt_result
+from wordleapi.schemas import MAX_CANDIDATES_LIMIT, ErrorCode
+
+
+def test__when_there_is_no_previous_attempt__returns_whole_whitelist_count(
+    test_client: FlaskClient, whitelist_6
+):
+    resp = test_client.post(
+        path="/candidates", json={"word_length": 6, "previous_attempts": []}
+    )
+
+    assert resp.status_code == 200
+    assert json.loads(resp.data) == {"count": len(whitelist_6), "words": []}
+
+
+def test__returns_words_consistent_with_previous_attempts(
+    test_client: FlaskClient, whitelist_6, correct_word_6, incorrect_word_6
+):
+    constraints = HardModeConstraints(
+        6,
+        [(incorrect_word_6, compute_attempt_result(incorrect_word_6, correct_word_6))],
+    )
+    expected = [word for word in whitelist_6 if constraints.violation(word) is None]
+
+    resp = test_client.post(
+        path="/candidates",
+        json={
+            "word_length": 6,
+            "previous_attempts": [incorrect_word_6.upper()],
+            "offset": 1,
+            "limit": 3,
+        },
+    )
+
+    assert resp.status_code == 200
+    assert correct_word_6 in expected
+    assert json.loads(resp.data) == {"count": len(expected), "words": expected[1:4]}
+
+
+def test__after_whitelists_reload__returns_new_words(
+    app: flask.Flask, test_client: FlaskClient, tmp_path, whitelist_6
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    body = {"word_length": 6, "previous_attempts": []}
+    assert test_client.post(path="/candidates", json=body).json["count"] == len(
+        whitelist_6
+    )
+    whitelist_files = {}
+    for word_length, whitelist in attempt_processor.whitelists_by_word_length.items():
+        filename = tmp_path / f"whitelist_{word_length}.txt"
+        filename.write_text(
+            "\n".join(whitelist) + ("\nzzzzzz" if word_length == 6 else "")
+        )
+        whitelist_files[word_length] = str(filename)
+
+    with app.app_context():
+        attempt_processor.reload_whitelists(whitelist_files)
+
+    assert test_client.post(path="/candidates", json=body).json["count"] == (
+        len(whitelist_6) + 1
+    )
+
+
+def test__when_previous_attempt_has_another_length__returns_http_422(
+    test_client: FlaskClient, correct_word_7
+):
+    resp = test_client.post(
+        path="/candidates",
+        json={"word_length": 6, "previous_attempts": [correct_word_7]},
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.INVALID_PAYLOAD.value,
+        "error_msg": "Field 'previous_attempts' is invalid or missing "
+        "(Value error, Previous attempts should have word length)",
+    }
+
+
+def test__when_limit_is_too_high__returns_http_422(test_client: FlaskClient):
+    resp = test_client.post(
+        path="/candidates",
+        json={
+            "word_length": 6,
+            "previous_attempts": [],
+            "limit": MAX_CANDIDATES_LIMIT + 1,
+        },
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data).get("code") == ErrorCode.INVALID_PAYLOAD.value
+
+
+def test__when_word_length_is_not_available__returns_http_422(
+    test_client: FlaskClient,
+):
+    resp = test_client.post(
+        path="/candidates", json={"word_length": 5, "previous_attempts": []}
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data).get("code") == ErrorCode.INVALID_PAYLOAD.value
@@ -0,0 +1,99 @@
+import json
+
+from flask.testing import FlaskClient
+
+from wordleapi.schemas import MAX_PREVIOUS_ATTEMPTS, ErrorCode
+
+
+def test__when_attempt_satisfies_hard_mode__returns_http_200(
+    test_client: FlaskClient, correct_word_6, incorrect_word_6
+):
+    resp = test_client.post(
+        path="/hard-attempt",
+        json={"attempt": correct_word_6, "previous_attempts": [incorrect_word_6]},
+    )
+
+    assert resp.status_code == 200
+    assert json.loads(resp.data) == {"result": [0] * 6}
+
+
+def test__when_there_is_no_previous_attempt__returns_http_200(
+    test_client: FlaskClient, incorrect_word_6
+):
+    resp = test_client.post(
+        path="/hard-attempt",
+        json={"attempt": incorrect_word_6, "previous_attempts": []},
+    )
+
+    assert resp.status_code == 200
+    assert len(json.loads(resp.data).get("result")) == 6
+
+
+def test__when_attempt_violates_hard_mode__returns_http_422(
+    test_client: FlaskClient, correct_word_6, incorrect_word_6
+):
+    # today word starts with 'ab' and so does incorrect word, 'arbres' does not reuse well-placed 'b'
+    assert correct_word_6[:2] == incorrect_word_6[:2] == "ab"
+    resp = test_client.post(
+        path="/hard-attempt",
+        json={"attempt": "ARBRES", "previous_attempts": [incorrect_word_6.upper()]},
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.ATTEMPT_VIOLATES_HARD_MODE.value,
+        "error_msg": "'ARBRES' violates hard mode (letter 2 must be 'b')",
+    }
+
+
+def test__when_attempt_is_not_in_whitelist__returns_http_422(
+    test_client: FlaskClient, incorrect_word_6
+):
+    resp = test_client.post(
+        path="/hard-attempt",
+        json={"attempt": "abcdef", "previous_attempts": [incorrect_word_6]},
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.ATTEMPT_NOT_IN_WHITELIST.value,
+        "error_msg": "'abcdef' is not in whitelist",
+    }
+
+
+def test__when_previous_attempt_has_another_length__returns_http_422(
+    test_client: FlaskClient, correct_word_6, correct_word_7
+):
+    resp = test_client.post(
+        path="/hard-attempt",
+        json={"attempt": correct_word_6, "previous_attempts": [correct_word_7]},
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data) == {
+        "code": ErrorCode.INVALID_PAYLOAD.value,
+        "error_msg": "Field 'previous_attempts' is invalid or missing "
+        "(Value error, Previous attempts should have the same length as attempt)",
+    }
+
+
+def test__when_too_many_previous_attempts__returns_http_422(
+    test_client: FlaskClient, correct_word_6, incorrect_word_6
+):
+    resp = test_client.post(
+        path="/hard-attempt",
+        json={
+            "attempt": correct_word_6,
+            "previous_attempts": [incorrect_word_6] * (MAX_PREVIOUS_ATTEMPTS + 1),
+        },
+    )
+
+    assert resp.status_code == 422
+    assert json.loads(resp.data).get("code") == ErrorCode.INVALID_PAYLOAD.value
+
+
+def test__when_method_is_not_post__returns_http_405(test_client: FlaskClient):
+    resp = test_client.get(path="/hard-attempt")
+
+    assert resp.status_code == 405
+    assert json.loads(resp.data).get("code") == ErrorCode.METHOD_NOT_ALLOWED.value
@@ -0,0 +1,68 @@
+import prometheus_client
+from flask.testing import FlaskClient
+
+
+def _sample(name: str, **labels) -> float:
+    return prometheus_client.REGISTRY.get_sample_value(name, labels) or 0
+
+
+def test__metrics__returns_prometheus_metrics(test_client: FlaskClient):
+    resp = test_client.get("/metrics")
+
+    assert resp.status_code == 200
+    assert resp.content_type.startswith("text/plain")
+    assert b"wordleapi_request_duration_seconds" in resp.data
+    assert b"wordleapi_stage_duration_seconds" in resp.data
+
+
+def test__when_attempt_is_processed__updates_metrics(
+    test_client: FlaskClient, correct_word_6: str
+):
+    requests = _sample("wordleapi_requests_total", endpoint="/attempt", status="200")
+    attempts = _sample("wordleapi_attempts_total", word_length="6", code="ok")
+    not_whitelisted = _sample(
+        "wordleapi_attempts_total", word_length="6", code="ATTEMPT_NOT_IN_WHITELIST"
+    )
+    invalid = _sample(
+        "wordleapi_attempts_total", word_length="", code="INVALID_PAYLOAD"
+    )
+    stages = {
+        stage: _sample("wordleapi_stage_duration_seconds_count", stage=stage)
+        for stage in (
+            "validation",
+            "whitelist_lookup",
+            "today_word_db_fetch",
+            "attempt_result",
+            "serialization",
+        )
+    }
+    select_queries = _sample("wordleapi_db_queries_total", statement="select")
+
+    test_client.post(path="/attempt", json={"attempt": correct_word_6})
+    test_client.post(path="/attempt", json={"attempt": "abcdef"})
+    test_client.post(path="/attempt", json={"attempt": "abc"})
+
+    assert (
+        _sample("wordleapi_requests_total", endpoint="/attempt", status="200")
+        == requests + 1
+    )
+    assert (
+        _sample("wordleapi_attempts_total", word_length="6", code="ok") == attempts + 1
+    )
+    assert (
+        _sample(
+            "wordleapi_attempts_total",
+            word_length="6",
+            code="ATTEMPT_NOT_IN_WHITELIST",
+        )
+        == not_whitelisted + 1
+    )
+    assert (
+        _sample("wordleapi_attempts_total", word_length="", code="INVALID_PAYLOAD")
+        == invalid + 1
+    )
+    for stage, count in stages.items():
+        assert _sample("wordleapi_stage_duration_seconds_count", stage=stage) > count, (
+            stage
+        )
+    assert _sample("wordleapi_db_queries_total", statement="select") > select_queries
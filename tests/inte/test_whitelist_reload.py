@@ -0,0 +1,132 @@
+import os
+import time
+from unittest.mock import patch
+
+import flask
+import pytest
+import sqlalchemy as sa
+from flask.testing import FlaskClient
+
+from wordleapi.api import create_app
+from wordleapi.processor import WhitelistWatcher
+
+
+@pytest.fixture(params=("false", "true"), ids=("computed", "precomputed_feedback"))
+def app(request, monkeypatch) -> flask.Flask:
+    monkeypatch.setenv("PRECOMPUTED_FEEDBACK", request.param)
+    app = create_app()
+    app.testing = True
+    yield app
+
+
+@pytest.fixture()
+def whitelist_files(tmp_path, whitelist_6, whitelist_7, whitelist_8) -> dict[int, str]:
+    whitelist_files = {}
+    for word_length, whitelist in (
+        (6, whitelist_6),
+        (7, whitelist_7),
+        (8, whitelist_8),
+    ):
+        filename = tmp_path / f"whitelist_{word_length}.txt"
+        filename.write_text("\n".join(whitelist))
+        whitelist_files[word_length] = str(filename)
+    return whitelist_files
+
+
+def _add_word(filename: str, word: str):
+    """Replace whitelist file atomically with a file containing word"""
+    with open(filename) as f:
+        words = f.read()
+    with open(filename + ".tmp", "w") as f:
+        f.write(f"{words}\n{word}")
+    os.replace(filename + ".tmp", filename)
+
+
+def test_reload_whitelists__new_words_are_playable(
+    app: flask.Flask,
+    test_client: FlaskClient,
+    whitelist_files: dict[int, str],
+    correct_word_6: str,
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    assert test_client.post("/attempt", json={"attempt": "zzzzzz"}).status_code == 422
+    _add_word(whitelist_files[6], "zzzzzz")
+
+    with app.app_context():
+        report = attempt_processor.reload_whitelists(whitelist_files)
+
+    assert report["duration"] > 0
+    assert report["nbytes_after"] > 0
+    assert "zzzzzz" in attempt_processor.whitelists_by_word_length[6]
+    resp = test_client.post("/attempt", json={"attempt": "zzzzzz"})
+    assert resp.status_code == 200
+    resp = test_client.post("/attempt", json={"attempt": correct_word_6})
+    assert resp.json == {"result": [0] * 6}
+
+
+def test_reload_whitelists__when_file_is_invalid__keeps_previous_whitelists(
+    app: flask.Flask, whitelist_files: dict[int, str]
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    whitelists_by_word_length = attempt_processor.whitelists_by_word_length
+    with open(whitelist_files[7], "w") as f:
+        f.write("abacas\n")
+
+    with pytest.raises(ValueError), app.app_context():
+        attempt_processor.reload_whitelists(whitelist_files)
+
+    assert attempt_processor.whitelists_by_word_length is whitelists_by_word_length
+
+
+def _wait_for_word(attempt_processor, word: str):
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        if word in attempt_processor.whitelists_by_word_length[len(word)]:
+            return
+        time.sleep(0.01)
+
+
+def test_whitelist_watcher__reloads_modified_whitelist_files(
+    app: flask.Flask, test_client: FlaskClient, whitelist_files: dict[int, str]
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    with app.app_context():
+        attempt_processor.reload_whitelists(whitelist_files)
+    watcher = WhitelistWatcher(app, attempt_processor, whitelist_files, 0.01)
+    watcher.ensure_started()
+
+    _add_word(whitelist_files[8], "zzzzzzzz")
+
+    _wait_for_word(attempt_processor, "zzzzzzzz")
+    watcher.stop()
+    assert "zzzzzzzz" in attempt_processor.whitelists_by_word_length[8]
+
+
+def test_whitelist_watcher__when_db_fails__keeps_watching(
+    app: flask.Flask, whitelist_files: dict[int, str]
+):
+    attempt_processor = app.extensions["attempt_processor"]
+    with app.app_context():
+        attempt_processor.reload_whitelists(whitelist_files)
+    reload_whitelists = attempt_processor.reload_whitelists
+    calls = []
+
+    def fail_once(files):
+        calls.append(files)
+        if len(calls) == 1:
+            raise sa.exc.OperationalError("SELECT", {}, Exception("database is locked"))
+        return reload_whitelists(files)
+
+    watcher = WhitelistWatcher(app, attempt_processor, whitelist_files, 0.01)
+    with patch.object(attempt_processor, "reload_whitelists", side_effect=fail_once):
+        watcher.ensure_started()
+        _add_word(whitelist_files[8], "zzzzzzzz")
+        deadline = time.time() + 5
+        while not calls and time.time() < deadline:
+            time.sleep(0.01)
+        _add_word(whitelist_files[8], "yyyyyyyy")
+        _wait_for_word(attempt_processor, "yyyyyyyy")
+    watcher.stop()
+
+    assert len(calls) >= 2
+    assert "yyyyyyyy" in attempt_processor.whitelists_by_word_length[8]
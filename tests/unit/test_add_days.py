@@ -0,0 +1,18 @@
+import pytest
+
+from wordleapi.utils import add_days
+
+
+@pytest.mark.parametrize(
+    "yyyymmdd,days,expected",
+    (
+        ("19870830", 0, "19870830"),
+        ("19870830", 1, "19870831"),
+        ("19870831", 1, "19870901"),
+        ("19871231", 1, "19880101"),
+        ("19880228", 1, "19880229"),
+        ("19870901", -1, "19870831"),
+    ),
+)
+def test_add_days__success(yyyymmdd: str, days: int, expected: str):
+    assert add_days(yyyymmdd, days) == expected
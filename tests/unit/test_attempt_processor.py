@@ -0,0 +1,106 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from wordleapi.core import (
+    CandidateIndex,
+    DeterministicWordSelector,
+    FeedbackTable,
+    Whitelist,
+)
+from wordleapi.processor import AttemptProcessor
+
+WHITELISTS = {
+    6: Whitelist(("arbres", "artere", "tartes", "rattes")),
+    7: Whitelist(("abaissa", "abandon")),
+    8: Whitelist(("abaisser", "abandons")),
+}
+
+
+def test_get_feedback_table__concurrent_rebuilds__build_once():
+    attempt_processor = AttemptProcessor(WHITELISTS, precomputed_feedback=True)
+    attempt_processor.get_feedback_table("arbres")
+    barrier = threading.Barrier(8)
+    tables = []
+
+    def run():
+        barrier.wait()
+        tables.append(attempt_processor.get_feedback_table("tartes"))
+
+    def slow_feedback_table(*args):
+        time.sleep(0.1)
+        return FeedbackTable(*args)
+
+    with patch(
+        "wordleapi.processor.FeedbackTable", side_effect=slow_feedback_table
+    ) as mock_table:
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_table.call_count == 1
+    assert len(tables) == 8
+    assert all(table is tables[0] for table in tables)
+    assert tables[0].word == "tartes"
+
+
+@pytest.fixture()
+def whitelist_files(tmp_path) -> dict[int, str]:
+    whitelist_files = {}
+    for word_length, whitelist in WHITELISTS.items():
+        filename = tmp_path / f"whitelist_{word_length}.txt"
+        filename.write_text("\n".join(whitelist))
+        whitelist_files[word_length] = str(filename)
+    return whitelist_files
+
+
+def test_reload_whitelists__rebuilds_used_candidate_indexes(
+    whitelist_files: dict[int, str],
+):
+    attempt_processor = AttemptProcessor(WHITELISTS)
+    attempt_processor.get_candidate_index(6)
+
+    attempt_processor.reload_whitelists(whitelist_files)
+
+    with patch("wordleapi.processor.CandidateIndex") as mock_index:
+        index = attempt_processor.get_candidate_index(6)
+    mock_index.assert_not_called()
+    assert index.whitelist is attempt_processor.whitelists_by_word_length[6]
+    assert index.whitelist is not WHITELISTS[6]
+
+
+def test_get_candidate_index__when_whitelists_are_reloaded_during_build__keeps_reloaded_state(
+    whitelist_files: dict[int, str],
+):
+    attempt_processor = AttemptProcessor(WHITELISTS)
+
+    def reloading_candidate_index(whitelist):
+        attempt_processor.reload_whitelists(whitelist_files)
+        return CandidateIndex(whitelist)
+
+    with patch(
+        "wordleapi.processor.CandidateIndex", side_effect=reloading_candidate_index
+    ):
+        index = attempt_processor.get_candidate_index(6)
+
+    assert index.whitelist is WHITELISTS[6]
+    reloaded_index = attempt_processor.get_candidate_index(6)
+    assert reloaded_index.whitelist is attempt_processor.whitelists_by_word_length[6]
+    assert reloaded_index.whitelist is not WHITELISTS[6]
+
+
+def test_reload_whitelists__with_word_selector__raises_value_error(
+    whitelist_files: dict[int, str],
+):
+    attempt_processor = AttemptProcessor(
+        WHITELISTS, word_selector=DeterministicWordSelector("secret")
+    )
+
+    with pytest.raises(ValueError):
+        attempt_processor.reload_whitelists(whitelist_files)
+
+    assert attempt_processor.whitelists_by_word_length is WHITELISTS
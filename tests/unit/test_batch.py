@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from wordleapi.batch import (
+    compute_attempt_result_codes,
+    compute_attempt_results,
+    encode_words,
+)
+from wordleapi.core import (
+    compute_attempt_result,
+    encode_attempt_result,
+    load_whitelist_file,
+)
+
+WORDS = (
+    "arbres",
+    "artere",
+    "tartes",
+    "rattes",
+    "restat",
+    "strate",
+    "tarets",
+    "tersat",
+    "tetras",
+    "itsame",
+    "maario",
+    "aacdef",
+    "aazyxw",
+    "azyxwa",
+    "adaeaf",
+    "ayxawa",
+)
+
+
+def test_compute_attempt_results__same_result_as_compute_attempt_result():
+    results = compute_attempt_results(encode_words(WORDS), encode_words(WORDS))
+
+    assert results.shape == (len(WORDS), len(WORDS), 6)
+    for n, attempt in enumerate(WORDS):
+        for m, word in enumerate(WORDS):
+            assert results[n, m].tolist() == compute_attempt_result(attempt, word), (
+                f'attempt: "{attempt}", word: "{word}"'
+            )
+
+
+def test_compute_attempt_results__duplicate_letters():
+    results = compute_attempt_results(
+        encode_words(["artere"]), encode_words(["arbres"])
+    )
+
+    assert results[0, 0].tolist() == [0, 0, 2, 1, 1, 2]
+
+
+@pytest.mark.parametrize("chunk_size", (1, 7, 1 << 22))
+def test_compute_attempt_result_codes__same_codes_as_encode_attempt_result(
+    chunk_size: int,
+):
+    whitelist = load_whitelist_file(
+        os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), "data", "whitelist_6_fr.txt"
+        )
+    )
+    attempts = list(whitelist) + list(WORDS)
+
+    codes = compute_attempt_result_codes(
+        encode_words(attempts), encode_words(WORDS), chunk_size=chunk_size
+    )
+
+    assert codes.shape == (len(attempts), len(WORDS))
+    for n, attempt in enumerate(attempts):
+        for m, word in enumerate(WORDS):
+            assert codes[n, m] == encode_attempt_result(
+                compute_attempt_result(attempt, word)
+            )
@@ -0,0 +1,91 @@
+import itertools
+
+import pytest
+
+from wordleapi.core import (
+    CandidateIndex,
+    HardModeConstraints,
+    Whitelist,
+    compute_attempt_result,
+)
+
+WHITELIST = Whitelist(
+    (
+        "abimer",
+        "araser",
+        "arbres",
+        "archer",
+        "arrete",
+        "artere",
+        "rattes",
+        "restat",
+        "strate",
+        "tarets",
+        "tartes",
+    )
+)
+
+
+def _constraints(word: str, previous_attempts: tuple[str, ...]) -> HardModeConstraints:
+    return HardModeConstraints(
+        len(word),
+        (
+            (attempt, compute_attempt_result(attempt, word))
+            for attempt in previous_attempts
+        ),
+    )
+
+
+def test_candidate_index__without_previous_attempts__returns_whole_whitelist():
+    index = CandidateIndex(WHITELIST)
+
+    assert index.query(HardModeConstraints(6, []), limit=100) == (
+        len(WHITELIST),
+        list(WHITELIST),
+    )
+
+
+def test_candidate_index__without_limit__returns_count_only():
+    index = CandidateIndex(WHITELIST)
+
+    assert index.query(_constraints("arbres", ("artere",))) == (3, [])
+
+
+@pytest.mark.parametrize(
+    "offset,limit,expected",
+    [
+        (0, 2, ["abimer", "araser"]),
+        (1, 2, ["araser", "arbres"]),
+        (9, 10, ["tarets", "tartes"]),
+        (11, 10, []),
+    ],
+)
+def test_candidate_index__returns_page(offset: int, limit: int, expected: list[str]):
+    index = CandidateIndex(WHITELIST)
+
+    count, words = index.query(HardModeConstraints(6, []), offset, limit)
+
+    assert count == len(WHITELIST)
+    assert words == expected
+
+
+@pytest.mark.parametrize(
+    "word,previous_attempts",
+    [
+        (word, previous_attempts)
+        for word in WHITELIST
+        for previous_attempts in itertools.combinations(WHITELIST, 2)
+    ],
+)
+def test_candidate_index__same_as_constraints_check(
+    word: str, previous_attempts: tuple[str, ...]
+):
+    index = CandidateIndex(WHITELIST)
+    constraints = _constraints(word, previous_attempts)
+
+    count, words = index.query(constraints, limit=len(WHITELIST))
+
+    expected = [w for w in WHITELIST if constraints.violation(w) is None]
+    assert word in words
+    assert count == len(expected)
+    assert words == expected
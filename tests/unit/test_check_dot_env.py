@@ -0,0 +1,78 @@
+import pytest
+
+from wordleapi.env import (
+    DotEnvKey,
+    InvalidDotEnvValueError,
+    MissingDotEnvKeyError,
+    check_dot_env,
+)
+
+REQUIRED_VALUES = {
+    DotEnvKey.DATABASE_URI.value: "sqlite:///wordleapi.db",
+    DotEnvKey.WHITELIST_FILE_6_LETTERS.value: "whitelist_files/whitelist_6_fr.txt",
+    DotEnvKey.WHITELIST_FILE_7_LETTERS.value: "whitelist_files/whitelist_7_fr.txt",
+    DotEnvKey.WHITELIST_FILE_8_LETTERS.value: "whitelist_files/whitelist_8_fr.txt",
+}
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch):
+    for key in DotEnvKey:
+        monkeypatch.delenv(key.value, raising=False)
+    for key, value in REQUIRED_VALUES.items():
+        monkeypatch.setenv(key, value)
+
+
+def test_check_dot_env__if_optional_keys_are_missing__does_not_raise():
+    check_dot_env()
+
+
+def test_check_dot_env__if_required_key_is_missing__raises_exception(monkeypatch):
+    monkeypatch.delenv(DotEnvKey.DATABASE_URI.value)
+
+    with pytest.raises(MissingDotEnvKeyError):
+        check_dot_env()
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    (
+        (DotEnvKey.DB_POOL_SIZE, "10"),
+        (DotEnvKey.DB_MAX_OVERFLOW, "-1"),
+        (DotEnvKey.DB_POOL_RECYCLE, "3600"),
+        (DotEnvKey.DB_POOL_PRE_PING, "False"),
+        (DotEnvKey.SQLITE_JOURNAL_MODE, "wal"),
+        (DotEnvKey.SQLITE_SYNCHRONOUS, "FULL"),
+        (DotEnvKey.LOG_LEVEL, "debug"),
+        (DotEnvKey.LOG_REQUEST_SAMPLE_RATE, "0.01"),
+    ),
+)
+def test_check_dot_env__if_value_is_valid__does_not_raise(
+    monkeypatch, key: DotEnvKey, value: str
+):
+    monkeypatch.setenv(key.value, value)
+
+    check_dot_env()
+
+
+@pytest.mark.parametrize(
+    "key,value",
+    (
+        (DotEnvKey.DB_POOL_SIZE, "five"),
+        (DotEnvKey.DB_POOL_SIZE, "-1"),
+        (DotEnvKey.DB_POOL_TIMEOUT, "1.5"),
+        (DotEnvKey.DB_POOL_PRE_PING, "maybe"),
+        (DotEnvKey.SQLITE_JOURNAL_MODE, "WAL; DROP TABLE played_word"),
+        (DotEnvKey.SQLITE_BUSY_TIMEOUT_MS, "5s"),
+        (DotEnvKey.LOG_LEVEL, "VERBOSE"),
+        (DotEnvKey.LOG_REQUEST_SAMPLE_RATE, "2"),
+    ),
+)
+def test_check_dot_env__if_value_is_invalid__raises_exception(
+    monkeypatch, key: DotEnvKey, value: str
+):
+    monkeypatch.setenv(key.value, value)
+
+    with pytest.raises(InvalidDotEnvValueError) as e:
+        check_dot_env()
+    assert key.value in str(e.value)
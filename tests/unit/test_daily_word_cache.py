@@ -0,0 +1,36 @@
+from wordleapi.core import DailyWordCache
+
+
+def test_daily_word_cache__get_missing_word__returns_none():
+    cache = DailyWordCache()
+
+    assert cache.get(6, "20230807") is None
+
+
+def test_daily_word_cache__set_then_get__returns_word():
+    cache = DailyWordCache()
+    cache.set(6, "20230807", "arbres")
+    cache.set(7, "20230807", "joutera")
+
+    assert cache.get(6, "20230807") == "arbres"
+    assert cache.get(7, "20230807") == "joutera"
+    assert cache.get(8, "20230807") is None
+
+
+def test_daily_word_cache__set_new_date__evicts_previous_date():
+    cache = DailyWordCache()
+    cache.set(6, "20230807", "arbres")
+    cache.set(7, "20230807", "joutera")
+    cache.set(6, "20230808", "cassis")
+
+    assert cache.get(6, "20230807") is None, "previous day word should be evicted"
+    assert cache.get(6, "20230808") == "cassis"
+    assert cache.get(7, "20230807") == "joutera", "other word length is kept"
+
+
+def test_daily_word_cache__clear():
+    cache = DailyWordCache()
+    cache.set(6, "20230807", "arbres")
+    cache.clear()
+
+    assert cache.get(6, "20230807") is None
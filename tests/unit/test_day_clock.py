@@ -0,0 +1,100 @@
+import datetime
+from unittest.mock import patch
+
+import freezegun
+import pytest
+import pytz
+
+from wordleapi.utils import DayClock, now_yyyymmdd, set_clock
+
+PARIS = pytz.timezone("Europe/Paris")
+
+
+def _timestamp(*args) -> float:
+    """Returns timestamp of Paris datetime"""
+    return PARIS.localize(datetime.datetime(*args)).timestamp()
+
+
+class FakeTime:
+    def __init__(self, now: float):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_today__returns_paris_date():
+    # 2023/08/07 23:30 UTC is 2023/08/08 01:30 in Paris
+    fake_time = FakeTime(
+        datetime.datetime(2023, 8, 7, 23, 30).replace(tzinfo=datetime.UTC).timestamp()
+    )
+
+    assert DayClock(time_fn=fake_time).today() == "20230808"
+
+
+def test_today__day_key_is_recomputed_at_midnight_only():
+    fake_time = FakeTime(_timestamp(2023, 8, 7, 12))
+    clock = DayClock(time_fn=fake_time)
+    assert clock.today() == "20230807"
+
+    with patch.object(clock, "_compute_day", wraps=clock._compute_day) as mock:
+        fake_time.now = _timestamp(2023, 8, 7, 23, 59, 59)
+        assert clock.today() == "20230807"
+        mock.assert_not_called()
+
+        fake_time.now = _timestamp(2023, 8, 8)
+        assert clock.today() == "20230808"
+        mock.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "now,next_midnight,expected_days",
+    (
+        # daylight saving time starts (23 hours day)
+        ((2023, 3, 26, 12), (2023, 3, 27), ("20230326", "20230327")),
+        # daylight saving time ends (25 hours day)
+        ((2023, 10, 29, 12), (2023, 10, 30), ("20231029", "20231030")),
+        ((2023, 12, 31, 0), (2024, 1, 1), ("20231231", "20240101")),
+    ),
+)
+def test_today__day_key_changes_at_paris_midnight(
+    now: tuple, next_midnight: tuple, expected_days: tuple
+):
+    fake_time = FakeTime(_timestamp(*now))
+    clock = DayClock(time_fn=fake_time)
+    assert clock.today() == expected_days[0]
+
+    fake_time.now = _timestamp(*next_midnight) - 1
+    assert clock.today() == expected_days[0]
+
+    fake_time.now = _timestamp(*next_midnight)
+    assert clock.today() == expected_days[1]
+
+
+def test_today__time_moved_backwards__day_key_is_recomputed():
+    fake_time = FakeTime(_timestamp(2023, 8, 7, 12))
+    clock = DayClock(time_fn=fake_time)
+    assert clock.today() == "20230807"
+
+    fake_time.now = _timestamp(1987, 8, 30, 12)
+
+    assert clock.today() == "19870830"
+
+
+def test_today__follows_freezegun():
+    clock = DayClock()
+
+    with freezegun.freeze_time("2023-08-07 12:00:00"):
+        assert clock.today() == "20230807"
+    with freezegun.freeze_time("2023-08-31 12:00:00"):
+        assert clock.today() == "20230831"
+
+
+def test_set_clock__now_yyyymmdd_uses_clock():
+    previous_clock = set_clock(DayClock(time_fn=FakeTime(_timestamp(1987, 8, 30, 12))))
+    try:
+        assert now_yyyymmdd() == "19870830"
+    finally:
+        set_clock(previous_clock)
+
+    assert now_yyyymmdd() != "19870830"
@@ -0,0 +1,68 @@
+import datetime
+
+import pytest
+
+from wordleapi.core import DeterministicWordSelector
+from wordleapi.utils import add_days
+
+WHITELIST = (
+    "abacas",
+    "abales",
+    "abaque",
+    "abasie",
+    "abatee",
+    "abatis",
+    "abatte",
+    "abattu",
+    "abbaye",
+    "abceda",
+)
+
+
+def _cycle_start(word_count: int) -> str:
+    """Returns first date of a cycle of word_count days"""
+    day = datetime.date(2023, 8, 31).toordinal() // word_count * word_count
+    return datetime.date.fromordinal(day).strftime("%Y%m%d")
+
+
+@pytest.mark.parametrize("date", ("20230831", "20230901", "20240229"))
+def test_select__same_secret__selects_same_word(date: str):
+    word = DeterministicWordSelector("secret").select(WHITELIST, date)
+
+    assert word in WHITELIST
+    assert DeterministicWordSelector("secret").select(WHITELIST, date) == word
+
+
+def test_select__different_secrets__select_different_words():
+    dates = [add_days("20230831", i) for i in range(10)]
+
+    assert [
+        DeterministicWordSelector("secret").select(WHITELIST, d) for d in dates
+    ] != [DeterministicWordSelector("other secret").select(WHITELIST, d) for d in dates]
+
+
+def test_select__within_a_cycle__selects_each_word_once():
+    selector = DeterministicWordSelector("secret")
+    start = _cycle_start(len(WHITELIST))
+
+    words = [
+        selector.select(WHITELIST, add_days(start, i)) for i in range(len(WHITELIST))
+    ]
+
+    assert sorted(words) == sorted(WHITELIST)
+
+
+def test_select__next_cycle__uses_another_permutation():
+    selector = DeterministicWordSelector("secret")
+    start = _cycle_start(len(WHITELIST))
+
+    words = [
+        selector.select(WHITELIST, add_days(start, i)) for i in range(len(WHITELIST))
+    ]
+    next_words = [
+        selector.select(WHITELIST, add_days(start, len(WHITELIST) + i))
+        for i in range(len(WHITELIST))
+    ]
+
+    assert sorted(next_words) == sorted(WHITELIST)
+    assert next_words != words
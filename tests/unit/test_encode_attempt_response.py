@@ -0,0 +1,68 @@
+import itertools
+
+import pytest
+
+from wordleapi.core import LetterPositionStatus as LPS
+from wordleapi.schemas import (
+    AttemptResponse,
+    AttemptsResponse,
+    ErrorCode,
+    ErrorResponse,
+    encode_attempt_response,
+    encode_attempts_response,
+    encode_method_not_allowed_error,
+    encode_not_in_whitelist_error,
+)
+
+
+@pytest.mark.parametrize("word_length", (6, 7))
+def test_encode_attempt_response__matches_pydantic_serialization(word_length: int):
+    for result in itertools.product(list(LPS), repeat=word_length):
+        result = list(result)
+        expected = AttemptResponse(result=result).model_dump_json().encode()
+        assert encode_attempt_response(result) == expected
+        # cached
+        assert encode_attempt_response(result) == expected
+
+
+@pytest.mark.parametrize("attempt", ("abcdef", "ABCDEFG", "ArBrEsXy"))
+def test_encode_not_in_whitelist_error__matches_pydantic_serialization(attempt: str):
+    assert (
+        encode_not_in_whitelist_error(attempt)
+        == ErrorResponse(
+            code=ErrorCode.ATTEMPT_NOT_IN_WHITELIST,
+            error_msg=f"'{attempt}' is not in whitelist",
+        )
+        .model_dump_json()
+        .encode()
+    )
+
+
+def test_encode_attempts_response__matches_pydantic_serialization():
+    results = [
+        AttemptResponse(result=[LPS.WP, LPS.MP, LPS.NP, LPS.WP, LPS.WP, LPS.NP]),
+        ErrorResponse(
+            code=ErrorCode.ATTEMPT_NOT_IN_WHITELIST,
+            error_msg="'ABCDEF' is not in whitelist",
+        ),
+    ]
+
+    for items in ([], results[:1], results):
+        assert (
+            encode_attempts_response(
+                [item.model_dump_json().encode() for item in items]
+            )
+            == AttemptsResponse(results=items).model_dump_json().encode()
+        )
+
+
+def test_encode_method_not_allowed_error__matches_pydantic_serialization():
+    assert (
+        encode_method_not_allowed_error(("OPTIONS", "POST"))
+        == ErrorResponse(
+            code=ErrorCode.METHOD_NOT_ALLOWED,
+            error_msg="Method not allowed, accepted methods are ['OPTIONS', 'POST']",
+        )
+        .model_dump_json()
+        .encode()
+    )
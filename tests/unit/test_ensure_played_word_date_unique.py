@@ -0,0 +1,85 @@
+from unittest.mock import Mock, patch
+
+import flask
+import pytest
+import sqlalchemy as sa
+
+from wordleapi.db.model import (
+    PlayedWord,
+    db,
+    ensure_played_word_date_unique,
+    insert_played_word_if_absent,
+)
+
+# played word table created before (word length, date) unique constraint was added
+_LEGACY_TABLE = """
+CREATE TABLE played_word (
+    id INTEGER NOT NULL PRIMARY KEY,
+    word VARCHAR NOT NULL UNIQUE,
+    word_length INTEGER NOT NULL,
+    date VARCHAR
+)
+"""
+
+
+def _app(tmp_path, legacy: bool) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        if legacy:
+            db.session.execute(sa.text(_LEGACY_TABLE))
+            db.session.commit()
+        db.create_all()
+    return app
+
+
+def test_ensure_played_word_date_unique__new_table__does_nothing(tmp_path):
+    app = _app(tmp_path, legacy=False)
+
+    with app.app_context():
+        assert not ensure_played_word_date_unique()
+
+
+def test_ensure_played_word_date_unique__legacy_table__creates_unique_index(
+    tmp_path,
+):
+    app = _app(tmp_path, legacy=True)
+
+    with app.app_context():
+        assert insert_played_word_if_absent("arbres", 6, "20230807")
+        assert ensure_played_word_date_unique()
+        assert not ensure_played_word_date_unique()
+
+        assert not insert_played_word_if_absent("cassis", 6, "20230807")
+        assert [pw.word for pw in db.session.query(PlayedWord).all()] == ["arbres"]
+
+
+def test_ensure_played_word_date_unique__duplicate_dates__raises_integrity_error(
+    tmp_path,
+):
+    app = _app(tmp_path, legacy=True)
+
+    with app.app_context():
+        assert insert_played_word_if_absent("arbres", 6, "20230807")
+        assert insert_played_word_if_absent("cassis", 6, "20230807")
+
+        with pytest.raises(sa.exc.IntegrityError):
+            ensure_played_word_date_unique()
+
+
+def test_ensure_played_word_date_unique__index_created_concurrently__does_not_fail(
+    tmp_path,
+):
+    app = _app(tmp_path, legacy=True)
+    # inspected by a process before another one created index
+    stale_inspector = Mock(
+        get_unique_constraints=Mock(return_value=[]), get_indexes=Mock(return_value=[])
+    )
+
+    with app.app_context():
+        assert ensure_played_word_date_unique()
+        with patch("wordleapi.db.model.sa.inspect", return_value=stale_inspector):
+            assert ensure_played_word_date_unique()
+
+        assert not ensure_played_word_date_unique()
@@ -0,0 +1,94 @@
+import itertools
+
+import pytest
+
+from wordleapi.core import (
+    FeedbackTable,
+    SharedDailyWordCache,
+    Whitelist,
+    compute_attempt_result,
+    decode_attempt_result,
+    encode_attempt_result,
+)
+from wordleapi.core import LetterPositionStatus as LPS
+
+WHITELIST = Whitelist(
+    ("arbres", "artere", "tartes", "rattes", "restat", "strate", "tarets", "abacas")
+)
+
+
+@pytest.mark.parametrize(
+    "result", [list(r) for r in itertools.product(LPS, repeat=6)][::37]
+)
+def test_encode_attempt_result__decode_returns_same_result(result: list[LPS]):
+    code = encode_attempt_result(result)
+
+    assert 0 <= code < 3**6
+    assert decode_attempt_result(code, 6) == result
+
+
+def test_encode_attempt_result__all_well_placed_is_zero():
+    assert encode_attempt_result([LPS.WP] * 8) == 0
+
+
+@pytest.mark.parametrize("word", WHITELIST)
+def test_feedback_table__same_result_as_compute_attempt_result(word: str):
+    table = FeedbackTable(WHITELIST, word)
+
+    assert table.word == word
+    for attempt in WHITELIST:
+        assert table.attempt_result(attempt) == compute_attempt_result(attempt, word), (
+            f'attempt: "{attempt}", word: "{word}"'
+        )
+
+
+def test_feedback_table__attempt_not_in_whitelist__returns_none():
+    table = FeedbackTable(WHITELIST, "arbres")
+
+    assert table.attempt_result("abcdef") is None
+
+
+@pytest.mark.parametrize("word", WHITELIST)
+def test_feedback_table_shared__same_result_as_compute_attempt_result(
+    tmp_path, word: str
+):
+    table = FeedbackTable.shared(WHITELIST, word, str(tmp_path))
+
+    assert table.word == word
+    assert table.nbytes == len(WHITELIST) * 2
+    for attempt in WHITELIST:
+        assert table.attempt_result(attempt) == compute_attempt_result(attempt, word), (
+            f'attempt: "{attempt}", word: "{word}"'
+        )
+
+
+def test_feedback_table_shared__maps_table_file_of_same_word(tmp_path, monkeypatch):
+    FeedbackTable.shared(WHITELIST, "arbres", str(tmp_path))
+    monkeypatch.setattr(
+        FeedbackTable, "__init__", lambda *args: pytest.fail("table rebuilt")
+    )
+
+    table = FeedbackTable.shared(WHITELIST, "arbres", str(tmp_path))
+
+    assert table.attempt_result("arbres") == [LPS.WP] * 6
+
+
+def test_feedback_table_shared__removes_table_files_of_other_words(tmp_path):
+    FeedbackTable.shared(WHITELIST, "arbres", str(tmp_path))
+    FeedbackTable.shared(WHITELIST, "tartes", str(tmp_path))
+
+    assert [p.name for p in tmp_path.glob("feedback_6_*.bin")] == [
+        f"feedback_6_tartes_{WHITELIST.digest}.bin"
+    ]
+
+
+def test_feedback_table_shared__files_are_readable_by_owner_only(tmp_path):
+    FeedbackTable.shared(WHITELIST, "arbres", str(tmp_path))
+    SharedDailyWordCache(str(tmp_path / "daily_words.bin")).set(6, "20230807", "arbres")
+
+    assert {p.name for p in tmp_path.iterdir()} == {
+        f"feedback_6_arbres_{WHITELIST.digest}.bin",
+        "feedback_6.lock",
+        "daily_words.bin",
+    }
+    assert all(p.stat().st_mode & 0o777 == 0o600 for p in tmp_path.iterdir())
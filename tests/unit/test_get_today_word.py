@@ -1,8 +1,16 @@
-from unittest.mock import patch, Mock
+from unittest.mock import Mock, patch
 
+import freezegun
 import pytest
 
-from wordleapi.core import get_today_word
+from wordleapi.core import (
+    MAX_RANDOM_PICK_ATTEMPTS,
+    MAX_WORD_GENERATION_ATTEMPTS,
+    DailyWordCache,
+    DeterministicWordSelector,
+    WordSchedule,
+    get_today_word,
+)
 from wordleapi.db.model import PlayedWord
 from wordleapi.utils import now_yyyymmdd
 
@@ -27,19 +35,19 @@ from wordleapi.utils import now_yyyymmdd
         ),
     ),
 )
-@patch("wordleapi.core.commit")
-@patch("wordleapi.core.add_played_word")
+@patch("wordleapi.core.insert_played_word_if_absent")
 @patch("wordleapi.core.pick_random_element")
 @patch("wordleapi.core.delete_played_word_by_word_length")
-@patch("wordleapi.core.get_all_played_word_by_word_length")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
 @patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
 def test_get_today_word__if_all_whitelisted_words_were_not_played__does_not_delete_played_words(
     mock_get_first_word: Mock,
-    mock_get_all_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
     mock_delete_word: Mock,
     mock_pick_random: Mock,
-    mock_add_word: Mock,
-    mock_commit: Mock,
+    mock_insert_word: Mock,
     word: str,
     whitelist: tuple[str],
     played_words: list[PlayedWord],
@@ -47,8 +55,10 @@ def test_get_today_word__if_all_whitelisted_words_were_not_played__does_not_dele
     word_length = len(word)
 
     mock_get_first_word.return_value = None
-    mock_get_all_word.return_value = played_words
+    mock_get_played_words.return_value = {pw.word for pw in played_words}
+    mock_is_played_word.side_effect = lambda w: w in {pw.word for pw in played_words}
     mock_pick_random.return_value = word
+    mock_insert_word.return_value = True
 
     assert get_today_word(whitelist) == word
 
@@ -57,31 +67,34 @@ def test_get_today_word__if_all_whitelisted_words_were_not_played__does_not_dele
         "should retrieve today word",
     )
     (
-        mock_get_all_word.assert_called_with(word_length),
-        "should retrieve played word from database",
+        mock_is_played_word.assert_called_once_with(word),
+        "should check picked word was not played",
+    )
+    (
+        mock_get_played_words.assert_not_called(),
+        "should not retrieve played words from database",
     )
     mock_delete_word.assert_not_called(), "should not delete played words from database"
     (
-        mock_add_word.assert_called_once_with(word, len(word)),
-        "should add word to database",
+        mock_insert_word.assert_called_once_with(word, len(word), now_yyyymmdd()),
+        "should insert word to database",
     )
-    mock_commit.assert_called_once(), "should commit"
 
 
 @pytest.mark.parametrize("word", ("arbres", "joutera", "retameur"))
-@patch("wordleapi.core.commit")
-@patch("wordleapi.core.add_played_word")
+@patch("wordleapi.core.insert_played_word_if_absent")
 @patch("wordleapi.core.pick_random_element")
 @patch("wordleapi.core.delete_played_word_by_word_length")
-@patch("wordleapi.core.get_all_played_word_by_word_length")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
 @patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
 def test_get_today_word__if_today_word_was_generated__returns_it(
     mock_get_first_word: Mock,
-    mock_get_all_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
     mock_delete_word: Mock,
     mock_pick_random: Mock,
-    mock_add_word: Mock,
-    mock_commit: Mock,
+    mock_insert_word: Mock,
     word: str,
 ):
     word_length = len(word)
@@ -95,13 +108,12 @@ def test_get_today_word__if_today_word_was_generated__returns_it(
         "should retrieve today word",
     )
     (
-        mock_get_all_word.assert_not_called(),
-        "should not retrieve played word from database",
+        mock_get_played_words.assert_not_called(),
+        "should not retrieve played words from database",
     )
     mock_delete_word.assert_not_called(), "should not delete played words from database"
     mock_pick_random.assert_not_called(), "should not pick random word"
-    mock_add_word.assert_not_called(), "should not add word to database"
-    mock_commit.assert_not_called(), "should not commit"
+    mock_insert_word.assert_not_called(), "should not insert word to database"
 
 
 @pytest.mark.parametrize(
@@ -139,19 +151,19 @@ def test_get_today_word__if_today_word_was_generated__returns_it(
         ),
     ),
 )
-@patch("wordleapi.core.commit")
-@patch("wordleapi.core.add_played_word")
+@patch("wordleapi.core.insert_played_word_if_absent")
 @patch("wordleapi.core.pick_random_element")
 @patch("wordleapi.core.delete_played_word_by_word_length")
-@patch("wordleapi.core.get_all_played_word_by_word_length")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
 @patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
 def test_get_today_word__if_all_whitelisted_words_were_played__deletes_played_words(
     mock_get_first_word: Mock,
-    mock_get_all_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
     mock_delete_word: Mock,
     mock_pick_random: Mock,
-    mock_add_word: Mock,
-    mock_commit: Mock,
+    mock_insert_word: Mock,
     word: str,
     whitelist: tuple[str],
     played_words: list[PlayedWord],
@@ -159,8 +171,10 @@ def test_get_today_word__if_all_whitelisted_words_were_played__deletes_played_wo
     word_length = len(word)
 
     mock_get_first_word.return_value = None
-    mock_get_all_word.return_value = played_words
+    mock_get_played_words.return_value = {pw.word for pw in played_words}
+    mock_is_played_word.side_effect = lambda w: w in {pw.word for pw in played_words}
     mock_pick_random.return_value = word
+    mock_insert_word.return_value = True
 
     assert get_today_word(whitelist) == word
 
@@ -169,15 +183,188 @@ def test_get_today_word__if_all_whitelisted_words_were_played__deletes_played_wo
         "should retrieve today word",
     )
     (
-        mock_get_all_word.assert_called_with(word_length),
-        "should retrieve played word from database",
+        mock_get_played_words.assert_called_with(word_length),
+        "should retrieve played words from database",
     )
     (
-        mock_delete_word.assert_called_with(word_length),
-        "should delete played words from database",
+        mock_delete_word.assert_called_with(word_length, keep_from_date=now_yyyymmdd()),
+        "should delete played words (except today word) from database",
     )
     (
-        mock_add_word.assert_called_once_with(word, len(word)),
-        "should add word to database",
+        mock_insert_word.assert_called_once_with(word, len(word), now_yyyymmdd()),
+        "should insert word to database",
     )
-    mock_commit.assert_called_once(), "should commit"
+
+
+@patch("wordleapi.core.insert_played_word_if_absent")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__if_today_word_is_cached__does_not_query_database(
+    mock_get_first_word: Mock,
+    mock_insert_word: Mock,
+):
+    cache = DailyWordCache()
+    cache.set(6, now_yyyymmdd(), "arbres")
+
+    assert get_today_word(("arbres", "cassis"), cache) == "arbres"
+
+    mock_get_first_word.assert_not_called(), "should not query database"
+    mock_insert_word.assert_not_called(), "should not insert word to database"
+
+
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__if_today_word_is_not_cached__caches_database_word(
+    mock_get_first_word: Mock,
+):
+    cache = DailyWordCache()
+    mock_get_first_word.return_value = PlayedWord(word="arbres", word_length=6)
+
+    with freezegun.freeze_time("2023-08-07 12:00:00"):
+        assert get_today_word(("arbres", "cassis"), cache) == "arbres"
+        assert get_today_word(("arbres", "cassis"), cache) == "arbres"
+    mock_get_first_word.assert_called_once_with(6, "20230807")
+    assert cache.get(6, "20230807") == "arbres"
+
+    # Paris midnight rollover (UTC+2 in summer)
+    mock_get_first_word.return_value = PlayedWord(word="cassis", word_length=6)
+    with freezegun.freeze_time("2023-08-07 22:00:00"):
+        assert get_today_word(("arbres", "cassis"), cache) == "cassis"
+    mock_get_first_word.assert_called_with(6, "20230808")
+    assert cache.get(6, "20230808") == "cassis"
+
+
+@patch("wordleapi.core.insert_played_word_if_absent")
+@patch("wordleapi.core.pick_random_element")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__if_today_word_was_generated_concurrently__returns_it(
+    mock_get_first_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
+    mock_pick_random: Mock,
+    mock_insert_word: Mock,
+):
+    # not generated when first checked, generated by another worker when inserting
+    mock_get_first_word.side_effect = [
+        None,
+        PlayedWord(word="cassis", word_length=6),
+    ]
+    mock_is_played_word.return_value = False
+    mock_pick_random.return_value = "arbres"
+    mock_insert_word.return_value = False
+
+    assert get_today_word(("arbres", "cassis")) == "cassis"
+
+    (
+        mock_insert_word.assert_called_once_with("arbres", 6, now_yyyymmdd()),
+        "should try to insert word once",
+    )
+
+
+@patch("wordleapi.core.insert_played_word_if_absent")
+@patch("wordleapi.core.pick_random_element")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__if_picked_word_was_played_concurrently__picks_another_word(
+    mock_get_first_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
+    mock_pick_random: Mock,
+    mock_insert_word: Mock,
+):
+    mock_get_first_word.return_value = None
+    mock_is_played_word.return_value = False
+    mock_pick_random.side_effect = ["arbres", "cassis"]
+    mock_insert_word.side_effect = [False, True]
+
+    assert get_today_word(("arbres", "cassis")) == "cassis"
+
+    assert mock_insert_word.call_count == 2, "should retry with another word"
+
+
+@patch("wordleapi.core.insert_played_word_if_absent")
+@patch("wordleapi.core.pick_random_element")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__if_generation_keeps_failing__raises_exception(
+    mock_get_first_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
+    mock_pick_random: Mock,
+    mock_insert_word: Mock,
+):
+    mock_get_first_word.return_value = None
+    mock_is_played_word.return_value = False
+    mock_pick_random.return_value = "arbres"
+    mock_insert_word.return_value = False
+
+    with pytest.raises(RuntimeError):
+        get_today_word(("arbres", "cassis"))
+
+    assert mock_insert_word.call_count == MAX_WORD_GENERATION_ATTEMPTS
+
+
+@patch("wordleapi.core.insert_played_word_if_absent")
+@patch("wordleapi.core.pick_random_element")
+@patch("wordleapi.core.delete_played_word_by_word_length")
+@patch("wordleapi.core.is_played_word")
+@patch("wordleapi.core.get_played_words_by_word_length")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__if_random_picks_keep_hitting_played_words__picks_among_not_played_words(
+    mock_get_first_word: Mock,
+    mock_get_played_words: Mock,
+    mock_is_played_word: Mock,
+    mock_delete_word: Mock,
+    mock_pick_random: Mock,
+    mock_insert_word: Mock,
+):
+    mock_get_first_word.return_value = None
+    mock_is_played_word.return_value = True
+    mock_get_played_words.return_value = {"arbres", "cassis"}
+    mock_pick_random.side_effect = lambda words: words[0]
+    mock_insert_word.return_value = True
+
+    assert get_today_word(("arbres", "cassis", "ecrous")) == "ecrous"
+
+    assert mock_is_played_word.call_count == MAX_RANDOM_PICK_ATTEMPTS
+    (
+        mock_get_played_words.assert_called_once_with(6),
+        "should retrieve played words from database",
+    )
+    mock_delete_word.assert_not_called(), "should not delete played words from database"
+
+
+@freezegun.freeze_time("2023-08-31")
+@patch("wordleapi.core.insert_played_word_if_absent")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__with_selector__computes_word_without_database(
+    mock_get_first_word: Mock, mock_insert_word: Mock
+):
+    whitelist = ("abatardi", "cyclable", "gaillard", "retameur", "zwieback")
+    selector = DeterministicWordSelector("secret")
+    cache = DailyWordCache()
+
+    word = get_today_word(whitelist, cache, selector)
+
+    assert word == selector.select(whitelist, "20230831")
+    assert cache.get(8, "20230831") == word
+    mock_get_first_word.assert_not_called()
+    mock_insert_word.assert_not_called()
+
+
+@freezegun.freeze_time("2023-08-31")
+@patch("wordleapi.core.get_first_played_word_by_word_length_and_date")
+def test_get_today_word__when_word_is_not_scheduled__falls_back_to_database(
+    mock_get_first_word: Mock,
+):
+    mock_get_first_word.return_value = PlayedWord(
+        word="cyclable", word_length=8, date="20230831"
+    )
+    schedule = WordSchedule({8: {"20230901": "gaillard"}})
+
+    word = get_today_word(("abatardi", "cyclable", "gaillard"), None, schedule)
+
+    assert word == "cyclable"
+    mock_get_first_word.assert_called_once_with(8, "20230831")
@@ -0,0 +1,175 @@
+import multiprocessing
+import threading
+from unittest.mock import patch
+
+import flask
+import pytest
+
+from wordleapi import core
+from wordleapi.core import SharedDailyWordCache, get_today_word
+from wordleapi.db.model import PlayedWord, db, insert_played_word_if_absent
+from wordleapi.utils import now_yyyymmdd
+
+WHITELIST = ("arbres", "cassis", "ecrous", "joutes", "mardis", "retame", "zestes")
+
+
+@pytest.fixture()
+def app(tmp_path) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"connect_args": {"timeout": 30}}
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+
+def test_get_today_word__concurrent_threads__generate_once(app: flask.Flask):
+    results = []
+    barrier = threading.Barrier(8)
+
+    def run():
+        with app.app_context():
+            barrier.wait()
+            results.append(get_today_word(WHITELIST))
+
+    with patch(
+        "wordleapi.core._generate_word", wraps=core._generate_word
+    ) as mock_generate_word:
+        threads = [threading.Thread(target=run) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_generate_word.call_count == 1
+    assert len(set(results)) == 1 and len(results) == 8
+
+
+def _run_process(
+    app: flask.Flask,
+    lock_dir: str | None,
+    barrier,
+    generations,
+    cache_filename: str | None = None,
+):
+    generate_word = core._generate_word
+
+    def counting_generate_word(*args):
+        with generations.get_lock():
+            generations.value += 1
+        return generate_word(*args)
+
+    core._generate_word = counting_generate_word
+    cache = SharedDailyWordCache(cache_filename) if cache_filename else None
+    with app.app_context():
+        # forked database connections must not be reused
+        db.engine.dispose(close=False)
+        barrier.wait()
+        get_today_word(WHITELIST, cache, lock_dir=lock_dir)
+
+
+def test_get_today_word__concurrent_processes__generate_once(
+    app: flask.Flask, tmp_path
+):
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(4)
+    generations = ctx.Value("i", 0)
+
+    processes = [
+        ctx.Process(
+            target=_run_process, args=(app, str(tmp_path), barrier, generations)
+        )
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert generations.value == 1
+    with app.app_context():
+        assert db.session.query(PlayedWord).count() == 1
+
+
+def test_get_today_word__concurrent_processes_with_shared_cache_without_lock_dir__generate_once(
+    app: flask.Flask, tmp_path
+):
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(4)
+    generations = ctx.Value("i", 0)
+    cache_filename = str(tmp_path / "daily_words.bin")
+
+    processes = [
+        ctx.Process(
+            target=_run_process,
+            args=(app, None, barrier, generations, cache_filename),
+        )
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert generations.value == 1
+    assert (tmp_path / "daily_words.lock").exists()
+    with app.app_context():
+        assert db.session.query(PlayedWord).count() == 1
+
+
+def _run_process_with_shared_cache(
+    app: flask.Flask, tmp_path, barrier, db_reads, words
+):
+    get_first_played_word = core.get_first_played_word_by_word_length_and_date
+
+    def counting_get_first_played_word(*args):
+        with db_reads.get_lock():
+            db_reads.value += 1
+        return get_first_played_word(*args)
+
+    core.get_first_played_word_by_word_length_and_date = counting_get_first_played_word
+    cache = SharedDailyWordCache(str(tmp_path / "daily_words.bin"))
+    with app.app_context():
+        db.engine.dispose(close=False)
+        barrier.wait()
+        words.put(get_today_word(WHITELIST, cache, lock_dir=str(tmp_path)))
+
+
+def test_get_today_word__concurrent_processes_with_shared_cache__read_database_once(
+    app: flask.Flask, tmp_path
+):
+    with app.app_context():
+        insert_played_word_if_absent("mardis", 6, now_yyyymmdd())
+    ctx = multiprocessing.get_context("fork")
+    barrier = ctx.Barrier(4)
+    db_reads = ctx.Value("i", 0)
+    words = ctx.Queue()
+
+    processes = [
+        ctx.Process(
+            target=_run_process_with_shared_cache,
+            args=(app, tmp_path, barrier, db_reads, words),
+        )
+        for _ in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert all(process.exitcode == 0 for process in processes)
+    assert [words.get() for _ in processes] == ["mardis"] * 4
+    assert db_reads.value == 1
+
+
+def test_get_today_word__when_lock_file_cannot_be_opened__generates_without_lock(
+    app: flask.Flask, tmp_path
+):
+    with app.app_context():
+        word = get_today_word(WHITELIST, lock_dir=str(tmp_path / "missing"))
+
+        assert word in WHITELIST
+        assert PlayedWord.query.filter_by(word=word).count() == 1
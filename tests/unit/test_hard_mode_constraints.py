@@ -0,0 +1,74 @@
+import itertools
+
+import pytest
+
+from wordleapi.core import HardModeConstraints, compute_attempt_result
+
+WORDS = ("arbres", "artere", "tartes", "rattes", "restat", "strate", "tarets", "abimer")
+
+
+def _constraints(word: str, previous_attempts: tuple[str, ...]) -> HardModeConstraints:
+    return HardModeConstraints(
+        len(word),
+        (
+            (attempt, compute_attempt_result(attempt, word))
+            for attempt in previous_attempts
+        ),
+    )
+
+
+def test_hard_mode_constraints__without_previous_attempts__accepts_any_attempt():
+    constraints = HardModeConstraints(6, [])
+
+    for attempt in WORDS:
+        assert constraints.violation(attempt) is None
+
+
+@pytest.mark.parametrize(
+    "attempt,expected",
+    [
+        ("abimer", "letter 2 must be 'r'"),
+        ("arbore", "letter 5 cannot be 'r'"),
+        ("arbitr", "'t' must be used at most 0 time(s)"),
+        ("areser", "'e' must be used at most 1 time(s)"),
+        ("arbres", None),
+    ],
+)
+def test_hard_mode_constraints__returns_first_violation(attempt: str, expected: str):
+    # 'artere' against 'arbres' is [WP, WP, NP, MP, MP, NP]
+    constraints = _constraints("arbres", ("artere",))
+
+    assert constraints.violation(attempt) == expected
+
+
+def test_hard_mode_constraints__misplaced_letter_must_be_reused():
+    # 'strate' against 'arbres' is [MP, NP, MP, MP, NP, MP]
+    constraints = _constraints("arbres", ("strate",))
+
+    assert constraints.violation("abimes") == "'r' must be used at least 1 time(s)"
+    assert constraints.violation("rabies") is None
+
+
+@pytest.mark.parametrize(
+    "word,previous_attempts",
+    [
+        (word, previous_attempts)
+        for word in WORDS
+        for previous_attempts in itertools.combinations(WORDS, 2)
+    ],
+)
+def test_hard_mode_constraints__same_as_previous_results_unchanged(
+    word: str, previous_attempts: tuple[str, ...]
+):
+    constraints = _constraints(word, previous_attempts)
+
+    for attempt in WORDS:
+        # attempt is accepted iff each previous attempt would have got same result against it
+        expected = all(
+            compute_attempt_result(previous_attempt, attempt)
+            == compute_attempt_result(previous_attempt, word)
+            for previous_attempt in previous_attempts
+        )
+        assert (constraints.violation(attempt) is None) == expected, (
+            f'word: "{word}", previous attempts: {previous_attempts}, attempt: "{attempt}"'
+        )
@@ -0,0 +1,66 @@
+import threading
+
+import flask
+import pytest
+
+from wordleapi.core import get_today_word
+from wordleapi.db.model import PlayedWord, db, insert_played_word_if_absent
+
+
+@pytest.fixture()
+def app(tmp_path) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+
+def test_insert_played_word_if_absent__inserts_word(app: flask.Flask):
+    with app.app_context():
+        assert insert_played_word_if_absent("arbres", 6, "20230807")
+        assert insert_played_word_if_absent("cassis", 6, "20230808")
+        assert insert_played_word_if_absent("joutera", 7, "20230807")
+
+        assert db.session.query(PlayedWord).count() == 3
+
+
+def test_insert_played_word_if_absent__same_word_length_and_date__does_not_insert(
+    app: flask.Flask,
+):
+    with app.app_context():
+        assert insert_played_word_if_absent("arbres", 6, "20230807")
+        assert not insert_played_word_if_absent("cassis", 6, "20230807")
+
+        assert [pw.word for pw in db.session.query(PlayedWord).all()] == ["arbres"]
+
+
+def test_insert_played_word_if_absent__same_word__does_not_insert(app: flask.Flask):
+    with app.app_context():
+        assert insert_played_word_if_absent("arbres", 6, "20230807")
+        assert not insert_played_word_if_absent("arbres", 6, "20230808")
+
+        assert db.session.query(PlayedWord).count() == 1
+
+
+def test_get_today_word__concurrent_generations__agree_on_one_word(app: flask.Flask):
+    whitelist = tuple(f"word{i:02d}" for i in range(50))
+    words = []
+    barrier = threading.Barrier(8)
+
+    def generate():
+        with app.app_context():
+            barrier.wait()
+            words.append(get_today_word(whitelist))
+
+    threads = [threading.Thread(target=generate) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(words) == 8
+    assert len(set(words)) == 1, "all generations should return the same word"
+    with app.app_context():
+        assert db.session.query(PlayedWord).count() == 1
@@ -0,0 +1,34 @@
+import prometheus_client
+import pytest
+import sqlalchemy as sa
+
+from wordleapi.metrics import InstrumentedQueuePool, instrument_db_pools
+
+
+def _sample(name: str) -> float:
+    return prometheus_client.REGISTRY.get_sample_value(name) or 0
+
+
+def test_instrumented_queue_pool__records_connections_and_timeouts(tmp_path):
+    instrument_db_pools()
+    engine = sa.create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.05,
+    )
+    checkouts = _sample("wordleapi_db_pool_checkout_wait_seconds_count")
+    timeouts = _sample("wordleapi_db_pool_timeouts_total")
+    checked_out = _sample("wordleapi_db_pool_checked_out")
+
+    with engine.connect():
+        assert _sample("wordleapi_db_pool_checked_out") == checked_out + 1
+        # pool is exhausted
+        with pytest.raises(sa.exc.TimeoutError):
+            engine.connect()
+
+    assert _sample("wordleapi_db_pool_checked_out") == checked_out
+    assert _sample("wordleapi_db_pool_checkout_wait_seconds_count") == checkouts + 2
+    assert _sample("wordleapi_db_pool_timeouts_total") == timeouts + 1
+    engine.dispose()
@@ -0,0 +1,57 @@
+import flask
+import freezegun
+import pytest
+
+from wordleapi.db.model import (
+    PlayedWord,
+    db,
+    get_first_played_word_by_word_length_and_date,
+    get_played_words_by_word_length,
+    insert_played_word_if_absent,
+    is_played_word,
+)
+
+
+@pytest.fixture()
+def app(tmp_path) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+        insert_played_word_if_absent("arbres", 6, "20230807")
+        insert_played_word_if_absent("cassis", 6, "20230808")
+        insert_played_word_if_absent("joutera", 7, "20230807")
+    yield app
+
+
+@pytest.mark.parametrize(
+    "word,expected",
+    (("arbres", True), ("joutera", True), ("ecrous", False), ("retameur", False)),
+)
+def test_is_played_word(app: flask.Flask, word: str, expected: bool):
+    with app.app_context():
+        assert is_played_word(word) is expected
+
+
+@pytest.mark.parametrize(
+    "word_length,expected",
+    ((6, {"arbres", "cassis"}), (7, {"joutera"}), (8, set())),
+)
+def test_get_played_words_by_word_length(
+    app: flask.Flask, word_length: int, expected: set[str]
+):
+    with app.app_context():
+        assert get_played_words_by_word_length(word_length) == expected
+
+
+@freezegun.freeze_time("2023-08-31 12:00:00")
+def test_played_word__date_defaults_to_insert_date(app: flask.Flask):
+    with app.app_context():
+        db.session.add(PlayedWord(word="ecrous", word_length=6))
+        db.session.commit()
+
+        assert (
+            get_first_played_word_by_word_length_and_date(6, "20230831").word
+            == "ecrous"
+        )
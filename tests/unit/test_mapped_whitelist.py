@@ -0,0 +1,63 @@
+import os
+
+import pytest
+
+from wordleapi.core import (
+    MappedWhitelist,
+    Whitelist,
+    compile_whitelist_file,
+    load_whitelist,
+    load_whitelist_file,
+)
+
+WHITELIST_FILE = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "data", "whitelist_6_fr.txt"
+)
+
+
+@pytest.fixture()
+def compiled_whitelist_file(tmp_path) -> str:
+    filename = str(tmp_path / "whitelist_6_fr.bin")
+    assert compile_whitelist_file(WHITELIST_FILE, filename) == 8
+    return filename
+
+
+def test_mapped_whitelist__same_words_as_whitelist_file(compiled_whitelist_file: str):
+    whitelist = load_whitelist_file(WHITELIST_FILE)
+    mapped_whitelist = MappedWhitelist(compiled_whitelist_file)
+
+    assert len(mapped_whitelist) == len(whitelist)
+    assert tuple(mapped_whitelist) == whitelist
+    assert mapped_whitelist[0] == whitelist[0]
+    assert mapped_whitelist[-1] == whitelist[-1]
+    assert mapped_whitelist[1:3] == whitelist[1:3]
+    assert mapped_whitelist.word_length == 6
+    for idx, word in enumerate(whitelist):
+        assert word in mapped_whitelist
+        assert mapped_whitelist.position(word) == idx
+
+
+@pytest.mark.parametrize(
+    "word", ("abatez", "aaaaaa", "zzzzzz", "abaca", "abacasa", "é")
+)
+def test_mapped_whitelist__does_not_contain_other_word(
+    compiled_whitelist_file: str, word: str
+):
+    mapped_whitelist = MappedWhitelist(compiled_whitelist_file)
+
+    assert word not in mapped_whitelist
+    assert mapped_whitelist.position(word) is None
+
+
+def test_mapped_whitelist__invalid_file__raises_value_error(tmp_path):
+    filename = str(tmp_path / "invalid.bin")
+    with open(filename, "wb") as f:
+        f.write(b"not a compiled whitelist file")
+
+    with pytest.raises(ValueError):
+        MappedWhitelist(filename)
+
+
+def test_load_whitelist__loads_file_according_to_extension(compiled_whitelist_file):
+    assert isinstance(load_whitelist(WHITELIST_FILE), Whitelist)
+    assert isinstance(load_whitelist(compiled_whitelist_file), MappedWhitelist)
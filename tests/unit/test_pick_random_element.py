@@ -1,8 +1,8 @@
-from unittest.mock import patch, Mock
+from unittest.mock import Mock, patch
 
 import pytest
 
-from wordleapi.utils import pick_random_element
+from wordleapi.utils import pick_random_element, seed_random
 
 
 @pytest.mark.parametrize(
@@ -38,6 +38,12 @@ def test_pick_random_element(seq: list):
         assert ret in seq, "element should be in sequence"
 
 
+@pytest.fixture()
+def reset_seed():
+    yield
+    seed_random()
+
+
 @pytest.mark.parametrize(
     "seq",
     (
@@ -65,9 +71,18 @@ def test_pick_random_element(seq: list):
         ],
     ),
 )
+def test_pick_random_element__when_seeded__picks_are_reproducible(
+    reset_seed, seq: list
+):
+    seed_random(1987)
+    picks = [pick_random_element(seq) for _ in range(100)]
+    seed_random(1987)
+
+    assert [pick_random_element(seq) for _ in range(100)] == picks
+
+
 @patch("wordleapi.utils.random")
-def test_pick_random_element__seed_is_called(mock_random: Mock, seq: list):
-    pick_random_element(seq)
+def test_pick_random_element__global_generator_is_not_reseeded(mock_random: Mock):
+    pick_random_element(["abacas", "abales"])
 
-    mock_random.seed.assert_called_once(), "random.seed called"
-    mock_random.randrange.assert_called_with(len(seq)), "random.randrange called"
+    mock_random.seed.assert_not_called()
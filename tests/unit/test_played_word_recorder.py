@@ -0,0 +1,69 @@
+import time
+from unittest.mock import patch
+
+import flask
+import pytest
+import sqlalchemy as sa
+
+from wordleapi.db.model import (
+    db,
+    get_first_played_word_by_word_length_and_date,
+    get_played_words_by_word_length,
+)
+from wordleapi.processor import PlayedWordRecorder
+from wordleapi.utils import now_yyyymmdd
+
+
+@pytest.fixture()
+def app(tmp_path) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+
+def _wait_for_played_words(app: flask.Flask, word_length: int, count: int):
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        with app.app_context():
+            if len(get_played_words_by_word_length(word_length)) >= count:
+                return
+        time.sleep(0.01)
+
+
+def test_record__stores_played_word_in_background(app: flask.Flask):
+    recorder = PlayedWordRecorder(app)
+
+    recorder.record("arbres")
+    recorder.record("arbres")
+    recorder.record("joutera")
+
+    _wait_for_played_words(app, 6, 1)
+    _wait_for_played_words(app, 7, 1)
+    with app.app_context():
+        assert (
+            get_first_played_word_by_word_length_and_date(6, now_yyyymmdd()).word
+            == "arbres"
+        )
+        assert get_played_words_by_word_length(7) == {"joutera"}
+
+
+def test_record__when_database_fails__keeps_recording_next_words(app: flask.Flask):
+    recorder = PlayedWordRecorder(app)
+    with patch(
+        "wordleapi.processor.insert_played_word_if_absent",
+        side_effect=[sa.exc.OperationalError("INSERT", {}, Exception("locked"))],
+    ) as mock_insert:
+        recorder.record("arbres")
+        deadline = time.time() + 5
+        while mock_insert.call_count == 0 and time.time() < deadline:
+            time.sleep(0.01)
+
+    recorder.record("joutera")
+
+    _wait_for_played_words(app, 7, 1)
+    with app.app_context():
+        assert get_played_words_by_word_length(6) == set()
+        assert get_played_words_by_word_length(7) == {"joutera"}
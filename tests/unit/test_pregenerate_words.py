@@ -0,0 +1,92 @@
+import threading
+
+import flask
+import freezegun
+import pytest
+
+from wordleapi.core import pregenerate_words
+from wordleapi.db.model import (
+    PlayedWord,
+    db,
+    delete_played_word_by_word_length,
+    get_first_played_word_by_word_length_and_date,
+    insert_played_word_if_absent,
+)
+
+WHITELIST = ("arbres", "cassis", "ecrous", "joutes", "mardis", "retame", "zestes")
+
+
+@pytest.fixture()
+def app(tmp_path) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {"connect_args": {"timeout": 30}}
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+
+@freezegun.freeze_time("2023-08-31")
+def test_pregenerate_words__generates_one_distinct_word_per_day(app: flask.Flask):
+    with app.app_context():
+        words = pregenerate_words(WHITELIST, 3)
+
+        assert list(words) == ["20230831", "20230901", "20230902"]
+        assert len(set(words.values())) == 3
+        for date, word in words.items():
+            assert word in WHITELIST
+            assert get_first_played_word_by_word_length_and_date(6, date).word == word
+
+
+@freezegun.freeze_time("2023-08-31")
+def test_pregenerate_words__keeps_already_generated_words(app: flask.Flask):
+    with app.app_context():
+        insert_played_word_if_absent("mardis", 6, "20230901")
+
+        words = pregenerate_words(WHITELIST, 2)
+        assert words["20230901"] == "mardis"
+        assert pregenerate_words(WHITELIST, 3) == {
+            **words,
+            "20230902": get_first_played_word_by_word_length_and_date(
+                6, "20230902"
+            ).word,
+        }
+        assert db.session.query(PlayedWord).count() == 3
+
+
+@freezegun.freeze_time("2023-08-31")
+def test_pregenerate_words__concurrent_runs_agree_on_words(app: flask.Flask):
+    results = []
+
+    def run():
+        with app.app_context():
+            results.append(pregenerate_words(WHITELIST, 3))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 4
+    assert all(words == results[0] for words in results)
+    with app.app_context():
+        assert db.session.query(PlayedWord).count() == 3
+
+
+def test_delete_played_word_by_word_length__keeps_words_from_date(app: flask.Flask):
+    with app.app_context():
+        insert_played_word_if_absent("arbres", 6, "20230830")
+        insert_played_word_if_absent("cassis", 6, "20230831")
+        insert_played_word_if_absent("ecrous", 6, "20230901")
+        insert_played_word_if_absent("joutera", 7, "20230830")
+
+        delete_played_word_by_word_length(6, keep_from_date="20230831")
+        db.session.commit()
+
+        assert {(w.word, w.date) for w in db.session.query(PlayedWord).all()} == {
+            ("cassis", "20230831"),
+            ("ecrous", "20230901"),
+            ("joutera", "20230830"),
+        }
@@ -0,0 +1,76 @@
+from unittest.mock import Mock, patch
+
+import flask
+import pytest
+
+from wordleapi import log
+from wordleapi.core import compute_attempt_result, set_hooks
+from wordleapi.log import configure_logging, request_log_enabled
+
+
+@pytest.fixture(autouse=True)
+def restore_log_state(monkeypatch):
+    # configure_logging updates module state
+    monkeypatch.setattr(log, "_min_level_no", log._min_level_no)
+    monkeypatch.setattr(log, "_request_sample_rate", log._request_sample_rate)
+    monkeypatch.setattr(log, "_handler_id", log._handler_id)
+
+
+@pytest.mark.parametrize("level", ("INFO", "WARNING", "ERROR"))
+@patch("wordleapi.log.random.random")
+def test_request_log_enabled__if_debug_is_disabled__returns_false(
+    mock_random: Mock, level: str
+):
+    configure_logging(level)
+
+    assert not request_log_enabled()
+    mock_random.assert_not_called(), "should not sample request"
+
+
+@pytest.mark.parametrize("level", ("TRACE", "DEBUG"))
+def test_request_log_enabled__if_debug_is_enabled__returns_true(level: str):
+    configure_logging(level)
+
+    assert request_log_enabled()
+
+
+@patch("wordleapi.log.random.random")
+def test_request_log_enabled__samples_requests(mock_random: Mock):
+    configure_logging("DEBUG", 0.25)
+
+    mock_random.return_value = 0.1
+    assert request_log_enabled()
+    mock_random.return_value = 0.5
+    assert not request_log_enabled()
+
+
+@patch("wordleapi.log.random.random")
+def test_request_log_enabled__samples_each_request_once(mock_random: Mock):
+    configure_logging("DEBUG", 0.25)
+    app = flask.Flask(__name__)
+
+    mock_random.return_value = 0.1
+    with app.test_request_context():
+        assert request_log_enabled()
+        mock_random.return_value = 0.5
+        assert request_log_enabled()
+    with app.test_request_context():
+        assert not request_log_enabled()
+        mock_random.return_value = 0.1
+        assert not request_log_enabled()
+
+    assert mock_random.call_count == 2
+
+
+@pytest.mark.parametrize("enabled", (False, True))
+@patch("wordleapi.core.loguru.logger")
+def test_compute_attempt_result__logs_if_request_log_is_enabled(
+    mock_logger: Mock, enabled: bool
+):
+    set_hooks(request_log_enabled=lambda: enabled)
+    try:
+        compute_attempt_result("arbres", "arbres")
+    finally:
+        set_hooks()
+
+    assert mock_logger.debug.called == enabled
@@ -0,0 +1,32 @@
+import os
+
+import flask
+import pytest
+
+from wordleapi.db.model import db, reset_engines_after_fork
+
+
+@pytest.fixture()
+def app(tmp_path) -> flask.Flask:
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+    yield app
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_reset_engines_after_fork__forked_process_does_not_reuse_pool_connections(
+    app: flask.Flask,
+):
+    with app.app_context():
+        reset_engines_after_fork()
+        db.engine.connect().close()
+        assert db.engine.pool.checkedin() == 1, "parent pool holds a connection"
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(0 if db.engine.pool.checkedin() == 0 else 1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0, "child pool should be empty"
+        assert db.engine.pool.checkedin() == 1, "parent pool is not affected"
@@ -0,0 +1,18 @@
+import flask
+import sqlalchemy as sa
+
+from wordleapi.db.model import db, set_sqlite_pragmas
+
+
+def test_set_sqlite_pragmas__sets_pragmas_of_new_connections(tmp_path):
+    app = flask.Flask(__name__)
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{tmp_path / 'test.db'}"
+    db.init_app(app)
+
+    with app.app_context():
+        set_sqlite_pragmas("WAL", "NORMAL", 1234)
+
+        assert db.session.execute(sa.text("PRAGMA journal_mode")).scalar() == "wal"
+        # NORMAL
+        assert db.session.execute(sa.text("PRAGMA synchronous")).scalar() == 1
+        assert db.session.execute(sa.text("PRAGMA busy_timeout")).scalar() == 1234
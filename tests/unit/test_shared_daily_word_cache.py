@@ -0,0 +1,52 @@
+from wordleapi.core import SharedDailyWordCache
+
+
+def test_shared_daily_word_cache__set_then_get_from_other_cache__returns_word(
+    tmp_path,
+):
+    filename = str(tmp_path / "daily_words.bin")
+    cache = SharedDailyWordCache(filename)
+    other_cache = SharedDailyWordCache(filename)
+    cache.set(6, "20230807", "arbres")
+    cache.set(8, "20230807", "retameur")
+
+    assert other_cache.get(6, "20230807") == "arbres"
+    assert other_cache.get(8, "20230807") == "retameur"
+    assert other_cache.get(7, "20230807") is None
+    assert other_cache.get(6, "20230808") is None, "other date should be missing"
+
+
+def test_shared_daily_word_cache__set_new_date__replaces_word_of_other_caches(
+    tmp_path,
+):
+    filename = str(tmp_path / "daily_words.bin")
+    cache = SharedDailyWordCache(filename)
+    other_cache = SharedDailyWordCache(filename)
+    cache.set(6, "20230807", "arbres")
+    assert other_cache.get(6, "20230807") == "arbres"
+
+    cache.set(6, "20230808", "cassis")
+
+    assert other_cache.get(6, "20230808") == "cassis"
+
+
+def test_shared_daily_word_cache__corrupted_slot__returns_none(tmp_path):
+    filename = tmp_path / "daily_words.bin"
+    SharedDailyWordCache(str(filename)).set(6, "20230807", "arbres")
+    data = bytearray(filename.read_bytes())
+    # torn write: word partially overwritten
+    data[data.index(b"arbres")] = ord("x")
+    filename.write_bytes(bytes(data))
+
+    assert SharedDailyWordCache(str(filename)).get(6, "20230807") is None
+
+
+def test_shared_daily_word_cache__clear__removes_shared_words(tmp_path):
+    filename = str(tmp_path / "daily_words.bin")
+    cache = SharedDailyWordCache(filename)
+    cache.set(6, "20230807", "arbres")
+
+    cache.clear()
+
+    assert cache.get(6, "20230807") is None
+    assert SharedDailyWordCache(filename).get(6, "20230807") is None
@@ -0,0 +1,113 @@
+import threading
+import time
+
+import pytest
+
+from wordleapi.core import SingleFlight
+
+
+def test_do__concurrent_calls_with_same_key__run_once():
+    single_flight = SingleFlight()
+    calls = []
+    results = []
+
+    def fn():
+        calls.append(1)
+        time.sleep(0.1)
+        return "arbres"
+
+    threads = [
+        threading.Thread(target=lambda: results.append(single_flight.do(6, fn)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["arbres"] * 8
+
+
+def test_do__calls_with_different_keys__run_each():
+    single_flight = SingleFlight()
+
+    assert single_flight.do(6, lambda: "arbres") == "arbres"
+    assert single_flight.do(7, lambda: "joutera") == "joutera"
+
+
+def test_do__completed_call__runs_again():
+    single_flight = SingleFlight()
+    calls = []
+
+    single_flight.do(6, lambda: calls.append(1))
+    single_flight.do(6, lambda: calls.append(1))
+
+    assert len(calls) == 2
+
+
+def test_do__when_call_fails__waiting_callers_get_exception():
+    single_flight = SingleFlight()
+    errors = []
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        time.sleep(0.1)
+        raise RuntimeError("generation failed")
+
+    def call():
+        try:
+            single_flight.do(6, fn)
+        except RuntimeError as e:
+            errors.append(e)
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=call) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(errors) == 4
+
+    with pytest.raises(RuntimeError):
+        single_flight.do(6, fn)
+
+
+def test_do__when_call_is_interrupted__waiting_callers_are_not_interrupted():
+    single_flight = SingleFlight()
+    leader_errors = []
+    follower_errors = []
+    started = threading.Event()
+
+    def fn():
+        started.set()
+        time.sleep(0.1)
+        raise SystemExit
+
+    def lead():
+        try:
+            single_flight.do(6, fn)
+        except SystemExit as e:
+            leader_errors.append(e)
+
+    def follow():
+        try:
+            single_flight.do(6, fn)
+        except RuntimeError as e:
+            follower_errors.append(e)
+
+    leader = threading.Thread(target=lead)
+    leader.start()
+    started.wait()
+    followers = [threading.Thread(target=follow) for _ in range(3)]
+    for thread in followers:
+        thread.start()
+    for thread in [leader, *followers]:
+        thread.join()
+
+    assert len(leader_errors) == 1
+    assert [type(e) for e in follower_errors] == [RuntimeError] * 3
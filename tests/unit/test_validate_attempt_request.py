@@ -0,0 +1,63 @@
+import json
+
+import pydantic
+import pytest
+
+from wordleapi.schemas import (
+    AttemptRequest,
+    make_validation_error,
+    validate_attempt_request,
+)
+
+
+def _pydantic_validate(payload) -> tuple[str | None, bytes | None]:
+    try:
+        return AttemptRequest.model_validate(payload).attempt, None
+    except pydantic.ValidationError as e:
+        return None, make_validation_error(e).model_dump_json().encode()
+
+
+@pytest.mark.parametrize(
+    "payload",
+    (
+        {},
+        {"other": "abcdef"},
+        {"attempt": None},
+        {"attempt": 123456},
+        {"attempt": 1.5},
+        {"attempt": True},
+        {"attempt": ["abcdef"]},
+        {"attempt": {"attempt": "abcdef"}},
+        {"attempt": ""},
+        {"attempt": "abc"},
+        {"attempt": "ab1"},
+        {"attempt": "abcdefghi"},
+        {"attempt": "abcdefghi1"},
+        {"attempt": "abcdéf"},
+        {"attempt": "abc def"},
+        {"attempt": "abcdef\n"},
+        {"attempt": "abcde1"},
+        {"attempt": "ÀBCDEF"},
+        {"attempt": "abcdef"},
+        {"attempt": "ABCDEFG"},
+        {"attempt": "ArBrEsXy"},
+        {"attempt": "abcdef", "other": 1},
+    ),
+)
+def test_validate_attempt_request__matches_pydantic_validation(payload: dict):
+    assert validate_attempt_request(json.dumps(payload).encode()) == _pydantic_validate(
+        payload
+    )
+    # non ASCII characters as is
+    assert validate_attempt_request(
+        json.dumps(payload, ensure_ascii=False).encode()
+    ) == _pydantic_validate(payload)
+
+
+@pytest.mark.parametrize(
+    "body", (b"", b"null", b"[]", b'["abcdef"]', b'"abcdef"', b"{", b"\xff", b"123")
+)
+def test_validate_attempt_request__if_body_is_not_a_json_object__returns_missing_attempt_error(
+    body: bytes,
+):
+    assert validate_attempt_request(body) == _pydantic_validate({})
@@ -0,0 +1,37 @@
+import pytest
+
+from wordleapi.core import Whitelist
+
+WORDS = ("abacas", "abales", "abaque", "abasie")
+
+
+def test_whitelist__behaves_like_tuple():
+    whitelist = Whitelist(WORDS)
+
+    assert whitelist == WORDS
+    assert len(whitelist) == len(WORDS)
+    assert whitelist[0] == WORDS[0]
+    assert whitelist[-1] == WORDS[-1]
+    assert list(whitelist) == list(WORDS)
+    assert set(whitelist) == set(WORDS)
+
+
+@pytest.mark.parametrize("word", WORDS)
+def test_whitelist__contains_whitelisted_word(word: str):
+    whitelist = Whitelist(WORDS)
+
+    assert word in whitelist
+    assert whitelist.position(word) == WORDS.index(word)
+
+
+@pytest.mark.parametrize("word", ("abatee", "ABACAS", "abaca", ""))
+def test_whitelist__does_not_contain_other_word(word: str):
+    whitelist = Whitelist(WORDS)
+
+    assert word not in whitelist
+    assert whitelist.position(word) is None
+
+
+def test_whitelist__word_length():
+    assert Whitelist(WORDS).word_length == 6
+    assert Whitelist().word_length == 0
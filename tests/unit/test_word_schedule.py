@@ -0,0 +1,67 @@
+import json
+
+import pytest
+
+from wordleapi.core import load_word_schedule, write_word_schedule
+
+WORDS = {
+    6: {"20230831": "arbres", "20230901": "cassis"},
+    7: {"20230831": "joutera"},
+}
+
+
+@pytest.fixture()
+def schedule_file(tmp_path) -> str:
+    filename = str(tmp_path / "schedule.json")
+    write_word_schedule(filename, WORDS, "secret")
+    return filename
+
+
+def test_load_word_schedule__success(schedule_file: str):
+    schedule = load_word_schedule(schedule_file, "secret")
+
+    assert schedule.words_by_word_length == WORDS
+    assert schedule.select(("arbres", "cassis"), "20230901") == "cassis"
+    assert schedule.select(("joutera",), "20230831") == "joutera"
+    assert schedule.last_date(6) == "20230901"
+
+
+@pytest.mark.parametrize(
+    "whitelist,date",
+    ((("arbres", "cassis"), "20230902"), (("retameur",), "20230831")),
+)
+def test_select__when_word_is_not_scheduled__returns_none(
+    schedule_file: str, whitelist: tuple[str], date: str
+):
+    assert load_word_schedule(schedule_file, "secret").select(whitelist, date) is None
+
+
+def test_load_word_schedule__when_secret_differs__raises_value_error(
+    schedule_file: str,
+):
+    with pytest.raises(ValueError, match="signature"):
+        load_word_schedule(schedule_file, "other secret")
+
+
+def test_load_word_schedule__when_words_are_modified__raises_value_error(
+    schedule_file: str,
+):
+    with open(schedule_file) as f:
+        content = json.load(f)
+    content["words"]["6"]["20230901"] = "ecrous"
+    with open(schedule_file, "w") as f:
+        json.dump(content, f)
+
+    with pytest.raises(ValueError, match="signature"):
+        load_word_schedule(schedule_file, "secret")
+
+
+@pytest.mark.parametrize("content", ("not json", "{}", '{"words": {}}', "[]"))
+def test_load_word_schedule__when_file_is_invalid__raises_value_error(
+    tmp_path, content: str
+):
+    filename = tmp_path / "schedule.json"
+    filename.write_text(content)
+
+    with pytest.raises(ValueError, match="Invalid word schedule file"):
+        load_word_schedule(str(filename), "secret")
@@ -1,143 +1,70 @@
-import enum
 import os
+import time
 
 import dotenv
 import flask
-import flask_openapi3
 import flask_cors
+import flask_openapi3
 import loguru
 import pydantic
+import sqlalchemy as sa
 import werkzeug
 
 from wordleapi.core import (
-    ATTEMPT_REGEX,
-    compute_attempt_result,
-    get_today_word,
-    load_whitelist_file,
     AVAILABLE_WORD_LENGTHS,
-    LetterPositionStatus as LPS,
+    DeterministicWordSelector,
+    MappedWhitelist,
+    Whitelist,
+    load_whitelist,
+    load_word_schedule,
+    set_hooks,
 )
-from wordleapi.db.model import db
-from wordleapi.env import DotEnvKey, check_dot_env
-
-
-class AttemptRequest(pydantic.BaseModel):
-    """Player attempt request to process."""
-
-    attempt: str = pydantic.Field(
-        title="Player attempt",
-        description="Player attempt to process.",
-        pattern=ATTEMPT_REGEX,
-        min_length=min(AVAILABLE_WORD_LENGTHS),
-        max_length=max(AVAILABLE_WORD_LENGTHS),
-    )
-
-    model_config = {
-        "openapi_extra": {
-            "examples": {
-                "req-1": {
-                    "summary": "1 - Valid attempt request (correct guess)",
-                    "value": {"attempt": "ARBRES"},
-                },
-                "req-2": {
-                    "summary": "2 - Valid attempt request (incorrect guess)",
-                    "value": {"attempt": "ARTERE"},
-                },
-                "req-3": {
-                    "summary": "3 - Invalid attempt request (attempt is too short)",
-                    "value": {"attempt": "ARB"},
-                },
-                "req-4": {
-                    "summary": "4 - Invalid attempt request (attempt is not a whitelisted word)",
-                    "value": {"attempt": "ABCDEF"},
-                },
-            }
-        }
-    }
-
-
-class AttemptResponse(pydantic.BaseModel):
-    """Player attempt result response."""
-
-    result: list[LPS] = pydantic.Field(
-        title="Attempt result",
-        description=f"Contains position status for each letter from request attempt:"
-        f"{LPS.__doc__}",
-    )
-
-    model_config = {
-        "openapi_extra": {
-            "description": "Player attempt result",
-            "examples": {
-                "resp-1": {
-                    "summary": "1 - Valid attempt response (correct guess)",
-                    "value": {"result": [0, 0, 0, 0, 0, 0]},
-                },
-                "resp-2": {
-                    "summary": "2 - Valid attempt response (incorrect guess)",
-                    "value": {"result": [0, 0, 2, 1, 1, 2]},
-                },
-            },
-        }
-    }
-
-
-class ErrorCode(enum.Enum):
-    """
-    100 (invalid payload),
-    101 (attempt not in whitelist)
-    102 (HTTP method not allowed)
-    """
-
-    INVALID_PAYLOAD = 100
-    ATTEMPT_NOT_IN_WHITELIST = 101
-    METHOD_NOT_ALLOWED = 102
-
-
-class ErrorResponse(pydantic.BaseModel):
-    """API error response."""
-
-    code: ErrorCode = pydantic.Field(
-        title="API error code",
-        description="Computer friendly error code:" f"{ErrorCode.__doc__}",
-    )
-    error_msg: str = pydantic.Field(
-        title="API error message",
-        description="Human readable descriptive error message",
-    )
-
-    model_config = {
-        "openapi_extra": {
-            "description": "An error occurred",
-            "examples": {
-                "resp-3": {
-                    "summary": "3 - Invalid attempt response (attempt is too short) (HTTP 422)",
-                    "value": {
-                        "code": 100,
-                        "error_msg": f"Field 'attempt' is invalid or missing (String should have at least {min(AVAILABLE_WORD_LENGTHS)} characters)",
-                    },
-                },
-                "resp-4": {
-                    "summary": "4 - Invalid attempt response (attempt is not a whitelisted word) (HTTP 422)",
-                    "value": {"code": 101, "error_msg": "'ABCDEF' is not in whitelist"},
-                },
-                "resp-5": {
-                    "summary": "5 - Invalid HTTP method (HTTP 405)",
-                    "value": {
-                        "code": 102,
-                        "error_msg": "Method not allowed, accepted methods are ['OPTIONS', 'POST']",
-                    },
-                },
-            },
-        }
-    }
+from wordleapi.db.model import (
+    db,
+    ensure_played_word_date_unique,
+    make_engine_options,
+    reset_engines_after_fork,
+    set_sqlite_pragmas,
+)
+from wordleapi.env import (
+    DotEnvKey,
+    check_dot_env,
+    get_dot_env,
+    get_dot_env_bool,
+    get_dot_env_int,
+)
+from wordleapi.log import configure_logging, request_log_enabled
+from wordleapi.metrics import (
+    InstrumentedQueuePool,
+    Stage,
+    count_attempt,
+    generate_metrics,
+    instrument_db_pools,
+    instrument_db_queries,
+    observe_request,
+    observe_stage,
+)
+from wordleapi.processor import AttemptProcessor, PlayedWordRecorder, WhitelistWatcher
+from wordleapi.schemas import (
+    AttemptRequest,
+    AttemptResponse,
+    AttemptsRequest,
+    AttemptsResponse,
+    CandidatesRequest,
+    CandidatesResponse,
+    ErrorCode,
+    ErrorResponse,
+    HardAttemptRequest,
+    encode_attempts_response,
+    encode_method_not_allowed_error,
+    make_validation_error,
+    validate_attempt_request,
+)
+from wordleapi.utils import seed_random
 
 
-def _build_json_response(data: str, status_code: int) -> flask.Response:
-    response = flask.make_response(data)
-    response.headers["Content-Type"] = "application/json"
-    response.status_code = status_code
-    return response
+def _build_json_response(data: str | bytes, status_code: int) -> flask.Response:
+    return flask.Response(data, status=status_code, content_type="application/json")
 
 
 def make_validation_error_response(e: pydantic.ValidationError) -> flask.Response:
@@ -150,13 +77,10 @@ def make_validation_error_response(e: pydantic.ValidationError) -> flask.Respons
     Returns:
         FlaskResponse: A Flask Response object with the JSON representation of the error.
     """
-    return _build_json_response(
-        ErrorResponse(
-            code=ErrorCode.INVALID_PAYLOAD,
-            error_msg=f"Field '{e.errors()[0].get('loc')[0]}' is invalid or missing ({e.errors()[0].get('msg')})",
-        ).model_dump_json(),
-        422,
-    )
+    if "request_start" in flask.g:
+        observe_stage(Stage.VALIDATION, flask.g.request_start)
+    count_attempt(None, ErrorCode.INVALID_PAYLOAD.name)
+    return _build_json_response(make_validation_error(e).model_dump_json(), 422)
 
 
 def create_app() -> flask_openapi3.OpenAPI:
@@ -173,6 +97,15 @@ def create_app() -> flask_openapi3.OpenAPI:
     check_dot_env()
     loguru.logger.info("Required env variables loaded")
 
+    # LOGGING configuration (queued handler, sampled request logs)
+    configure_logging(
+        get_dot_env(DotEnvKey.LOG_LEVEL),
+        float(get_dot_env(DotEnvKey.LOG_REQUEST_SAMPLE_RATE)),
+        get_dot_env_bool(DotEnvKey.LOG_JSON),
+    )
+    set_hooks(request_log_enabled=request_log_enabled, observe_stage=observe_stage)
+    loguru.logger.info("Logging configured")
+
     app = flask_openapi3.OpenAPI(
         __name__, validation_error_callback=make_validation_error_response
     )
@@ -184,15 +117,49 @@ def create_app() -> flask_openapi3.OpenAPI:
     # DATABASE initialization
     loguru.logger.info("Init database")
     app.config["SQLALCHEMY_DATABASE_URI"] = os.getenv(DotEnvKey.DATABASE_URI.value)
+    app.config["SQLALCHEMY_ENGINE_OPTIONS"] = make_engine_options(
+        app.config["SQLALCHEMY_DATABASE_URI"],
+        pool_size=get_dot_env_int(DotEnvKey.DB_POOL_SIZE),
+        max_overflow=get_dot_env_int(DotEnvKey.DB_MAX_OVERFLOW),
+        pool_timeout=get_dot_env_int(DotEnvKey.DB_POOL_TIMEOUT),
+        pool_recycle=get_dot_env_int(DotEnvKey.DB_POOL_RECYCLE),
+        pool_pre_ping=get_dot_env_bool(DotEnvKey.DB_POOL_PRE_PING),
+        statement_timeout_ms=get_dot_env_int(DotEnvKey.DB_STATEMENT_TIMEOUT_MS),
+        poolclass=InstrumentedQueuePool,
+    )
     db.init_app(app)
+    instrument_db_queries()
+    instrument_db_pools()
     with app.app_context():
+        set_sqlite_pragmas(
+            get_dot_env(DotEnvKey.SQLITE_JOURNAL_MODE),
+            get_dot_env(DotEnvKey.SQLITE_SYNCHRONOUS),
+            get_dot_env_int(DotEnvKey.SQLITE_BUSY_TIMEOUT_MS),
+        )
         db.create_all()
+        try:
+            if ensure_played_word_date_unique():
+                loguru.logger.info(
+                    "Unique index on played words word length and date created"
+                )
+        except sa.exc.IntegrityError as e:
+            loguru.logger.error(
+                "Failed to create unique index on played words word length and date, remove played words with same "
+                "word length and date: {}",
+                e,
+            )
+            return None
+        reset_engines_after_fork()
 
     # WHITELIST FILES loading (contains playable words)
-    whitelists_by_word_length = {
-        6: load_whitelist_file(os.getenv(DotEnvKey.WHITELIST_FILE_6_LETTERS.value)),
-        7: load_whitelist_file(os.getenv(DotEnvKey.WHITELIST_FILE_7_LETTERS.value)),
-        8: load_whitelist_file(os.getenv(DotEnvKey.WHITELIST_FILE_8_LETTERS.value)),
+    whitelist_files = {
+        6: os.getenv(DotEnvKey.WHITELIST_FILE_6_LETTERS.value),
+        7: os.getenv(DotEnvKey.WHITELIST_FILE_7_LETTERS.value),
+        8: os.getenv(DotEnvKey.WHITELIST_FILE_8_LETTERS.value),
+    }
+    whitelists_by_word_length: dict[int, Whitelist | MappedWhitelist] = {
+        word_length: load_whitelist(filename)
+        for word_length, filename in whitelist_files.items()
     }
     if list(whitelists_by_word_length.keys()) != AVAILABLE_WORD_LENGTHS:
         loguru.logger.error(
@@ -200,6 +167,98 @@ def create_app() -> flask_openapi3.OpenAPI:
         )
         return None
 
+    # WORD SELECTION (random non-played word stored in database, deterministic word computed from secret or word
+    # loaded from signed schedule file)
+    word_selector = None
+    word_selection = get_dot_env(DotEnvKey.WORD_SELECTION).lower()
+    secret = get_dot_env(DotEnvKey.WORD_SELECTION_SECRET)
+    if word_selection != "random" and not secret:
+        loguru.logger.error(
+            "Missing WORD_SELECTION_SECRET env variable (required by {} word selection)",
+            word_selection,
+        )
+        return None
+    if word_selection == "deterministic":
+        word_selector = DeterministicWordSelector(secret)
+    elif word_selection == "schedule":
+        schedule_file = get_dot_env(DotEnvKey.WORD_SCHEDULE_FILE)
+        if not schedule_file:
+            loguru.logger.error(
+                "Missing WORD_SCHEDULE_FILE env variable (required by schedule word selection)"
+            )
+            return None
+        try:
+            word_selector = load_word_schedule(schedule_file, secret)
+        except (OSError, ValueError) as e:
+            loguru.logger.error("Failed to load word schedule file: {}", e)
+            return None
+        for word_length, words in word_selector.words_by_word_length.items():
+            whitelist = whitelists_by_word_length.get(word_length)
+            if whitelist is None or any(w not in whitelist for w in words.values()):
+                loguru.logger.error(
+                    "Invalid word schedule file, {} letters words are not whitelisted",
+                    word_length,
+                )
+                return None
+    seed = get_dot_env(DotEnvKey.WORD_SELECTION_SEED)
+    seed_random(int(seed) if seed else None)
+
+    # ATTEMPT processing (daily word cache, optional precomputed feedback tables)
+    attempt_processor = AttemptProcessor(
+        whitelists_by_word_length,
+        precomputed_feedback=get_dot_env_bool(DotEnvKey.PRECOMPUTED_FEEDBACK),
+        word_selector=word_selector,
+        played_word_recorder=(
+            PlayedWordRecorder(app)
+            if word_selector is not None
+            and get_dot_env_bool(DotEnvKey.PLAYED_WORD_WRITE_BEHIND)
+            else None
+        ),
+        generation_lock_dir=get_dot_env(DotEnvKey.WORD_GENERATION_LOCK_DIR) or None,
+        shared_cache_dir=get_dot_env(DotEnvKey.SHARED_CACHE_DIR),
+    )
+    if attempt_processor.precomputed_feedback:
+        loguru.logger.info("Build precomputed feedback tables")
+        with app.app_context():
+            attempt_processor.build_feedback_tables()
+    if isinstance(word_selector, DeterministicWordSelector):
+        # compute today words at startup (word selector permutations are built once)
+        for word_length in whitelists_by_word_length:
+            attempt_processor.get_today_word(word_length)
+    app.extensions["attempt_processor"] = attempt_processor
+
+    # WHITELIST FILES reloading (watcher thread started by first request of each process)
+    reload_interval = get_dot_env_int(DotEnvKey.WHITELIST_RELOAD_INTERVAL)
+    if reload_interval and word_selector is not None:
+        loguru.logger.error(
+            "WHITELIST_RELOAD_INTERVAL env variable is not supported by {} word selection (daily words depend on "
+            "whitelists loaded at startup)",
+            word_selection,
+        )
+        return None
+    if reload_interval:
+        whitelist_watcher = WhitelistWatcher(
+            app, attempt_processor, whitelist_files, reload_interval
+        )
+        app.before_request(whitelist_watcher.ensure_started)
+        app.extensions["whitelist_watcher"] = whitelist_watcher
+    app.config["FAST_VALIDATION"] = get_dot_env_bool(DotEnvKey.FAST_VALIDATION)
+
+    # METRICS (request duration and count, see also /metrics route)
+    @app.before_request
+    def start_request_timer():
+        flask.g.request_start = time.perf_counter()
+
+    @app.after_request
+    def observe_request_metrics(response: flask.Response):
+        rule = flask.request.url_rule
+        observe_request(
+            rule.rule if rule is not None else "other",
+            response.status_code,
+            flask.g.request_start,
+        )
+        return response
+
     # ROUTES
     loguru.logger.info("Init API route")
 
@@ -279,30 +338,131 @@ def create_app() -> flask_openapi3.OpenAPI:
         Response <= { "code": 101, "error_msg": "'ABCDEF' is not in whitelist" }
         </pre>
         """
-        whitelist = whitelists_by_word_length.get(len(body.attempt))
-        attempt = body.attempt.lower()
-        if attempt not in whitelist:
-            return _build_json_response(
-                ErrorResponse(
-                    code=ErrorCode.ATTEMPT_NOT_IN_WHITELIST,
-                    error_msg=f"'{body.attempt}' is not in whitelist",
-                ).model_dump_json(),
-                422,
-            )
-        word = get_today_word(whitelist)
-        attempt_result = compute_attempt_result(attempt, word)
-        return _build_json_response(
-            AttemptResponse(result=attempt_result).model_dump_json(),
-            200,
+        observe_stage(Stage.VALIDATION, flask.g.request_start)
+        status_code, data = attempt_processor.process(body.attempt, {})
+        return _build_json_response(data, status_code)
+
+    def post_attempt_fast():
+        """post_attempt with request body validated by validate_attempt_request instead of flask_openapi3"""
+        attempt, error = validate_attempt_request(flask.request.get_data(cache=False))
+        observe_stage(Stage.VALIDATION, flask.g.request_start)
+        if error is not None:
+            count_attempt(None, ErrorCode.INVALID_PAYLOAD.name)
+            return _build_json_response(error, 422)
+        status_code, data = attempt_processor.process(attempt, {})
+        return _build_json_response(data, status_code)
+
+    if app.config["FAST_VALIDATION"]:
+        # same route and OpenAPI documentation, only the view function is replaced
+        loguru.logger.info("Enable /attempt fast validation")
+        app.view_functions["post_attempt"] = post_attempt_fast
+
+    @app.post(
+        "/attempts",
+        responses={
+            200: AttemptsResponse,
+            405: ErrorResponse,
+            422: ErrorResponse,
+            "default": None,
+        },
+    )
+    def post_attempts(body: AttemptsRequest):
+        """
+        Process a batch of player attempts
+
+        Same as /attempt for several attempts at once (e.g. to replay a saved game or sync offline play).
+        Attempts may have different lengths, each one is checked against today word of its length.
+
+        Response contains one item per request attempt (in request order), either its result or its error
+        (same result and errors as /attempt).
+        HTTP 422 is only returned when the batch itself is invalid (e.g. missing, empty or too many attempts).
+        """
+        today_words_by_word_length = {}
+        results = []
+        for attempt in body.attempts:
+            try:
+                attempt = AttemptRequest(attempt=attempt).attempt
+            except pydantic.ValidationError as e:
+                count_attempt(None, ErrorCode.INVALID_PAYLOAD.name)
+                results.append(make_validation_error(e).model_dump_json().encode())
+                continue
+            _, data = attempt_processor.process(attempt, today_words_by_word_length)
+            results.append(data)
+        return _build_json_response(encode_attempts_response(results), 200)
+
+    @app.post(
+        "/hard-attempt",
+        responses={
+            200: AttemptResponse,
+            405: ErrorResponse,
+            422: ErrorResponse,
+            "default": None,
+        },
+    )
+    def post_hard_attempt(body: HardAttemptRequest):
+        """
+        Process player attempt in hard mode
+
+        Same as /attempt, except attempt must take into account results of player previous attempts:
+        well-placed letters must stay in place, misplaced letters must be reused (elsewhere) and letters which are
+        not present (or not present as many times as used) must not be used (again).
+        Previous attempt results are computed against today word by the API, clients only send previous attempts.
+
+        Attempt violating these constraints is rejected with HTTP 422 (error code 103), first violated constraint is
+        described in error message.
+
+        Word to guess is 'ARBRES'
+        <pre>
+        Request  => { "attempt": "ABIMER", "previous_attempts": ["ARTERE"] }
+        Response <= { "code": 103, "error_msg": "'ABIMER' violates hard mode (letter 2 must be 'r')" }
+        </pre>
+        """
+        observe_stage(Stage.VALIDATION, flask.g.request_start)
+        status_code, data = attempt_processor.process_hard_mode(
+            body.attempt, body.previous_attempts
+        )
+        return _build_json_response(data, status_code)
+
+    @app.post(
+        "/candidates",
+        responses={
+            200: CandidatesResponse,
+            405: ErrorResponse,
+            422: ErrorResponse,
+            "default": None,
+        },
+    )
+    def post_candidates(body: CandidatesRequest):
+        """
+        Query words which could still be today word
+
+        Returns how many whitelisted words are consistent with results of player previous attempts (words which
+        satisfy hard mode constraints, see /hard-attempt) and, optionally, a page of them (in whitelist order),
+        e.g. to display remaining possibilities or hints.
+        Previous attempt results are computed against today word by the API, clients only send previous attempts.
+
+        Word to guess is 'ARBRES'
+        <pre>
+        Request  => { "word_length": 6, "previous_attempts": ["ARTERE"], "limit": 10 }
+        Response <= { "count": 7, "words": ["araser", "arbres", "archer", "arguer", "ariser", "arquer", "arrhes"] }
+        </pre>
+        """
+        observe_stage(Stage.VALIDATION, flask.g.request_start)
+        data = attempt_processor.query_candidates(
+            body.word_length, body.previous_attempts, body.offset, body.limit
         )
+        return _build_json_response(data, 200)
+
+    @app.route("/metrics")
+    def get_metrics():
+        """Prometheus metrics (not documented in OpenAPI spec)"""
+        data, content_type = generate_metrics()
+        return flask.Response(data, content_type=content_type)
 
     @app.errorhandler(405)
     def handle_405(e: werkzeug.exceptions.MethodNotAllowed):
         return _build_json_response(
-            ErrorResponse(
-                code=ErrorCode.METHOD_NOT_ALLOWED,
-                error_msg=f"Method not allowed, accepted methods are {e.valid_methods}",
-            ).model_dump_json(),
+            encode_method_not_allowed_error(tuple(e.valid_methods)),
             405,
         )
 
@@ -0,0 +1,183 @@
+import asyncio
+import json
+import time
+
+import flask
+import loguru
+import pydantic
+from asgiref.wsgi import WsgiToAsgi
+
+from wordleapi.api import create_app
+from wordleapi.metrics import Stage, count_attempt, observe_request, observe_stage
+from wordleapi.processor import AttemptProcessor
+from wordleapi.schemas import (
+    AttemptRequest,
+    ErrorCode,
+    make_validation_error,
+    validate_attempt_request,
+)
+from wordleapi.utils import now_yyyymmdd
+
+
+class AsyncDailyWordResolver:
+    """
+    Resolve today words without blocking the event loop.
+
+    Words are read from daily word cache, cache misses are resolved by a worker thread (database access) which also
+    (re)builds feedback table of word (if enabled and not built yet, e.g. word was cached by another process).
+    Concurrent requests for the same word length and date wait for the same resolution.
+    """
+
+    def __init__(self, flask_app: flask.Flask, attempt_processor: AttemptProcessor):
+        self._flask_app = flask_app
+        self._attempt_processor = attempt_processor
+        self._in_flight: dict[tuple[int, str], asyncio.Future] = {}
+
+    async def get_today_word(self, word_length: int) -> str:
+        """
+        Args:
+            word_length: word length
+
+        Returns:
+            Today word
+        """
+        word = self._attempt_processor.get_cached_today_word(word_length)
+        if word is not None and self._attempt_processor.has_feedback_table(word):
+            return word
+        key = (word_length, now_yyyymmdd())
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(
+                asyncio.to_thread(self._resolve, word_length)
+            )
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        # shield resolution so a cancelled request does not cancel it for waiting requests
+        return await asyncio.shield(future)
+
+    def _resolve(self, word_length: int) -> str:
+        with self._flask_app.app_context():
+            word = self._attempt_processor.get_today_word(word_length)
+        if self._attempt_processor.precomputed_feedback:
+            # (re)build table out of event loop as well
+            self._attempt_processor.get_feedback_table(word)
+        return word
+
+
+def _validate_attempt_request(body: bytes) -> tuple[str | None, bytes | None]:
+    """validate_attempt_request with pydantic (AttemptRequest validation)"""
+    try:
+        payload = json.loads(body) if body else None
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        payload = {}
+    try:
+        return AttemptRequest.model_validate(payload).attempt, None
+    except pydantic.ValidationError as e:
+        return None, make_validation_error(e).model_dump_json().encode()
+
+
+async def _read_body(receive) -> bytes:
+    body = b""
+    while True:
+        message = await receive()
+        body += message.get("body", b"")
+        if not message.get("more_body", False):
+            return body
+
+
+async def _send_json_response(send, status_code: int, body: bytes, headers: list):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                *headers,
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _handle_lifespan(receive, send, on_startup=None):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            if on_startup is not None:
+                on_startup()
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+def create_async_app(flask_app: flask.Flask | None = None):
+    """
+    Create ASGI app.
+
+    POST /attempt is served asynchronously: validation, whitelist check and attempt result computation run on the
+    event loop and today word is resolved without blocking it (see AsyncDailyWordResolver).
+    Other routes (batch attempts, errors, OpenAPI docs) are served by the flask app.
+
+    Args:
+        flask_app: flask app to serve other routes (created with create_app if missing)
+
+    Returns:
+        ASGI app
+    """
+    if flask_app is None:
+        flask_app = create_app()
+    attempt_processor: AttemptProcessor = flask_app.extensions["attempt_processor"]
+    resolver = AsyncDailyWordResolver(flask_app, attempt_processor)
+    wsgi_app = WsgiToAsgi(flask_app)
+    # started by first flask request or at startup (POST /attempt is not served by flask app)
+    whitelist_watcher = flask_app.extensions.get("whitelist_watcher")
+
+    validate = (
+        validate_attempt_request
+        if flask_app.config.get("FAST_VALIDATION")
+        else _validate_attempt_request
+    )
+
+    async def post_attempt(body: bytes) -> tuple[int, bytes]:
+        start = time.perf_counter()
+        attempt, error = validate(body)
+        observe_stage(Stage.VALIDATION, start)
+        if error is not None:
+            count_attempt(None, ErrorCode.INVALID_PAYLOAD.name)
+            return 422, error
+        error = attempt_processor.check_attempt(attempt)
+        if error is not None:
+            return 422, error
+        word = await resolver.get_today_word(len(attempt))
+        return 200, attempt_processor.compute_attempt_result(attempt, word)
+
+    async def app(scope, receive, send):
+        if scope["type"] == "lifespan":
+            await _handle_lifespan(
+                receive,
+                send,
+                whitelist_watcher.ensure_started if whitelist_watcher else None,
+            )
+            return
+        if (
+            scope["type"] == "http"
+            and scope["method"] == "POST"
+            and scope["path"] == "/attempt"
+        ):
+            start = time.perf_counter()
+            status_code, data = await post_attempt(await _read_body(receive))
+            # same CORS policy as flask app (any origin)
+            headers = []
+            if any(name == b"origin" for name, _ in scope["headers"]):
+                headers.append((b"access-control-allow-origin", b"*"))
+            await _send_json_response(send, status_code, data, headers)
+            observe_request("/attempt", status_code, start)
+            return
+        await wsgi_app(scope, receive, send)
+
+    loguru.logger.info("Async app init is successful")
+    return app
@@ -0,0 +1,121 @@
+"""
+Vectorized attempt result computation (requires numpy).
+
+Scores N attempts against M words in a single call, used for offline analytics (word hardness, solver simulation...)
+over whole whitelists. Results are identical to compute_attempt_result.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from wordleapi.core import LetterPositionStatus
+
+# Max number of (attempt, word) pairs processed at once, bounds intermediate arrays memory (~ pairs * word length)
+DEFAULT_CHUNK_SIZE = 1 << 22
+
+
+def encode_words(words: Iterable[str]) -> np.ndarray:
+    """
+    Encode words as a matrix of letters.
+
+    Args:
+        words: ASCII words of the same length
+
+    Returns:
+        (len(words), word length) uint8 matrix
+    """
+    words = list(words)
+    assert words
+    word_length = len(words[0])
+    assert all(len(word) == word_length for word in words), (
+        "words must have same length"
+    )
+    return np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8).reshape(
+        len(words), word_length
+    )
+
+
+def _compute_results(attempts: np.ndarray, words: np.ndarray) -> np.ndarray:
+    # well-placed letters, (N, M, L)
+    wp = attempts[:, None, :] == words[None, :, :]
+    not_wp = ~wp
+    result = np.full(wp.shape, LetterPositionStatus.NP, dtype=np.uint8)
+    result[wp] = LetterPositionStatus.WP
+
+    word_length = attempts.shape[1]
+    for i in range(word_length):
+        letter = attempts[:, i]
+        # word letters equal to attempt letter which are not consumed by a well-placed letter
+        available = ((words[None, :, :] == letter[:, None, None]) & not_wp).sum(axis=-1)
+        # previous attempt occurrences of this letter which were not well-placed (consumed first, from left to right)
+        consumed = np.zeros(available.shape, dtype=available.dtype)
+        for j in range(i):
+            same_letter = attempts[:, j] == letter
+            consumed += same_letter[:, None] & not_wp[:, :, j]
+        result[:, :, i][not_wp[:, :, i] & (consumed < available)] = (
+            LetterPositionStatus.MP
+        )
+    return result
+
+
+def compute_attempt_results(
+    attempts: np.ndarray, words: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+    """
+    Compute attempt result of each attempt against each word.
+
+    Args:
+        attempts: (N, L) attempts matrix (see encode_words)
+        words: (M, L) words to find matrix (see encode_words)
+        chunk_size: max number of (attempt, word) pairs processed at once
+
+    Returns:
+        (N, M, L) uint8 array, [n, m] is compute_attempt_result(attempts[n], words[m])
+    """
+    assert attempts.ndim == 2 and words.ndim == 2
+    assert attempts.shape[1] == words.shape[1], (
+        "attempts and words must have same length"
+    )
+
+    results = np.empty((len(attempts), len(words), attempts.shape[1]), dtype=np.uint8)
+    step = max(1, chunk_size // max(1, len(words)))
+    for start in range(0, len(attempts), step):
+        results[start : start + step] = _compute_results(
+            attempts[start : start + step], words
+        )
+    return results
+
+
+def compute_attempt_result_codes(
+    attempts: np.ndarray, words: np.ndarray, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> np.ndarray:
+    """
+    Compute packed attempt result of each attempt against each word.
+
+    Same as compute_attempt_results but results are packed as base 3 integers (see encode_attempt_result), this
+    divides result memory by word length.
+
+    Args:
+        attempts: (N, L) attempts matrix (see encode_words)
+        words: (M, L) words to find matrix (see encode_words)
+        chunk_size: max number of (attempt, word) pairs processed at once
+
+    Returns:
+        (N, M) uint16 array, [n, m] is encode_attempt_result(compute_attempt_result(attempts[n], words[m]))
+    """
+    assert attempts.ndim == 2 and words.ndim == 2
+    assert attempts.shape[1] == words.shape[1], (
+        "attempts and words must have same length"
+    )
+    assert 3 ** attempts.shape[1] <= 2**16, "packed attempt result must fit in 16 bits"
+
+    weights = (3 ** np.arange(attempts.shape[1])).astype(np.uint16)
+    codes = np.empty((len(attempts), len(words)), dtype=np.uint16)
+    step = max(1, chunk_size // max(1, len(words)))
+    for start in range(0, len(attempts), step):
+        results = _compute_results(attempts[start : start + step], words)
+        codes[start : start + step] = (results.astype(np.uint16) * weights).sum(
+            axis=-1, dtype=np.uint16
+        )
+    return codes
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+import os
+
+import click
+
+from wordleapi.core import COMPILED_WHITELIST_EXTENSION, compile_whitelist_file
+
+
+@click.command()
+@click.argument("filenames", nargs=-1, required=True)
+@click.option(
+    "--outputdir",
+    "-o",
+    default=None,
+    help="Output directory to generate compiled whitelist files (default to whitelist file directory)",
+)
+def cli(filenames: tuple[str], outputdir: str | None):
+    """
+    Compile whitelist files into compiled whitelist files (memory mapped by app).
+
+    Compiled whitelist file is named after whitelist file with ".bin" extension.
+    Set WHITELIST_FILE_X_LETTERS env variables to compiled whitelist files to use them.
+    """
+    for filename in filenames:
+        output_filename = os.path.join(
+            outputdir or os.path.dirname(filename),
+            os.path.splitext(os.path.basename(filename))[0]
+            + COMPILED_WHITELIST_EXTENSION,
+        )
+        try:
+            compile_whitelist_file(filename, output_filename)
+        except (OSError, ValueError) as e:
+            raise click.ClickException(str(e))
+
+
+if __name__ == "__main__":
+    cli()
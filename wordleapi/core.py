@@ -1,20 +1,75 @@
+import array
+import contextlib
+import datetime
 import enum
+import fcntl
+import functools
+import glob
+import hashlib
+import hmac
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+import zlib
+from collections.abc import Callable, Hashable, Iterable, Iterator, Sequence
+from concurrent.futures import Future
 
 import loguru
 
 from wordleapi.db.model import (
-    add_played_word,
-    commit,
     delete_played_word_by_word_length,
-    get_all_played_word_by_word_length,
     get_first_played_word_by_word_length_and_date,
+    get_played_words_by_word_length,
+    insert_played_word_if_absent,
+    is_played_word,
 )
-from wordleapi.utils import now_yyyymmdd, pick_random_element
-
+from wordleapi.utils import add_days, now_yyyymmdd, pick_random_element
 
 # Available/playable word length
 AVAILABLE_WORD_LENGTHS = [6, 7, 8]
 
+# Max number of today word generation attempts (a generation fails when picked word was played concurrently)
+MAX_WORD_GENERATION_ATTEMPTS = 3
+
+# Max number of random picks looking for a non-played word before loading played words
+MAX_RANDOM_PICK_ATTEMPTS = 16
+
+
+def _request_log_disabled() -> bool:
+    return False
+
+
+def _ignore_stage(stage: str, start: float) -> None:
+    pass
+
+
+# Hooks installed by the app (see set_hooks), core depends neither on flask nor on prometheus_client
+_request_log_enabled: Callable[[], bool] = _request_log_disabled
+_observe_stage: Callable[[str, float], None] = _ignore_stage
+
+
+def set_hooks(
+    request_log_enabled: Callable[[], bool] | None = None,
+    observe_stage: Callable[[str, float], None] | None = None,
+) -> None:
+    """
+    Install hooks called by core functions, None restores default hook.
+
+    Args:
+        request_log_enabled: returns True if request path logs of current request are written (e.g.
+            wordleapi.log.request_log_enabled), default: request path logs are never written
+        observe_stage: records duration of today word resolution stage (stage name, i.e. wordleapi.metrics.Stage
+            value, and stage start as time.perf_counter() value, e.g. wordleapi.metrics.observe_stage), default: not
+            recorded
+    """
+    global _request_log_enabled, _observe_stage
+    _request_log_enabled = request_log_enabled or _request_log_disabled
+    _observe_stage = observe_stage or _ignore_stage
+
 
 class LetterPositionStatus(enum.IntEnum):
     """
@@ -31,6 +86,162 @@ class LetterPositionStatus(enum.IntEnum):
 ATTEMPT_REGEX = "^[a-zA-Z]+$"
 
 
+class Whitelist(tuple):
+    """
+    Ordered sequence of whitelisted words backed by a hash index.
+
+    Behaves like a tuple of words (indexing, iteration, len, equality with tuples) so it may be used anywhere
+    a sequence is expected, but membership test and word position lookup cost O(1) instead of a linear scan.
+    """
+
+    def __init__(self, words=()):
+        super().__init__()
+        self._positions = {word: idx for idx, word in enumerate(self)}
+
+    @property
+    def word_length(self) -> int:
+        """Length of whitelisted words (0 if whitelist is empty)"""
+        return len(self[0]) if self else 0
+
+    @functools.cached_property
+    def digest(self) -> str:
+        """Whitelist content digest (hex)"""
+        return hashlib.blake2b("\n".join(self).encode(), digest_size=16).hexdigest()
+
+    @property
+    def nbytes(self) -> int:
+        """Whitelist memory size (in bytes), words and hash index included"""
+        return (
+            sys.getsizeof(self)
+            + sum(sys.getsizeof(word) for word in self)
+            + sys.getsizeof(self._positions)
+        )
+
+    def __contains__(self, word) -> bool:
+        return word in self._positions
+
+    def position(self, word: str) -> int | None:
+        """
+        Args:
+            word: word to look for
+
+        Returns:
+            Index of word in whitelist or None if word is not whitelisted
+        """
+        return self._positions.get(word)
+
+
+# Compiled whitelist file: header (magic, version, word length, word count) followed by sorted fixed-width ASCII words
+COMPILED_WHITELIST_EXTENSION = ".bin"
+_COMPILED_WHITELIST_MAGIC = b"WLST"
+_COMPILED_WHITELIST_VERSION = 1
+_COMPILED_WHITELIST_HEADER = struct.Struct("<4sHHI")
+
+
+class MappedWhitelist(Sequence):
+    """
+    Whitelist backed by a memory-mapped compiled whitelist file (see compile_whitelist_file).
+
+    Same interface as Whitelist, words are sorted and looked up by binary search. Words are read from the mapped
+    file on access, so file pages are shared between processes (e.g. gunicorn workers) and loading is near-instant.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Args:
+            filename: compiled whitelist file
+
+        Raises:
+            OSError: if file opening fails
+            ValueError: if file is not a compiled whitelist file
+        """
+        with open(filename, "rb") as f:
+            self._buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, word_length, count = _COMPILED_WHITELIST_HEADER.unpack_from(
+            self._buffer
+        )
+        if (
+            magic != _COMPILED_WHITELIST_MAGIC
+            or version != _COMPILED_WHITELIST_VERSION
+            or len(self._buffer)
+            != _COMPILED_WHITELIST_HEADER.size + word_length * count
+        ):
+            self._buffer.close()
+            raise ValueError(f"'{filename}' is not a valid compiled whitelist file")
+        self._word_length = word_length
+        self._count = count
+
+    @property
+    def word_length(self) -> int:
+        """Length of whitelisted words (0 if whitelist is empty)"""
+        return self._word_length if len(self) else 0
+
+    @functools.cached_property
+    def digest(self) -> str:
+        """Whitelist content digest (hex), same as Whitelist digest for same words"""
+        return hashlib.blake2b(
+            b"\n".join(self._record(idx) for idx in range(len(self))), digest_size=16
+        ).hexdigest()
+
+    @property
+    def nbytes(self) -> int:
+        """Mapped file size (in bytes), memory is shared between processes mapping it"""
+        return len(self._buffer)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, idx: int) -> bytes:
+        offset = _COMPILED_WHITELIST_HEADER.size + idx * self._word_length
+        return self._buffer[offset : offset + self._word_length]
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return tuple(self[i] for i in range(*idx.indices(len(self))))
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("whitelist index out of range")
+        return self._record(idx).decode("ascii")
+
+    def __iter__(self) -> Iterator[str]:
+        for idx in range(len(self)):
+            yield self._record(idx).decode("ascii")
+
+    def __contains__(self, word) -> bool:
+        return self.position(word) is not None
+
+    def position(self, word: str) -> int | None:
+        """
+        Args:
+            word: word to look for
+
+        Returns:
+            Index of word in whitelist or None if word is not whitelisted
+        """
+        if not isinstance(word, str) or len(word) != self._word_length:
+            return None
+        try:
+            key = word.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+        # binary search (records are sorted)
+        buffer, word_length = self._buffer, self._word_length
+        base = _COMPILED_WHITELIST_HEADER.size
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = base + mid * word_length
+            record = buffer[offset : offset + word_length]
+            if record < key:
+                lo = mid + 1
+            elif record > key:
+                hi = mid
+            else:
+                return mid
+        return None
+
+
 def compute_attempt_result(attempt: str, word: str) -> list[LetterPositionStatus]:
     """
     Check if player attempt is correct.
@@ -45,13 +256,23 @@ def compute_attempt_result(attempt: str, word: str) -> list[LetterPositionStatus
     assert attempt
     assert word
 
-    # attempt is correct
-    if attempt == word:
-        result = [LetterPositionStatus.WP] * len(word)
+    result = _compute_attempt_result(attempt, word)
+    if _request_log_enabled():
         loguru.logger.debug(
-            "(attempt: '{}', word: '{}') => {} (correct attempt)", attempt, word, result
+            "(attempt: '{attempt}', word: '{word}') => {result} ({outcome} attempt)",
+            attempt=attempt,
+            word=word,
+            result=[lps.value for lps in result],
+            outcome="correct" if attempt == word else "incorrect",
         )
-        return result
+    return result
+
+
+def _compute_attempt_result(attempt: str, word: str) -> list[LetterPositionStatus]:
+    """compute_attempt_result without argument checking nor logging (used to compute results in bulk)"""
+    # attempt is correct
+    if attempt == word:
+        return [LetterPositionStatus.WP] * len(word)
 
     # look for good positioned letters
     available_word_letters = [letter for letter in word]
@@ -72,16 +293,369 @@ def compute_attempt_result(attempt: str, word: str) -> list[LetterPositionStatus
         except ValueError:
             pass
 
-    loguru.logger.debug(
-        "(attempt: '{}', word: '{}') => {} (incorrect attempt)",
-        attempt,
-        word,
-        [lps.value for lps in result],
-    )
     return result
 
 
-def load_whitelist_file(filename: str) -> tuple[str]:
+def encode_attempt_result(result: list[LetterPositionStatus]) -> int:
+    """
+    Pack attempt result into a base 3 integer (first letter status is least significant digit).
+
+    Args:
+        result: attempt result
+
+    Returns:
+        Packed attempt result (from 0 to 3^len(result) - 1)
+    """
+    code = 0
+    for lps in reversed(result):
+        code = code * 3 + lps
+    return code
+
+
+@functools.cache
+def _decode_attempt_result(code: int, word_length: int) -> tuple[LetterPositionStatus]:
+    result = []
+    for _ in range(word_length):
+        code, lps = divmod(code, 3)
+        result.append(LetterPositionStatus(lps))
+    return tuple(result)
+
+
+def decode_attempt_result(code: int, word_length: int) -> list[LetterPositionStatus]:
+    """
+    Unpack attempt result packed with encode_attempt_result.
+
+    Args:
+        code: packed attempt result
+        word_length: attempt length
+
+    Returns:
+        Attempt result
+    """
+    return list(_decode_attempt_result(code, word_length))
+
+
+class FeedbackTable:
+    """
+    Precomputed attempt results of every whitelisted word against a word to guess.
+
+    Results are stored packed (see encode_attempt_result) in an array indexed by whitelist position, so computing an
+    attempt result is a single table lookup.
+    """
+
+    def __init__(self, whitelist: Whitelist, word: str):
+        """
+        Build table (computes attempt result of each whitelisted word).
+
+        Args:
+            whitelist: whitelisted words (all attempts are expected to be in whitelist)
+            word: word to guess
+        """
+        assert whitelist
+        assert 3 ** len(word) <= 2**16, "packed attempt result must fit in 16 bits"
+
+        start = time.perf_counter()
+        self.whitelist = whitelist
+        self.word = word
+        self._codes = array.array(
+            "H",
+            (
+                encode_attempt_result(_compute_attempt_result(attempt, word))
+                for attempt in whitelist
+            ),
+        )
+        self.build_duration = time.perf_counter() - start
+
+    @classmethod
+    def shared(
+        cls, whitelist: Whitelist | MappedWhitelist, word: str, directory: str
+    ) -> "FeedbackTable":
+        """
+        Returns table mapped from a file of directory, so table memory is shared between host processes (e.g. gunicorn
+        workers) mapping it.
+
+        Table file is built by first process needing it while others wait for it (host lock), files of other words
+        with same length are removed. Files are renamed once written, an interrupted build leaves no table file.
+        Files are readable by owner only (their name contains word).
+
+        Args:
+            whitelist: whitelisted words (all attempts are expected to be in whitelist)
+            word: word to guess
+            directory: directory of table files
+        """
+        start = time.perf_counter()
+        word_length = len(word)
+        filename = os.path.join(
+            directory, f"feedback_{word_length}_{word}_{whitelist.digest}.bin"
+        )
+        with _host_lock(os.path.join(directory, f"feedback_{word_length}.lock")):
+            if (
+                not os.path.exists(filename)
+                or os.path.getsize(filename) != len(whitelist) * 2
+            ):
+                table = cls(whitelist, word)
+                fd = os.open(
+                    f"{filename}.tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+                )
+                with os.fdopen(fd, "wb") as f:
+                    table._codes.tofile(f)
+                os.replace(f"{filename}.tmp", filename)
+                for other in glob.glob(
+                    os.path.join(directory, f"feedback_{word_length}_*.bin")
+                ):
+                    if other != filename:
+                        # processes still mapping it keep their mapping
+                        os.remove(other)
+            with open(filename, "rb") as f:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        table = cls.__new__(cls)
+        table.whitelist = whitelist
+        table.word = word
+        table._codes = memoryview(buffer).cast("H")
+        table.build_duration = time.perf_counter() - start
+        return table
+
+    @property
+    def nbytes(self) -> int:
+        """Table memory size (in bytes)"""
+        if isinstance(self._codes, memoryview):
+            return self._codes.nbytes
+        return sys.getsizeof(self._codes)
+
+    def attempt_result(self, attempt: str) -> list[LetterPositionStatus] | None:
+        """
+        Args:
+            attempt: player attempt
+
+        Returns:
+            Attempt result or None if attempt is not in whitelist
+        """
+        position = self.whitelist.position(attempt)
+        if position is None:
+            return None
+        return decode_attempt_result(self._codes[position], len(self.word))
+
+
+class HardModeConstraints:
+    """
+    Constraints of hard mode compiled from results of previous attempts: an attempt is accepted if each previous
+    attempt would have got the same result against it (see compute_attempt_result), i.e. well-placed letters stay in
+    place, misplaced letters are reused (elsewhere) and letters are not used more often than results allow.
+
+    Constraints are compiled once into allowed letters bitmask of each position and min/max count of letters, so
+    checking an attempt is a single pass over its letters, whatever the number of previous attempts.
+    """
+
+    def __init__(
+        self,
+        word_length: int,
+        results: Iterable[tuple[str, Sequence[LetterPositionStatus]]],
+    ):
+        """
+        Args:
+            word_length: attempts length
+            results: previous (lowercase) attempts with their result
+        """
+        self.word_length = word_length
+        # bit i is set if i-th alphabet letter is allowed
+        self._allowed_letters = [(1 << 26) - 1] * word_length
+        self._min_counts: dict[str, int] = {}
+        self._max_counts: dict[str, int] = {}
+        for attempt, result in results:
+            assert len(attempt) == word_length
+            counts: dict[str, int] = {}
+            capped_letters = set()
+            for idx, (letter, lps) in enumerate(zip(attempt, result)):
+                bit = 1 << (ord(letter) - ord("a"))
+                if lps == LetterPositionStatus.WP:
+                    self._allowed_letters[idx] &= bit
+                else:
+                    self._allowed_letters[idx] &= ~bit
+                if lps == LetterPositionStatus.NP:
+                    # word contains as many letters as well-placed and misplaced ones
+                    capped_letters.add(letter)
+                else:
+                    counts[letter] = counts.get(letter, 0) + 1
+            for letter, count in counts.items():
+                self._min_counts[letter] = max(self._min_counts.get(letter, 0), count)
+            for letter in capped_letters:
+                self._max_counts[letter] = min(
+                    self._max_counts.get(letter, word_length), counts.get(letter, 0)
+                )
+
+    @property
+    def allowed_letters(self) -> tuple[int, ...]:
+        """Allowed letters bitmask of each position (bit i is set if i-th alphabet letter is allowed)"""
+        return tuple(self._allowed_letters)
+
+    @property
+    def min_counts(self) -> dict[str, int]:
+        """Min count of letters (letters without min count are not included)"""
+        return dict(self._min_counts)
+
+    @property
+    def max_counts(self) -> dict[str, int]:
+        """Max count of letters (letters without max count are not included)"""
+        return dict(self._max_counts)
+
+    def violation(self, attempt: str) -> str | None:
+        """
+        Args:
+            attempt: (lowercase) attempt of constraints word length
+
+        Returns:
+            First violated constraint description or None if attempt satisfies constraints
+        """
+        assert len(attempt) == self.word_length
+
+        counts: dict[str, int] = {}
+        for idx, letter in enumerate(attempt):
+            allowed_letters = self._allowed_letters[idx]
+            if not allowed_letters >> (ord(letter) - ord("a")) & 1:
+                if allowed_letters & (allowed_letters - 1) == 0:
+                    # single allowed letter (well-placed)
+                    expected = chr(ord("a") + allowed_letters.bit_length() - 1)
+                    return f"letter {idx + 1} must be '{expected}'"
+                return f"letter {idx + 1} cannot be '{letter}'"
+            counts[letter] = counts.get(letter, 0) + 1
+        for letter, count in counts.items():
+            max_count = self._max_counts.get(letter)
+            if max_count is not None and count > max_count:
+                return f"'{letter}' must be used at most {max_count} time(s)"
+        for letter, min_count in self._min_counts.items():
+            if counts.get(letter, 0) < min_count:
+                return f"'{letter}' must be used at least {min_count} time(s)"
+        return None
+
+
+# All alphabet letters bitmask (see HardModeConstraints)
+_ALL_LETTERS = (1 << 26) - 1
+
+
+def _bitset(indexes: bytearray) -> int:
+    return int.from_bytes(indexes, "little")
+
+
+class CandidateIndex:
+    """
+    Bitset indexes of whitelisted words (bit i is set if i-th whitelist word matches): words with a letter at a
+    position and words containing a letter at least a number of times.
+
+    Querying words consistent with results of previous attempts (see HardModeConstraints) is then a few bitwise
+    operations by constrained position and letter instead of computing results against each whitelisted word.
+    """
+
+    def __init__(self, whitelist: Whitelist | MappedWhitelist):
+        """
+        Args:
+            whitelist: whitelisted words
+        """
+        start = time.perf_counter()
+        self.whitelist = whitelist
+        self.word_length = whitelist.word_length
+        size = (len(whitelist) + 7) // 8
+        # position_indexes[position][letter] and count_indexes[letter][count - 1]
+        position_indexes = [
+            [bytearray(size) for _ in range(26)] for _ in range(self.word_length)
+        ]
+        count_indexes = [
+            [bytearray(size) for _ in range(self.word_length)] for _ in range(26)
+        ]
+        for idx, word in enumerate(whitelist):
+            byte, bit = idx >> 3, 1 << (idx & 7)
+            counts = [0] * 26
+            for position, letter in enumerate(word):
+                letter = ord(letter) - ord("a")
+                position_indexes[position][letter][byte] |= bit
+                count_indexes[letter][counts[letter]][byte] |= bit
+                counts[letter] += 1
+        self._all = (1 << len(whitelist)) - 1
+        self._position_bitsets = [
+            [_bitset(indexes) for indexes in letters] for letters in position_indexes
+        ]
+        self._count_bitsets = [
+            [_bitset(indexes) for indexes in counts] for counts in count_indexes
+        ]
+        self.build_duration = time.perf_counter() - start
+
+    @property
+    def nbytes(self) -> int:
+        """Index memory size (in bytes)"""
+        return sum(
+            sys.getsizeof(bitset)
+            for bitsets in self._position_bitsets + self._count_bitsets
+            for bitset in bitsets
+        )
+
+    def candidates(self, constraints: HardModeConstraints) -> int:
+        """
+        Args:
+            constraints: constraints of index word length
+
+        Returns:
+            Bitset of whitelisted words satisfying constraints
+        """
+        assert constraints.word_length == self.word_length
+
+        candidates = self._all
+        for position, allowed_letters in enumerate(constraints.allowed_letters):
+            if allowed_letters == _ALL_LETTERS:
+                continue
+            letters = self._position_bitsets[position]
+            if allowed_letters & (allowed_letters - 1) == 0:
+                # single allowed letter (well-placed)
+                candidates &= letters[allowed_letters.bit_length() - 1]
+                continue
+            forbidden_letters = _ALL_LETTERS & ~allowed_letters
+            while forbidden_letters:
+                letter = (forbidden_letters & -forbidden_letters).bit_length() - 1
+                candidates &= ~letters[letter]
+                forbidden_letters &= forbidden_letters - 1
+        for letter, min_count in constraints.min_counts.items():
+            if min_count:
+                candidates &= self._count_bitsets[ord(letter) - ord("a")][min_count - 1]
+        for letter, max_count in constraints.max_counts.items():
+            if max_count < self.word_length:
+                candidates &= ~self._count_bitsets[ord(letter) - ord("a")][max_count]
+        return candidates
+
+    def query(
+        self, constraints: HardModeConstraints, offset: int = 0, limit: int = 0
+    ) -> tuple[int, list[str]]:
+        """
+        Args:
+            constraints: constraints of index word length
+            offset: number of candidate words to skip (in whitelist order)
+            limit: max number of candidate words to return
+
+        Returns:
+            Number of whitelisted words satisfying constraints and a page of them (in whitelist order)
+        """
+        candidates = self.candidates(constraints)
+        count = candidates.bit_count()
+        words = []
+        if offset < count and limit > 0:
+            # first page word index, smallest index with offset candidates before it
+            lo, hi = 0, candidates.bit_length()
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if (candidates & ((1 << mid) - 1)).bit_count() > offset:
+                    hi = mid
+                else:
+                    lo = mid + 1
+            idx = lo - 1
+            candidates >>= idx
+            while candidates and len(words) < limit:
+                shift = (candidates & -candidates).bit_length() - 1
+                idx += shift
+                words.append(self.whitelist[idx])
+                candidates >>= shift + 1
+                idx += 1
+        return count, words
+
+
+def load_whitelist_file(filename: str) -> Whitelist:
     """
     Load whitelist file and extract list of words from it.
 
@@ -89,51 +663,602 @@ def load_whitelist_file(filename: str) -> tuple[str]:
         filename: file to read
 
     Returns:
-        Word list
+        Whitelist of words (in file order)
 
     Raises:
         OSError: if file opening fails
     """
     loguru.logger.info("Load whitelist file '{}'", filename)
     with open(filename) as f:
-        whitelist = tuple([word for word in f.read().split("\n") if word != ""])
+        whitelist = Whitelist(word for word in f.read().split("\n") if word != "")
         loguru.logger.info("Found {} words in '{}'", len(whitelist), filename)
         return whitelist
 
 
-def get_today_word(whitelist: tuple[str]) -> str:
+def compile_whitelist_file(filename: str, output_filename: str) -> int:
+    """
+    Compile whitelist file into a compiled whitelist file (see MappedWhitelist).
+
+    Args:
+        filename: whitelist file to compile (source of truth)
+        output_filename: compiled whitelist file to write
+
+    Returns:
+        Number of compiled words
+
+    Raises:
+        OSError: if file opening fails
+        ValueError: if words do not have the same length or are not ASCII
     """
-    Get today word to guess by retrieving it from database or picking a random non-played word.
+    words = sorted(set(load_whitelist_file(filename)))
+    word_length = len(words[0]) if words else 0
+    if any(len(word) != word_length for word in words):
+        raise ValueError(f"'{filename}' words do not have the same length")
+    with open(output_filename, "wb") as f:
+        f.write(
+            _COMPILED_WHITELIST_HEADER.pack(
+                _COMPILED_WHITELIST_MAGIC,
+                _COMPILED_WHITELIST_VERSION,
+                word_length,
+                len(words),
+            )
+        )
+        f.write("".join(words).encode("ascii"))
+    loguru.logger.info(
+        "Compiled {} words from '{}' into '{}'", len(words), filename, output_filename
+    )
+    return len(words)
+
+
+def load_whitelist(filename: str) -> Whitelist | MappedWhitelist:
+    """
+    Load whitelist from a whitelist file or a compiled whitelist file (mapped in memory).
+
+    Args:
+        filename: whitelist file or compiled whitelist file (with COMPILED_WHITELIST_EXTENSION extension)
+
+    Returns:
+        Whitelist
+
+    Raises:
+        OSError: if file opening fails
+        ValueError: if compiled whitelist file is invalid
+    """
+    if filename.endswith(COMPILED_WHITELIST_EXTENSION):
+        loguru.logger.info("Map compiled whitelist file '{}'", filename)
+        whitelist = MappedWhitelist(filename)
+        loguru.logger.info("Found {} words in '{}'", len(whitelist), filename)
+        return whitelist
+    return load_whitelist_file(filename)
+
+
+class DailyWordCache:
+    """
+    In-process cache of daily words keyed by (word length, "yyyyMMdd" date).
+
+    Date is the Paris (France) date (see now_yyyymmdd), so entries naturally stop matching at Paris midnight.
+    Storing a word for a new date evicts older dates for the same word length, cache holds at most one word per
+    word length.
+    """
+
+    def __init__(self):
+        self._words: dict[tuple[int, str], str] = {}
+        self._lock = threading.Lock()
+
+    def get(self, word_length: int, date: str) -> str | None:
+        """
+        Args:
+            word_length: word length
+            date: "yyyyMMdd" date
+
+        Returns:
+            Cached word or None if there is no word cached for this word length and date
+        """
+        return self._words.get((word_length, date))
+
+    def set(self, word_length: int, date: str, word: str) -> None:
+        """
+        Cache word for word length and date, evicts words cached for other dates with same word length.
+
+        Args:
+            word_length: word length
+            date: "yyyyMMdd" date
+            word: word to cache
+        """
+        with self._lock:
+            words = {k: v for k, v in self._words.items() if k[0] != word_length}
+            words[(word_length, date)] = word
+            self._words = words
+
+    def clear(self) -> None:
+        """Remove all cached words"""
+        with self._lock:
+            self._words = {}
+
+    def lock(self, word_length: int) -> contextlib.AbstractContextManager:
+        """
+        Lock held while retrieving or generating a daily word missing from cache, no-op as in-process retrievals are
+        coalesced (see get_today_word).
+
+        Args:
+            word_length: word length
+        """
+        return contextlib.nullcontext()
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls by key: the first caller runs the call, callers with the same key arriving while it is
+    in flight wait for its result (or exception) instead of running it again.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, fn: Callable):
+        """
+        Args:
+            key: call key
+            fn: call to run (without arguments)
+
+        Returns:
+            Call result
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = Future()
+                self._calls[key] = call
+        if not leader:
+            return call.result()
+
+        try:
+            result = fn()
+        except Exception as e:
+            call.set_exception(e)
+            raise
+        except BaseException:
+            # leader interrupted (e.g. SystemExit), waiting threads fail without being interrupted
+            call.set_exception(RuntimeError("Call interrupted"))
+            raise
+        else:
+            call.set_result(result)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return result
+
+
+# Today word retrievals from database (or generations) in flight in current process
+_today_word_resolutions = SingleFlight()
+
+
+@contextlib.contextmanager
+def _host_lock(filename: str):
+    """Exclusive lock shared by processes of host (e.g. gunicorn workers), released on exit or process death"""
+    with os.fdopen(os.open(filename, os.O_WRONLY | os.O_CREAT, 0o600), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# Shared daily word cache slot: date, word (null padded) and CRC32 checksum of date and word, one slot per word length
+_SHARED_DAILY_WORD_SLOT = struct.Struct("<8s16sI")
+_SHARED_DAILY_WORD_SLOTS = 16
+
+
+class SharedDailyWordCache(DailyWordCache):
+    """
+    Daily word cache shared between host processes (e.g. gunicorn workers) through a memory-mapped file, in front of
+    which each process keeps an in-process cache.
+
+    A word cached by a process is read by others without querying database, a single process retrieves or generates
+    a missing word (host lock file next to cache file). Slots torn by a concurrent or interrupted write (e.g. process
+    crash) fail checksum and are treated as missing.
+    """
+
+    def __init__(self, filename: str):
+        """
+        Args:
+            filename: cache file (created if missing), its lock file has the same name with a ".lock" extension
+        """
+        super().__init__()
+        self._lock_filename = os.path.splitext(filename)[0] + ".lock"
+        size = _SHARED_DAILY_WORD_SLOT.size * _SHARED_DAILY_WORD_SLOTS
+        fd = os.open(filename, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            if os.fstat(fd).st_size < size:
+                os.ftruncate(fd, size)
+            self._buffer = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+    def get(self, word_length: int, date: str) -> str | None:
+        word = super().get(word_length, date)
+        if word is None and 0 <= word_length < _SHARED_DAILY_WORD_SLOTS:
+            offset = word_length * _SHARED_DAILY_WORD_SLOT.size
+            slot_date, slot_word, checksum = _SHARED_DAILY_WORD_SLOT.unpack(
+                self._buffer[offset : offset + _SHARED_DAILY_WORD_SLOT.size]
+            )
+            if (
+                slot_date == date.encode()
+                and zlib.crc32(slot_date + slot_word) == checksum
+            ):
+                word = slot_word.rstrip(b"\0").decode("ascii")
+                super().set(word_length, date, word)
+        return word
+
+    def set(self, word_length: int, date: str, word: str) -> None:
+        super().set(word_length, date, word)
+        if 0 <= word_length < _SHARED_DAILY_WORD_SLOTS:
+            data = struct.pack("<8s16s", date.encode(), word.encode("ascii"))
+            offset = word_length * _SHARED_DAILY_WORD_SLOT.size
+            self._buffer[offset : offset + _SHARED_DAILY_WORD_SLOT.size] = (
+                _SHARED_DAILY_WORD_SLOT.pack(
+                    date.encode(), word.encode("ascii"), zlib.crc32(data)
+                )
+            )
+
+    def clear(self) -> None:
+        super().clear()
+        self._buffer[:] = bytes(len(self._buffer))
+
+    def lock(self, word_length: int) -> contextlib.AbstractContextManager:
+        return _host_lock(self._lock_filename)
+
+
+class DeterministicWordSelector:
+    """
+    Computes daily words from a secret, the whitelist and the date, without database.
+
+    Every process (or node) sharing the secret and whitelist files computes the same word for a date without
+    coordination. Days are mapped to a secret permutation of whitelist words (words sorted by their keyed hash, one
+    permutation per cycle of len(whitelist) days), so a word is not selected again within a cycle.
+    """
+
+    def __init__(self, secret: str):
+        """
+        Args:
+            secret: secret key (words can be predicted by anyone knowing it)
+        """
+        assert secret
+        self._key = hashlib.blake2b(secret.encode()).digest()
+        # (whitelist, cycle, permutation) by word length
+        self._permutations: dict[int, tuple[Sequence[str], int, array.array]] = {}
+
+    def _permutation(self, whitelist: Sequence[str], cycle: int) -> array.array:
+        """
+        Returns whitelist indexes ordered by keyed hash of (cycle, word), built once per whitelist (e.g. rebuilt when
+        whitelists are reloaded) and cycle
+        """
+        word_length = len(whitelist[0])
+        entry = self._permutations.get(word_length)
+        if entry is not None and entry[0] is whitelist and entry[1] == cycle:
+            permutation = entry[2]
+        else:
+            salt = cycle.to_bytes(8, "little")
+            permutation = array.array(
+                "I",
+                sorted(
+                    range(len(whitelist)),
+                    key=lambda i: hashlib.blake2b(
+                        whitelist[i].encode(), key=self._key, salt=salt, digest_size=8
+                    ).digest(),
+                ),
+            )
+            # keep a single permutation per word length
+            self._permutations[word_length] = (whitelist, cycle, permutation)
+        return permutation
+
+    def select(self, whitelist: Sequence[str], date: str) -> str:
+        """
+        Args:
+            whitelist: list of available words
+            date: "yyyyMMdd" date
+
+        Returns:
+            Word of date
+        """
+        assert whitelist
+
+        day = datetime.date(int(date[:4]), int(date[4:6]), int(date[6:])).toordinal()
+        cycle, index = divmod(day, len(whitelist))
+        return whitelist[self._permutation(whitelist, cycle)[index]]
+
+
+class WordSchedule:
+    """
+    Daily words loaded from a signed schedule file (see load_word_schedule and write_word_schedule).
+
+    Every instance loading the same schedule file serves the same words without database.
+    """
+
+    def __init__(self, words_by_word_length: dict[int, dict[str, str]]):
+        """
+        Args:
+            words_by_word_length: word by "yyyyMMdd" date for each word length
+        """
+        self.words_by_word_length = words_by_word_length
+
+    def select(self, whitelist: Sequence[str], date: str) -> str | None:
+        """
+        Args:
+            whitelist: list of available words
+            date: "yyyyMMdd" date
+
+        Returns:
+            Word of date or None if schedule has no word for whitelist word length and date
+        """
+        return self.words_by_word_length.get(len(whitelist[0]), {}).get(date)
+
+    def last_date(self, word_length: int) -> str | None:
+        """
+        Returns:
+            Last date scheduled for word length or None if there is no word scheduled for word length
+        """
+        return max(self.words_by_word_length.get(word_length, {}), default=None)
+
+
+def _sign_word_schedule(
+    words_by_word_length: dict[str, dict[str, str]], secret: str
+) -> str:
+    """Returns HMAC-SHA256 (hex) of canonical JSON words"""
+    payload = json.dumps(words_by_word_length, sort_keys=True, separators=(",", ":"))
+    return hmac.new(secret.encode(), payload.encode(), hashlib.sha256).hexdigest()
+
+
+def write_word_schedule(
+    filename: str, words_by_word_length: dict[int, dict[str, str]], secret: str
+) -> None:
+    """
+    Write words to schedule file signed with secret.
+
+    Args:
+        filename: schedule file to write
+        words_by_word_length: word by "yyyyMMdd" date for each word length
+        secret: secret used to sign schedule file
+    """
+    words = {
+        str(word_length): dict(sorted(words.items()))
+        for word_length, words in sorted(words_by_word_length.items())
+    }
+    with open(filename, "w") as f:
+        json.dump(
+            {"words": words, "signature": _sign_word_schedule(words, secret)},
+            f,
+            indent=4,
+        )
+
+
+def load_word_schedule(filename: str, secret: str) -> WordSchedule:
+    """
+    Load schedule file and check its signature.
+
+    Args:
+        filename: schedule file (see write_word_schedule)
+        secret: secret used to sign schedule file
+
+    Returns:
+        Word schedule
+
+    Raises:
+        OSError if schedule file cannot be read
+        ValueError if schedule file is invalid or its signature does not match
+    """
+    loguru.logger.info("Load word schedule file '{}'", filename)
+    with open(filename) as f:
+        try:
+            content = json.load(f)
+            words, signature = content["words"], content["signature"]
+        except (ValueError, KeyError, TypeError):
+            raise ValueError(f"Invalid word schedule file '{filename}'")
+    if not hmac.compare_digest(_sign_word_schedule(words, secret), str(signature)):
+        raise ValueError(f"Invalid word schedule file '{filename}' signature")
+    schedule = WordSchedule(
+        {
+            int(word_length): dict(words_by_date)
+            for word_length, words_by_date in words.items()
+        }
+    )
+    for word_length in schedule.words_by_word_length:
+        loguru.logger.info(
+            "{} letters words scheduled until {}",
+            word_length,
+            schedule.last_date(word_length),
+        )
+    return schedule
+
+
+def get_today_word(
+    whitelist: tuple[str],
+    cache: DailyWordCache | None = None,
+    selector: DeterministicWordSelector | WordSchedule | None = None,
+    lock_dir: str | None = None,
+) -> str:
+    """
+    Get today word to guess by retrieving it from cache, database or picking a random non-played word.
 
     Played word are stored in database.
+    If today word is in cache returns it without querying database.
     If today word is in database returns it, otherwise pick a random word from whitelist which is not in played word
     database and returns it.
     If all whitelist words have already been played, clean played word from database.
+    Generation is safe under concurrency: a single word may be stored for a word length and date, a generation losing
+    the race returns the stored word. Concurrent retrievals and generations are coalesced: a single thread per process
+    retrieves or generates today word while others wait for it, and, if a lock directory is given, a single process
+    per host (others read it from cache if it is shared by host processes, from database otherwise).
+    If a word selector is given, today word is computed by selector or loaded from schedule instead (database is only
+    used when schedule has no word for today).
 
     Args:
         whitelist: list of available words
+        cache: daily word cache (optional), updated with today word when it is retrieved from database or generated
+        selector: deterministic word selector or word schedule (optional)
+        lock_dir: directory of lock files coalescing generations of host processes (optional)
 
     Returns:
         Today word to guess
     """
     assert whitelist
 
+    start = time.perf_counter()
     word_length = len(whitelist[0])
+    today = now_yyyymmdd()
+
+    if cache is not None:
+        word = cache.get(word_length, today)
+        if word:
+            _observe_stage("today_word_cache_hit", start)
+            return word
 
-    # check if today's word is already generated
-    today_word = get_first_played_word_by_word_length_and_date(
-        word_length, now_yyyymmdd()
+    if selector is not None:
+        word = selector.select(whitelist, today)
+        if word:
+            if cache is not None:
+                cache.set(word_length, today, word)
+            _observe_stage("today_word_generation", start)
+            return word
+        loguru.logger.warning(
+            "No {} letters word scheduled today, fall back to database", word_length
+        )
+
+    return _today_word_resolutions.do(
+        (word_length, today),
+        functools.partial(
+            _resolve_today_word, whitelist, word_length, today, cache, lock_dir
+        ),
     )
-    if today_word:
-        loguru.logger.debug("Today {} letters word already generated", word_length)
-        return today_word.word
 
-    # retrieve already played words
-    loguru.logger.info("Generate today {} letters word", word_length)
-    already_played_words = get_all_played_word_by_word_length(word_length)
 
+def pregenerate_words(whitelist: tuple[str], days: int) -> dict[str, str]:
+    """
+    Generate words of the next days (today included) ahead of time, so requests only read them from database.
+
+    Words already generated are kept, so it is idempotent and safe to run concurrently (e.g. by several instances):
+    a single word may be stored for a word length and date, a generation losing the race keeps the stored word.
+    Requires an app context.
+
+    Args:
+        whitelist: list of available words
+        days: number of days to generate words for
+
+    Returns:
+        Word by date ("yyyyMMdd")
+    """
+    assert whitelist
+
+    word_length = len(whitelist[0])
+    today = now_yyyymmdd()
+    words = {}
+    for _date in (add_days(today, i) for i in range(days)):
+        word = get_first_played_word_by_word_length_and_date(word_length, _date)
+        if word:
+            words[_date] = word.word
+        else:
+            words[_date] = _generate_word(whitelist, word_length, _date, today)
+    return words
+
+
+def _resolve_today_word(
+    whitelist: tuple[str],
+    word_length: int,
+    today: str,
+    cache: DailyWordCache | None,
+    lock_dir: str | None,
+) -> str:
+    """
+    Retrieve today word from database or generate it, holding host lock of word length if lock directory is given
+    and cache lock (see DailyWordCache.lock), without a lock if its file cannot be opened.
+    """
+    start = time.perf_counter()
+    locks = []
+    if lock_dir is not None:
+        locks.append(
+            lambda: _host_lock(os.path.join(lock_dir, f"wordleapi-{word_length}.lock"))
+        )
+    if cache is not None:
+        locks.append(lambda: cache.lock(word_length))
+    with contextlib.ExitStack() as stack:
+        for lock in locks:
+            try:
+                stack.enter_context(lock())
+            except OSError as e:
+                loguru.logger.warning(
+                    "Failed to lock {} letters word generation, proceed without host lock: {}",
+                    word_length,
+                    e,
+                )
+        # another process may have retrieved it while waiting for lock (see SharedDailyWordCache)
+        if cache is not None:
+            word = cache.get(word_length, today)
+            if word:
+                _observe_stage("today_word_cache_hit", start)
+                return word
+
+        # check if today's word is already generated (by another process or ahead of time, see pregenerate_words)
+        today_word = get_first_played_word_by_word_length_and_date(word_length, today)
+        if today_word:
+            loguru.logger.debug("Today {} letters word already generated", word_length)
+            if cache is not None:
+                cache.set(word_length, today, today_word.word)
+            _observe_stage("today_word_db_fetch", start)
+            return today_word.word
+
+        loguru.logger.info("Generate today {} letters word", word_length)
+        word = _generate_word(whitelist, word_length, today, today)
+        if cache is not None:
+            cache.set(word_length, today, word)
+        _observe_stage("today_word_generation", start)
+        return word
+
+
+def _generate_word(
+    whitelist: tuple[str], word_length: int, _date: str, today: str
+) -> str:
+    """
+    Generate and store word of date.
+
+    Concurrent generations (e.g. other workers at midnight) may only insert one word for a word length and date,
+    others read it back.
+    """
+    for _ in range(MAX_WORD_GENERATION_ATTEMPTS):
+        word = _pick_not_played_word(whitelist, word_length, today)
+        if insert_played_word_if_absent(word, word_length, _date):
+            loguru.logger.info("{} {} letters word is '{}'", _date, word_length, word)
+            return word
+        stored_word = get_first_played_word_by_word_length_and_date(word_length, _date)
+        if stored_word:
+            loguru.logger.info(
+                "{} {} letters word was generated concurrently", _date, word_length
+            )
+            return stored_word.word
+    raise RuntimeError(f"Failed to generate {_date} {word_length} letters word")
+
+
+def _pick_not_played_word(whitelist: tuple[str], word_length: int, today: str) -> str:
+    """
+    Pick a random word from whitelist which is not in played word database.
+
+    Random whitelisted words are checked one by one against played word database (one indexed lookup each), which is
+    cheap as long as most words were not played. If no non-played word is found this way, played words are loaded to
+    pick among remaining words.
+    If all whitelist words have already been played, clean words played before today from database (today word may
+    have been generated concurrently and next days words may have been generated ahead of time).
+    """
+    for _ in range(MAX_RANDOM_PICK_ATTEMPTS):
+        word = pick_random_element(whitelist)
+        if not is_played_word(word):
+            return word
+
+    # most words were played, retrieve already played words
+    loguru.logger.info("Most {} letters word were played, load them", word_length)
+    already_played_words = get_played_words_by_word_length(word_length)
     available_words = tuple(
-        set(whitelist) - set(wh.word for wh in already_played_words)
+        word for word in whitelist if word not in already_played_words
     )
 
     if not available_words:
@@ -142,18 +1267,11 @@ def get_today_word(whitelist: tuple[str]) -> str:
         loguru.logger.info(
             "All {} letters word were played, clean played_word table", word_length
         )
-        delete_played_word_by_word_length(word_length)
+        delete_played_word_by_word_length(word_length, keep_from_date=today)
         available_words = whitelist
     loguru.logger.info(
         "{} available {} letters word", len(available_words), word_length
     )
 
     # pick random word
-    word = pick_random_element(available_words)
-    loguru.logger.info("Today {} letters word is '{}'", word_length, word)
-
-    # save word to database
-    add_played_word(word, word_length)
-    commit()
-
-    return word
+    return pick_random_element(available_words)
@@ -1,24 +1,204 @@
+import functools
+import os
+import weakref
+
 import sqlalchemy as sa
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from wordleapi.utils import now_yyyymmdd
 
 db = SQLAlchemy()
 
+# Engines whose connection pool must be reset in forked processes
+_engines_to_reset_after_fork = weakref.WeakSet()
+
+
+def _reset_engines_after_fork():
+    for engine in list(_engines_to_reset_after_fork):
+        # close=False: parent process connections must not be closed by child, only dropped from child pool
+        engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_engines_after_fork)
+
+
+def reset_engines_after_fork():
+    """
+    Reset connection pools of current app engines in forked processes (e.g. gunicorn workers when app is preloaded),
+    so connections opened before fork are never shared between processes. Requires an app context.
+    """
+    _engines_to_reset_after_fork.update(db.engines.values())
+
+
+def make_engine_options(
+    database_uri: str,
+    pool_size: int = 5,
+    max_overflow: int = 10,
+    pool_timeout: int = 30,
+    pool_recycle: int = -1,
+    pool_pre_ping: bool = False,
+    statement_timeout_ms: int = 0,
+    poolclass: type[sa.pool.Pool] = sa.pool.QueuePool,
+) -> dict:
+    """
+    Build engine options (SQLALCHEMY_ENGINE_OPTIONS app config).
+
+    Args:
+        database_uri: database URI
+        pool_size: number of connections kept open in pool
+        max_overflow: max number of connections opened in addition to pool_size when pool is exhausted (-1: no limit)
+        pool_timeout: max time (in seconds) waiting for a connection when pool is exhausted
+        pool_recycle: max connection age (in seconds), older connections are replaced on checkout (-1: no limit)
+        pool_pre_ping: test connections on checkout, stale connections (e.g. after database failover) are replaced
+        statement_timeout_ms: max statement duration (in milliseconds, 0: no limit), PostgreSQL only
+        poolclass: connection pool class (e.g. wordleapi.metrics.InstrumentedQueuePool)
+
+    Returns:
+        Engine options
+    """
+    url = sa.engine.make_url(database_uri)
+    options = {"pool_pre_ping": pool_pre_ping}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        # in-memory database uses a single connection pool, pool options do not apply
+        return options
+    options.update(
+        poolclass=poolclass,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+    )
+    if statement_timeout_ms and url.get_backend_name() == "postgresql":
+        options["connect_args"] = {
+            "options": f"-c statement_timeout={statement_timeout_ms}"
+        }
+    return options
+
+
+def _set_sqlite_pragmas(pragmas: dict[str, str], dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma, value in pragmas.items():
+        cursor.execute(f"PRAGMA {pragma}={value}")
+    cursor.close()
+
+
+def set_sqlite_pragmas(journal_mode: str, synchronous: str, busy_timeout_ms: int):
+    """
+    Set pragmas of each new connection of current app SQLite engines (other engines are ignored), requires an app
+    context and must be called before first connection.
+
+    Args:
+        journal_mode: journal mode (e.g. WAL, lets readers run concurrently with a writer)
+        synchronous: synchronous mode (e.g. NORMAL, safe in WAL mode and fewer fsync)
+        busy_timeout_ms: max time (in milliseconds) waiting for a lock before failing with "database is locked"
+    """
+    pragmas = {
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "busy_timeout": str(busy_timeout_ms),
+    }
+    for engine in db.engines.values():
+        if engine.dialect.name == "sqlite":
+            sa.event.listen(
+                engine, "connect", functools.partial(_set_sqlite_pragmas, pragmas)
+            )
+
 
 class PlayedWord(db.Model):
     id = sa.Column(sa.Integer, primary_key=True)
     word = sa.Column(sa.String, unique=True, nullable=False)
     word_length = sa.Column(sa.Integer, nullable=False, index=True)
-    date = sa.Column(sa.String, default=now_yyyymmdd())
+    # evaluated on insert (current date, not date of module import)
+    date = sa.Column(sa.String, default=now_yyyymmdd)
+
+    # one word per word length and date (concurrent generations of a day word cannot both succeed)
+    __table_args__ = (sa.UniqueConstraint("word_length", "date"),)
+
+
+# Unique index of played words (word length, date) created by ensure_played_word_date_unique
+_PLAYED_WORD_DATE_INDEX = "uq_played_word_word_length_date"
+
+
+def ensure_played_word_date_unique() -> bool:
+    """
+    Create unique index on played words (word length, date) if played word table has no such constraint (table
+    created before constraint was added, db.create_all does not alter existing tables). Without it, concurrent
+    generations of a day word may both be stored (see insert_played_word_if_absent). Index creation is idempotent, so
+    processes starting together (e.g. gunicorn workers) may all create it.
+
+    Returns:
+        True if index was created (by this or a concurrent process), False if table already has the constraint
+
+    Raises:
+        sqlalchemy.exc.IntegrityError: if several played words have the same word length and date
+    """
+    columns = {"word_length", "date"}
+    inspector = sa.inspect(db.engine)
+    table = PlayedWord.__tablename__
+    if any(
+        set(constraint["column_names"]) == columns
+        for constraint in inspector.get_unique_constraints(table)
+    ) or any(
+        index["unique"] and set(index["column_names"]) == columns
+        for index in inspector.get_indexes(table)
+    ):
+        return False
+    db.session.execute(
+        sa.text(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS {_PLAYED_WORD_DATE_INDEX} ON {table} (word_length, date)"
+        )
+    )
+    db.session.commit()
+    return True
+
+
+# Dialects supporting "INSERT ... ON CONFLICT DO NOTHING"
+_INSERT_ON_CONFLICT_DO_NOTHING = {
+    "postgresql": postgresql_insert,
+    "sqlite": sqlite_insert,
+}
 
 
 def add_played_word(word: str, word_length: int):
     db.session.add(PlayedWord(word=word, word_length=word_length))
 
 
-def delete_played_word_by_word_length(word_length: int):
-    db.session.query(PlayedWord).filter_by(word_length=word_length).delete()
+def insert_played_word_if_absent(word: str, word_length: int, _date: str) -> bool:
+    """
+    Insert played word and commit, unless it conflicts with an existing played word (same word, or same word length
+    and date).
+
+    Returns:
+        True if word was inserted, False if it conflicts with an existing played word
+    """
+    insert = _INSERT_ON_CONFLICT_DO_NOTHING.get(db.engine.dialect.name)
+    if insert:
+        result = db.session.execute(
+            insert(PlayedWord)
+            .values(word=word, word_length=word_length, date=_date)
+            .on_conflict_do_nothing()
+        )
+        db.session.commit()
+        return result.rowcount == 1
+    try:
+        db.session.add(PlayedWord(word=word, word_length=word_length, date=_date))
+        db.session.commit()
+        return True
+    except sa.exc.IntegrityError:
+        db.session.rollback()
+        return False
+
+
+def delete_played_word_by_word_length(
+    word_length: int, keep_from_date: str | None = None
+):
+    query = db.session.query(PlayedWord).filter_by(word_length=word_length)
+    if keep_from_date is not None:
+        # "yyyyMMdd" dates are ordered as strings
+        query = query.filter(PlayedWord.date < keep_from_date)
+    query.delete()
 
 
 def get_first_played_word_by_word_length_and_date(
@@ -31,8 +211,16 @@ def get_first_played_word_by_word_length_and_date(
     )
 
 
-def get_all_played_word_by_word_length(word_length: int) -> list[PlayedWord]:
-    return db.session.query(PlayedWord).filter_by(word_length=word_length).all()
+def get_played_words_by_word_length(word_length: int) -> set[str]:
+    return set(
+        db.session.scalars(
+            sa.select(PlayedWord.word).filter_by(word_length=word_length)
+        )
+    )
+
+
+def is_played_word(word: str) -> bool:
+    return db.session.query(sa.exists().where(PlayedWord.word == word)).scalar()
 
 
 def commit():
@@ -1,6 +1,7 @@
 #!/usr/bin/env python3
 import enum
 import os
+import re
 
 import click
 import loguru
@@ -18,31 +19,163 @@ class MissingDotEnvKeyError(Exception):
         )
 
 
+class InvalidDotEnvValueError(Exception):
+    def __init__(self, invalid_keys: list[str], *args, **kwargs):
+        super().__init__(args, kwargs)
+        self.__invalid_keys = invalid_keys
+
+    def __str__(self):
+        return (
+            f"Invalid env variable value(s) for {self.__invalid_keys}. "
+            f"Make sure to fix these values in .env file or env variables before restarting app."
+        )
+
+
 class DotEnvKey(enum.Enum):
     DATABASE_URI = "DATABASE_URI"
     WHITELIST_FILE_6_LETTERS = "WHITELIST_FILE_6_LETTERS"
     WHITELIST_FILE_7_LETTERS = "WHITELIST_FILE_7_LETTERS"
     WHITELIST_FILE_8_LETTERS = "WHITELIST_FILE_8_LETTERS"
+    PRECOMPUTED_FEEDBACK = "PRECOMPUTED_FEEDBACK"
+    LOG_LEVEL = "LOG_LEVEL"
+    LOG_REQUEST_SAMPLE_RATE = "LOG_REQUEST_SAMPLE_RATE"
+    LOG_JSON = "LOG_JSON"
+    FAST_VALIDATION = "FAST_VALIDATION"
+    DB_POOL_SIZE = "DB_POOL_SIZE"
+    DB_MAX_OVERFLOW = "DB_MAX_OVERFLOW"
+    DB_POOL_TIMEOUT = "DB_POOL_TIMEOUT"
+    DB_POOL_RECYCLE = "DB_POOL_RECYCLE"
+    DB_POOL_PRE_PING = "DB_POOL_PRE_PING"
+    DB_STATEMENT_TIMEOUT_MS = "DB_STATEMENT_TIMEOUT_MS"
+    SQLITE_JOURNAL_MODE = "SQLITE_JOURNAL_MODE"
+    SQLITE_SYNCHRONOUS = "SQLITE_SYNCHRONOUS"
+    SQLITE_BUSY_TIMEOUT_MS = "SQLITE_BUSY_TIMEOUT_MS"
+    WORD_SELECTION = "WORD_SELECTION"
+    WORD_SELECTION_SECRET = "WORD_SELECTION_SECRET"
+    WORD_SELECTION_SEED = "WORD_SELECTION_SEED"
+    WORD_SCHEDULE_FILE = "WORD_SCHEDULE_FILE"
+    PLAYED_WORD_WRITE_BEHIND = "PLAYED_WORD_WRITE_BEHIND"
+    WHITELIST_RELOAD_INTERVAL = "WHITELIST_RELOAD_INTERVAL"
+    WORD_GENERATION_LOCK_DIR = "WORD_GENERATION_LOCK_DIR"
+    SHARED_CACHE_DIR = "SHARED_CACHE_DIR"
+
+
+# Optional keys and the value used when they are missing from env
+_OPTIONAL_KEY_VALUES = {
+    DotEnvKey.PRECOMPUTED_FEEDBACK.value: "false",
+    DotEnvKey.LOG_LEVEL.value: "INFO",
+    DotEnvKey.LOG_REQUEST_SAMPLE_RATE.value: "1",
+    DotEnvKey.LOG_JSON.value: "false",
+    DotEnvKey.FAST_VALIDATION.value: "false",
+    DotEnvKey.DB_POOL_SIZE.value: "5",
+    DotEnvKey.DB_MAX_OVERFLOW.value: "10",
+    DotEnvKey.DB_POOL_TIMEOUT.value: "30",
+    DotEnvKey.DB_POOL_RECYCLE.value: "1800",
+    DotEnvKey.DB_POOL_PRE_PING.value: "true",
+    DotEnvKey.DB_STATEMENT_TIMEOUT_MS.value: "0",
+    DotEnvKey.SQLITE_JOURNAL_MODE.value: "WAL",
+    DotEnvKey.SQLITE_SYNCHRONOUS.value: "NORMAL",
+    DotEnvKey.SQLITE_BUSY_TIMEOUT_MS.value: "5000",
+    DotEnvKey.WORD_SELECTION.value: "random",
+    DotEnvKey.WORD_SELECTION_SECRET.value: "",
+    DotEnvKey.WORD_SELECTION_SEED.value: "",
+    DotEnvKey.WORD_SCHEDULE_FILE.value: "",
+    DotEnvKey.PLAYED_WORD_WRITE_BEHIND.value: "false",
+    DotEnvKey.WHITELIST_RELOAD_INTERVAL.value: "0",
+    DotEnvKey.WORD_GENERATION_LOCK_DIR.value: "",
+    DotEnvKey.SHARED_CACHE_DIR.value: "",
+}
+
+_BOOL_PATTERN = r"(?i)1|0|true|false|yes|no|on|off"
+_INT_PATTERN = r"\d+"
+
+# Valid values of keys (full match), other keys accept any non-empty value
+_KEY_VALUE_PATTERNS = {
+    DotEnvKey.PRECOMPUTED_FEEDBACK.value: _BOOL_PATTERN,
+    DotEnvKey.LOG_LEVEL.value: r"(?i)TRACE|DEBUG|INFO|SUCCESS|WARNING|ERROR|CRITICAL",
+    DotEnvKey.LOG_REQUEST_SAMPLE_RATE.value: r"0(\.\d+)?|1(\.0+)?",
+    DotEnvKey.LOG_JSON.value: _BOOL_PATTERN,
+    DotEnvKey.FAST_VALIDATION.value: _BOOL_PATTERN,
+    DotEnvKey.DB_POOL_SIZE.value: _INT_PATTERN,
+    DotEnvKey.DB_MAX_OVERFLOW.value: r"-1|\d+",
+    DotEnvKey.DB_POOL_TIMEOUT.value: _INT_PATTERN,
+    DotEnvKey.DB_POOL_RECYCLE.value: r"-1|\d+",
+    DotEnvKey.DB_POOL_PRE_PING.value: _BOOL_PATTERN,
+    DotEnvKey.DB_STATEMENT_TIMEOUT_MS.value: _INT_PATTERN,
+    DotEnvKey.SQLITE_JOURNAL_MODE.value: r"(?i)DELETE|TRUNCATE|PERSIST|MEMORY|WAL|OFF",
+    DotEnvKey.SQLITE_SYNCHRONOUS.value: r"(?i)OFF|NORMAL|FULL|EXTRA",
+    DotEnvKey.SQLITE_BUSY_TIMEOUT_MS.value: _INT_PATTERN,
+    DotEnvKey.WORD_SELECTION.value: r"(?i)random|deterministic|schedule",
+    DotEnvKey.WORD_SELECTION_SEED.value: _INT_PATTERN,
+    DotEnvKey.PLAYED_WORD_WRITE_BEHIND.value: _BOOL_PATTERN,
+    DotEnvKey.WHITELIST_RELOAD_INTERVAL.value: _INT_PATTERN,
+}
+
+
+def get_dot_env(key: DotEnvKey) -> str | None:
+    """
+    Args:
+        key: .env key
+
+    Returns:
+        Env variable value (or default value if key is optional and missing from env)
+    """
+    return os.getenv(key.value) or _OPTIONAL_KEY_VALUES.get(key.value)
+
+
+def get_dot_env_bool(key: DotEnvKey) -> bool:
+    """
+    Args:
+        key: .env key
+
+    Returns:
+        True if env variable value is "1", "true", "yes" or "on" (case-insensitive)
+    """
+    return (get_dot_env(key) or "").lower() in ("1", "true", "yes", "on")
+
+
+def get_dot_env_int(key: DotEnvKey) -> int:
+    """
+    Args:
+        key: .env key (integer value, see check_dot_env)
+
+    Returns:
+        Env variable value as integer
+    """
+    return int(get_dot_env(key))
 
 
 def check_dot_env() -> None:
     """
-    Check that all .env keys were read from .env files.
+    Check that all required .env keys were read from .env files and that values are valid.
 
     Returns:
         None
 
     Raises:
         MissingDotEnvKeyError if any key/value pair is missing
+        InvalidDotEnvValueError if any value is invalid (e.g. not an integer for an integer key)
     """
     missing_keys = []
+    invalid_keys = []
     for dek in DotEnvKey:
-        if not os.getenv(dek.value):
+        value = os.getenv(dek.value)
+        if not value:
+            if dek.value in _OPTIONAL_KEY_VALUES:
+                continue
             loguru.logger.critical("Missing env variable '{}'", dek.value)
             missing_keys.append(dek.value)
+            continue
+        pattern = _KEY_VALUE_PATTERNS.get(dek.value)
+        if pattern is not None and not re.fullmatch(pattern, value):
+            loguru.logger.critical("Invalid env variable '{}' value", dek.value)
+            invalid_keys.append(dek.value)
+            continue
         loguru.logger.debug("'{}' env variable loaded", dek.value)
     if missing_keys:
         raise MissingDotEnvKeyError(missing_keys)
+    if invalid_keys:
+        raise InvalidDotEnvValueError(invalid_keys)
 
 
 _DEFAULT_VALUES = {
@@ -50,6 +183,7 @@ _DEFAULT_VALUES = {
     DotEnvKey.WHITELIST_FILE_6_LETTERS.value: "/path/to/whitelist_file",
     DotEnvKey.WHITELIST_FILE_7_LETTERS.value: "/path/to/whitelist_file",
     DotEnvKey.WHITELIST_FILE_8_LETTERS.value: "/path/to/whitelist_file",
+    **_OPTIONAL_KEY_VALUES,
 }
 
 
@@ -58,6 +192,7 @@ _INTE_VALUES = {
     DotEnvKey.WHITELIST_FILE_6_LETTERS.value: "whitelist_files/whitelist_6_fr.txt",
     DotEnvKey.WHITELIST_FILE_7_LETTERS.value: "whitelist_files/whitelist_7_fr.txt",
     DotEnvKey.WHITELIST_FILE_8_LETTERS.value: "whitelist_files/whitelist_8_fr.txt",
+    **_OPTIONAL_KEY_VALUES,
 }
 
 
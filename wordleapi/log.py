@@ -0,0 +1,70 @@
+"""
+Logging configuration and request path logging helpers.
+
+Request path (per-request) logs are DEBUG logs, they must cost nothing when disabled: check request_log_enabled()
+before building their arguments. When enabled, only a sample of requests is logged (see configure_logging), a request
+is sampled once so its request path logs are all written or all dropped.
+"""
+
+import os
+import random
+import sys
+
+import flask
+import loguru
+
+_DEBUG_LEVEL_NO = loguru.logger.level("DEBUG").no
+
+# loguru default handler level (used until configure_logging is called)
+_min_level_no = loguru.logger.level(os.getenv("LOGURU_LEVEL", "DEBUG")).no
+_request_sample_rate = 1.0
+# loguru default handler id, then id of handler added by configure_logging
+_handler_id = 0
+
+
+def configure_logging(
+    level: str = "INFO", request_sample_rate: float = 1.0, serialize: bool = False
+) -> None:
+    """
+    Replace loguru default handler with a queued stderr handler.
+
+    Messages are enqueued and written by a background thread so log I/O never blocks request processing (queue is
+    shared with forked worker processes, see loguru enqueue option).
+
+    Args:
+        level: min log level
+        request_sample_rate: fraction of requests logged by request path logs (between 0 and 1)
+        serialize: write logs as JSON lines (message and structured fields) instead of text
+    """
+    global _min_level_no, _request_sample_rate, _handler_id
+
+    assert 0 <= request_sample_rate <= 1
+
+    try:
+        loguru.logger.remove(_handler_id)
+    except ValueError:
+        # already removed
+        pass
+    _handler_id = loguru.logger.add(
+        sys.stderr, level=level, enqueue=True, serialize=serialize
+    )
+    _min_level_no = loguru.logger.level(level).no
+    _request_sample_rate = request_sample_rate
+
+
+def request_log_enabled() -> bool:
+    """
+    Returns:
+        True if current request must be logged by request path logs (DEBUG level enabled and request is sampled)
+    """
+    if _min_level_no > _DEBUG_LEVEL_NO:
+        return False
+    if _request_sample_rate >= 1:
+        return True
+    if not flask.has_request_context():
+        # e.g. ASGI /attempt route (served without flask), sampled on each call
+        return random.random() < _request_sample_rate
+    sampled = flask.g.get("request_log_sampled")
+    if sampled is None:
+        sampled = flask.g.request_log_sampled = random.random() < _request_sample_rate
+    return sampled
@@ -0,0 +1,187 @@
+"""
+Prometheus metrics (requires prometheus_client).
+
+Metrics are shared between gunicorn workers when PROMETHEUS_MULTIPROC_DIR env variable is set before app import
+(each worker writes its values to memory mapped files in this directory, /metrics aggregates them), see
+gunicorn.conf.py hooks. Otherwise, each process exposes its own metrics.
+"""
+
+import enum
+import os
+import time
+
+import prometheus_client
+import sqlalchemy as sa
+from prometheus_client import multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Latency buckets (in seconds), most stages take a few microseconds, database stages a few milliseconds
+_BUCKETS = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+)
+
+
+class Stage(enum.StrEnum):
+    """Attempt processing stages"""
+
+    VALIDATION = "validation"
+    WHITELIST_LOOKUP = "whitelist_lookup"
+    TODAY_WORD_CACHE_HIT = "today_word_cache_hit"
+    TODAY_WORD_DB_FETCH = "today_word_db_fetch"
+    TODAY_WORD_GENERATION = "today_word_generation"
+    HARD_MODE_CHECK = "hard_mode_check"
+    CANDIDATE_QUERY = "candidate_query"
+    ATTEMPT_RESULT = "attempt_result"
+    SERIALIZATION = "serialization"
+
+
+REQUEST_DURATION = prometheus_client.Histogram(
+    "wordleapi_request_duration_seconds",
+    "HTTP request duration",
+    ["endpoint"],
+    buckets=_BUCKETS,
+)
+REQUESTS = prometheus_client.Counter(
+    "wordleapi_requests", "HTTP requests", ["endpoint", "status"]
+)
+STAGE_DURATION = prometheus_client.Histogram(
+    "wordleapi_stage_duration_seconds",
+    "Attempt processing stage duration",
+    ["stage"],
+    buckets=_BUCKETS,
+)
+ATTEMPTS = prometheus_client.Counter(
+    "wordleapi_attempts",
+    "Processed attempts by word length (empty for invalid payloads) and result code (ok or error code)",
+    ["word_length", "code"],
+)
+DB_QUERIES = prometheus_client.Counter(
+    "wordleapi_db_queries", "Database queries by statement type", ["statement"]
+)
+DB_POOL_CONNECTIONS = prometheus_client.Gauge(
+    "wordleapi_db_pool_connections",
+    "Open database connections (checked in and checked out)",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = prometheus_client.Gauge(
+    "wordleapi_db_pool_checked_out",
+    "Database connections in use",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKOUT_WAIT = prometheus_client.Histogram(
+    "wordleapi_db_pool_checkout_wait_seconds",
+    "Time waiting for a database connection from pool",
+    buckets=_BUCKETS,
+)
+DB_POOL_TIMEOUTS = prometheus_client.Counter(
+    "wordleapi_db_pool_timeouts",
+    "Database connection requests which timed out (pool exhausted)",
+)
+DB_POOL_INVALIDATIONS = prometheus_client.Counter(
+    "wordleapi_db_pool_invalidations",
+    "Invalidated database connections (e.g. stale connections detected by pre-ping)",
+)
+
+# children bound once, so hot path observations skip label lookup
+_stage_durations = {stage: STAGE_DURATION.labels(stage.value) for stage in Stage}
+
+
+def observe_stage(stage: Stage | str, start: float) -> None:
+    """
+    Args:
+        stage: attempt processing stage (or its value, see wordleapi.core.set_hooks)
+        start: stage start (time.perf_counter() value)
+    """
+    _stage_durations[stage].observe(time.perf_counter() - start)
+
+
+def count_attempt(word_length: int | None, code: str) -> None:
+    """
+    Args:
+        word_length: attempt length (None if payload is invalid)
+        code: "ok" if attempt was processed, error code name otherwise
+    """
+    ATTEMPTS.labels("" if word_length is None else str(word_length), code).inc()
+
+
+def observe_request(endpoint: str, status: int, start: float) -> None:
+    """
+    Args:
+        endpoint: request endpoint
+        status: response status code
+        start: request start (time.perf_counter() value)
+    """
+    REQUEST_DURATION.labels(endpoint).observe(time.perf_counter() - start)
+    REQUESTS.labels(endpoint, str(status)).inc()
+
+
+def _count_db_query(conn, cursor, statement: str, *args) -> None:
+    DB_QUERIES.labels(statement.lstrip().split(" ", 1)[0].lower()).inc()
+
+
+def instrument_db_queries() -> None:
+    """Count queries of all database engines (by statement type, e.g. select, insert...)"""
+    if not sa.event.contains(
+        sa.engine.Engine, "before_cursor_execute", _count_db_query
+    ):
+        sa.event.listen(sa.engine.Engine, "before_cursor_execute", _count_db_query)
+
+
+class InstrumentedQueuePool(sa.pool.QueuePool):
+    """Connection pool which records checkout wait duration and timeouts (see DB_POOL_* metrics)"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except sa.exc.TimeoutError:
+            DB_POOL_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - start)
+
+
+def instrument_db_pools() -> None:
+    """Record open and checked out connections, and invalidations, of all connection pools"""
+    for event, listener in _POOL_LISTENERS.items():
+        if not sa.event.contains(sa.pool.Pool, event, listener):
+            sa.event.listen(sa.pool.Pool, event, listener)
+
+
+_POOL_LISTENERS = {
+    "connect": lambda *_: DB_POOL_CONNECTIONS.inc(),
+    "close": lambda *_: DB_POOL_CONNECTIONS.dec(),
+    "checkout": lambda *_: DB_POOL_CHECKED_OUT.inc(),
+    "checkin": lambda *_: DB_POOL_CHECKED_OUT.dec(),
+    "invalidate": lambda *_: DB_POOL_INVALIDATIONS.inc(),
+}
+
+
+def generate_metrics() -> tuple[bytes, str]:
+    """
+    Returns:
+        Metrics in Prometheus text format (aggregated over all processes in multiprocess mode) and content type
+    """
+    if os.getenv(MULTIPROC_DIR_ENV):
+        registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = prometheus_client.REGISTRY
+    data = prometheus_client.generate_latest(registry)
+    return data, prometheus_client.CONTENT_TYPE_LATEST
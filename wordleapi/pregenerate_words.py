@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+import click
+
+from wordleapi.api import create_app
+from wordleapi.core import WordSchedule, write_word_schedule
+from wordleapi.env import DotEnvKey, get_dot_env
+
+
+@click.command()
+@click.option(
+    "--days",
+    "-d",
+    type=click.IntRange(min=1),
+    default=7,
+    show_default=True,
+    help="Number of days (today included) to generate words for",
+)
+@click.option(
+    "--schedule-file",
+    "-o",
+    default=None,
+    help="Word schedule file to write generated words to, signed with WORD_SELECTION_SECRET (optional)",
+)
+def cli(days: int, schedule_file: str | None):
+    """
+    Generate words of the next days for each word length ahead of time (database and whitelist files are read from
+    env variables, like API server).
+
+    Words already generated are kept, it is safe to run periodically (e.g. daily cron job) on several instances at
+    once. API server then only reads daily words from database.
+
+    Generated words may also be written to a signed word schedule file, loaded by API servers running with
+    WORD_SELECTION=schedule (no database on request path). With WORD_SELECTION=deterministic, words are computed
+    without database.
+    """
+    app = create_app()
+    if app is None:
+        raise click.ClickException("Failed to create app, see logs")
+    attempt_processor = app.extensions["attempt_processor"]
+    if isinstance(attempt_processor.word_selector, WordSchedule):
+        raise click.ClickException(
+            "Daily words are loaded from word schedule file, there is nothing to generate"
+        )
+    if attempt_processor.word_selector is not None and schedule_file is None:
+        raise click.ClickException(
+            "Daily words are computed by deterministic word selection, there is nothing to generate"
+        )
+    secret = get_dot_env(DotEnvKey.WORD_SELECTION_SECRET)
+    if schedule_file is not None and not secret:
+        raise click.ClickException(
+            "Missing WORD_SELECTION_SECRET env variable (required to sign word schedule file)"
+        )
+
+    with app.app_context():
+        words_by_word_length = attempt_processor.pregenerate_words(days)
+    # words are not printed (they are the game answers)
+    for word_length, words in words_by_word_length.items():
+        click.echo(
+            f"{word_length} letters words: {min(words)} to {max(words)} ({len(words)} days)"
+        )
+    if schedule_file is not None:
+        try:
+            write_word_schedule(schedule_file, words_by_word_length, secret)
+        except OSError as e:
+            raise click.ClickException(str(e))
+        click.echo(f"Word schedule written to '{schedule_file}'")
+
+
+if __name__ == "__main__":
+    cli()
@@ -0,0 +1,592 @@
+"""
+Attempt processing shared by WSGI and ASGI apps (whitelists, daily words, feedback tables and candidate indexes) and
+its background threads (played word recording, whitelist files reloading).
+"""
+
+import functools
+import os
+import queue
+import threading
+import time
+from typing import NamedTuple
+
+import flask
+import loguru
+import sqlalchemy as sa
+
+from wordleapi.core import (
+    AVAILABLE_WORD_LENGTHS,
+    CandidateIndex,
+    DailyWordCache,
+    DeterministicWordSelector,
+    FeedbackTable,
+    HardModeConstraints,
+    MappedWhitelist,
+    SharedDailyWordCache,
+    SingleFlight,
+    Whitelist,
+    WordSchedule,
+    compute_attempt_result,
+    get_today_word,
+    load_whitelist,
+    pregenerate_words,
+)
+from wordleapi.core import LetterPositionStatus as LPS
+from wordleapi.db.model import insert_played_word_if_absent
+from wordleapi.metrics import Stage, count_attempt, observe_stage
+from wordleapi.schemas import (
+    CandidatesResponse,
+    ErrorCode,
+    ErrorResponse,
+    encode_attempt_response,
+    encode_not_in_whitelist_error,
+)
+from wordleapi.utils import add_days, now_yyyymmdd
+
+
+class PlayedWordRecorder:
+    """
+    Records daily words computed or loaded without database (see DeterministicWordSelector and WordSchedule) as played
+    words from a background thread (write-behind), requests never wait for database.
+
+    Recording is best effort: database failures are logged, a word is recorded once per process.
+    """
+
+    def __init__(self, app: flask.Flask):
+        self._app = app
+        self._recorded: set[str] = set()
+        self._queue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def record(self, word: str) -> None:
+        """
+        Record word as played today (only queued, does nothing if word was already recorded).
+        """
+        if word in self._recorded:
+            return
+        with self._lock:
+            if word in self._recorded:
+                return
+            self._recorded.add(word)
+            if self._thread is None or not self._thread.is_alive():
+                # started lazily, threads do not survive fork (e.g. app preloaded before forking gunicorn workers)
+                self._thread = threading.Thread(
+                    target=self._run, name="played-word-recorder", daemon=True
+                )
+                self._thread.start()
+        self._queue.put((word, now_yyyymmdd()))
+
+    def _run(self) -> None:
+        while True:
+            word, date = self._queue.get()
+            try:
+                with self._app.app_context():
+                    insert_played_word_if_absent(word, len(word), date)
+            except (sa.exc.SQLAlchemyError, OSError):
+                loguru.logger.exception("Failed to record {} played word", date)
+
+
+class WhitelistWatcher:
+    """
+    Reloads whitelists (see AttemptProcessor.reload_whitelists) from a background thread when whitelist files are
+    modified (checked every interval seconds).
+
+    Whitelist files must be replaced atomically (e.g. written to a temporary file then renamed), compiled whitelist
+    files are mapped in memory.
+    """
+
+    def __init__(
+        self,
+        app: flask.Flask,
+        attempt_processor: "AttemptProcessor",
+        whitelist_files: dict[int, str],
+        interval: float,
+    ):
+        self._app = app
+        self._attempt_processor = attempt_processor
+        self._whitelist_files = whitelist_files
+        self._interval = interval
+        self._mtimes = self._get_mtimes()
+        self._pid = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def _get_mtimes(self) -> dict[str, int | None]:
+        mtimes = {}
+        for filename in self._whitelist_files.values():
+            try:
+                mtimes[filename] = os.stat(filename).st_mtime_ns
+            except OSError:
+                mtimes[filename] = None
+        return mtimes
+
+    def ensure_started(self) -> None:
+        """
+        Start watcher thread if it is not running in current process (threads do not survive fork, e.g. app preloaded
+        before forking gunicorn workers).
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            threading.Thread(
+                target=self._run, name="whitelist-watcher", daemon=True
+            ).start()
+            self._pid = os.getpid()
+
+    def stop(self) -> None:
+        """Stop watcher thread"""
+        self._stopped.set()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            mtimes = self._get_mtimes()
+            if mtimes == self._mtimes or None in mtimes.values():
+                continue
+            self._mtimes = mtimes
+            loguru.logger.info("Whitelist files were modified, reload whitelists")
+            try:
+                with self._app.app_context():
+                    self._attempt_processor.reload_whitelists(self._whitelist_files)
+            except (OSError, ValueError, sa.exc.SQLAlchemyError) as e:
+                loguru.logger.error("Failed to reload whitelists: {}", e)
+
+
+class _WhitelistState(NamedTuple):
+    """
+    Whitelists with their feedback tables and candidate indexes, never modified (replaced as a whole, so that a request
+    never mixes a whitelist with a table or an index of another one).
+    """
+
+    whitelists_by_word_length: dict[int, Whitelist | MappedWhitelist]
+    feedback_tables_by_word_length: dict[int, FeedbackTable]
+    candidate_indexes_by_word_length: dict[int, CandidateIndex]
+
+
+class AttemptProcessor:
+    """
+    Process player attempts against today words.
+
+    Holds whitelists, daily word cache and precomputed feedback tables (if enabled) shared by API routes.
+    """
+
+    def __init__(
+        self,
+        whitelists_by_word_length: dict[int, Whitelist | MappedWhitelist],
+        precomputed_feedback: bool = False,
+        word_selector: DeterministicWordSelector | WordSchedule | None = None,
+        played_word_recorder: PlayedWordRecorder | None = None,
+        generation_lock_dir: str | None = None,
+        shared_cache_dir: str | None = None,
+    ):
+        """
+        Args:
+            whitelists_by_word_length: whitelist for each available word length
+            precomputed_feedback: compute attempt results with precomputed feedback tables
+            word_selector: compute daily words with deterministic word selector or load them from word schedule instead
+                of database (optional)
+            played_word_recorder: record daily words of word selector as played words (optional)
+            generation_lock_dir: directory of lock files coalescing today word generations of host processes
+                (optional)
+            shared_cache_dir: directory of daily word cache and feedback tables files shared between host processes
+                (optional, caches are in-process otherwise)
+        """
+        self._state = _WhitelistState(whitelists_by_word_length, {}, {})
+        # serializes state replacements
+        self._state_lock = threading.Lock()
+        self.precomputed_feedback = precomputed_feedback
+        self.word_selector = word_selector
+        self.played_word_recorder = played_word_recorder
+        self.generation_lock_dir = generation_lock_dir
+        self.shared_cache_dir = shared_cache_dir
+        self.daily_word_cache = (
+            SharedDailyWordCache(os.path.join(shared_cache_dir, "daily_words.bin"))
+            if shared_cache_dir
+            else DailyWordCache()
+        )
+        # feedback table rebuilds (e.g. day rolled over) and candidate index builds in flight
+        self._feedback_table_builds = SingleFlight()
+        self._candidate_index_builds = SingleFlight()
+
+    @property
+    def whitelists_by_word_length(self) -> dict[int, Whitelist | MappedWhitelist]:
+        """Whitelist for each available word length"""
+        return self._state.whitelists_by_word_length
+
+    def _store(
+        self,
+        whitelist: Whitelist | MappedWhitelist,
+        feedback_table: FeedbackTable | None = None,
+        candidate_index: CandidateIndex | None = None,
+    ) -> None:
+        """Add feedback table or candidate index of whitelist to state, unless whitelist was reloaded since then"""
+        with self._state_lock:
+            state = self._state
+            word_length = whitelist.word_length
+            if state.whitelists_by_word_length.get(word_length) is not whitelist:
+                return
+            if feedback_table is not None:
+                state = state._replace(
+                    feedback_tables_by_word_length={
+                        **state.feedback_tables_by_word_length,
+                        word_length: feedback_table,
+                    }
+                )
+            if candidate_index is not None:
+                state = state._replace(
+                    candidate_indexes_by_word_length={
+                        **state.candidate_indexes_by_word_length,
+                        word_length: candidate_index,
+                    }
+                )
+            self._state = state
+
+    def get_today_word(self, word_length: int) -> str:
+        """
+        Returns today word (from daily word cache, database, generated or computed by word selector), requires an app
+        context.
+        """
+        word = get_today_word(
+            self.whitelists_by_word_length[word_length],
+            self.daily_word_cache,
+            self.word_selector,
+            self.generation_lock_dir,
+        )
+        if self.played_word_recorder is not None:
+            self.played_word_recorder.record(word)
+        return word
+
+    def pregenerate_words(self, days: int) -> dict[int, dict[str, str]]:
+        """
+        Generate words of the next days (today included) for each word length, requires an app context.
+
+        Words are computed without database with deterministic word selector (words of word schedule cannot be
+        generated).
+
+        Returns:
+            Word by date ("yyyyMMdd") for each word length
+        """
+        if isinstance(self.word_selector, DeterministicWordSelector):
+            dates = [add_days(now_yyyymmdd(), i) for i in range(days)]
+            return {
+                word_length: {
+                    date: self.word_selector.select(whitelist, date) for date in dates
+                }
+                for word_length, whitelist in self.whitelists_by_word_length.items()
+            }
+        assert self.word_selector is None
+        return {
+            word_length: pregenerate_words(whitelist, days)
+            for word_length, whitelist in self.whitelists_by_word_length.items()
+        }
+
+    def get_cached_today_word(self, word_length: int) -> str | None:
+        """
+        Returns today word if it is in daily word cache (never queries database), None otherwise.
+        """
+        word = self.daily_word_cache.get(word_length, now_yyyymmdd())
+        if word is not None and self.played_word_recorder is not None:
+            self.played_word_recorder.record(word)
+        return word
+
+    def has_feedback_table(self, word: str) -> bool:
+        """
+        Returns True if computing attempt results against word does not (re)build a feedback table (feedback tables
+        are disabled or table of word is built).
+        """
+        if not self.precomputed_feedback:
+            return True
+        table = self._state.feedback_tables_by_word_length.get(len(word))
+        return table is not None and table.word == word
+
+    def _build_feedback_table(
+        self, whitelist: Whitelist | MappedWhitelist, word: str
+    ) -> FeedbackTable:
+        if self.shared_cache_dir:
+            return FeedbackTable.shared(whitelist, word, self.shared_cache_dir)
+        return FeedbackTable(whitelist, word)
+
+    def get_feedback_table(self, word: str) -> FeedbackTable:
+        """
+        Returns feedback table for word, (re)builds it if word changed (e.g. day rolled over). Concurrent rebuilds of
+        the same table are coalesced.
+        """
+        table = self._state.feedback_tables_by_word_length.get(len(word))
+        if table is None or table.word != word:
+            table = self._feedback_table_builds.do(
+                (len(word), word), functools.partial(self._rebuild_feedback_table, word)
+            )
+        return table
+
+    def _rebuild_feedback_table(self, word: str) -> FeedbackTable:
+        state = self._state
+        table = state.feedback_tables_by_word_length.get(len(word))
+        if table is not None and table.word == word:
+            # rebuilt by previous call of the same key
+            return table
+        whitelist = state.whitelists_by_word_length[len(word)]
+        table = self._build_feedback_table(whitelist, word)
+        self._store(whitelist, feedback_table=table)
+        loguru.logger.info(
+            "Feedback table for {} letters word built in {:.3f}s ({} words, {} bytes)",
+            len(word),
+            table.build_duration,
+            len(whitelist),
+            table.nbytes,
+        )
+        return table
+
+    def get_candidate_index(self, word_length: int) -> CandidateIndex:
+        """
+        Returns candidate index of whitelist, builds it on first use. Concurrent builds of the same index are coalesced.
+        """
+        index = self._state.candidate_indexes_by_word_length.get(word_length)
+        if index is None:
+            index = self._candidate_index_builds.do(
+                word_length, functools.partial(self._build_candidate_index, word_length)
+            )
+        return index
+
+    def _build_candidate_index(self, word_length: int) -> CandidateIndex:
+        state = self._state
+        index = state.candidate_indexes_by_word_length.get(word_length)
+        if index is not None:
+            # built by previous call of the same key
+            return index
+        whitelist = state.whitelists_by_word_length[word_length]
+        index = CandidateIndex(whitelist)
+        self._store(whitelist, candidate_index=index)
+        loguru.logger.info(
+            "Candidate index for {} letters words built in {:.3f}s ({} words, {} bytes)",
+            word_length,
+            index.build_duration,
+            len(whitelist),
+            index.nbytes,
+        )
+        return index
+
+    @property
+    def nbytes(self) -> int:
+        """Whitelists, feedback tables and candidate indexes memory size (in bytes)"""
+        state = self._state
+        return (
+            sum(w.nbytes for w in state.whitelists_by_word_length.values())
+            + sum(t.nbytes for t in state.feedback_tables_by_word_length.values())
+            + sum(i.nbytes for i in state.candidate_indexes_by_word_length.values())
+        )
+
+    def reload_whitelists(self, whitelist_files: dict[int, str]) -> dict:
+        """
+        Load whitelist files and build their feedback tables (if enabled) and candidate indexes (if already used), then
+        swap them in. In-flight requests keep using previous whitelists, tables and indexes, requests are never
+        blocked.
+        Requires an app context if feedback tables are enabled. Not supported with a word selector (its daily words
+        depend on whitelists loaded at startup).
+
+        Args:
+            whitelist_files: whitelist file (or compiled whitelist file) for each available word length
+
+        Returns:
+            Reload report (duration in seconds, memory size in bytes before and after reload)
+
+        Raises:
+            OSError: if a whitelist file opening fails
+            ValueError: if a whitelist file is invalid or a word selector is used
+            sqlalchemy.exc.SQLAlchemyError: if today words (used by feedback tables) cannot be read from database
+        """
+        if self.word_selector is not None:
+            raise ValueError("Whitelists cannot be reloaded with a word selector")
+        start = time.perf_counter()
+        nbytes_before = self.nbytes
+        whitelists_by_word_length = {
+            word_length: load_whitelist(filename)
+            for word_length, filename in whitelist_files.items()
+        }
+        for word_length, whitelist in whitelists_by_word_length.items():
+            if whitelist.word_length != word_length:
+                raise ValueError(
+                    f"'{whitelist_files[word_length]}' does not contain {word_length} letters words"
+                )
+        if list(whitelists_by_word_length.keys()) != AVAILABLE_WORD_LENGTHS:
+            raise ValueError("Missing whitelist file for some available word lengths")
+        feedback_tables_by_word_length = {}
+        if self.precomputed_feedback:
+            for word_length, whitelist in whitelists_by_word_length.items():
+                feedback_tables_by_word_length[word_length] = (
+                    self._build_feedback_table(
+                        whitelist, self.get_today_word(word_length)
+                    )
+                )
+
+        candidate_indexes_by_word_length = {
+            word_length: CandidateIndex(whitelists_by_word_length[word_length])
+            for word_length in self._state.candidate_indexes_by_word_length
+        }
+
+        # a request running during swap keeps whitelists, tables and indexes of previous state
+        with self._state_lock:
+            self._state = _WhitelistState(
+                whitelists_by_word_length,
+                feedback_tables_by_word_length,
+                candidate_indexes_by_word_length,
+            )
+        report = {
+            "duration": time.perf_counter() - start,
+            "nbytes_before": nbytes_before,
+            "nbytes_after": self.nbytes,
+        }
+        loguru.logger.info(
+            "Whitelists reloaded in {:.3f}s (memory {} -> {} bytes)",
+            report["duration"],
+            report["nbytes_before"],
+            report["nbytes_after"],
+        )
+        return report
+
+    def build_feedback_tables(self) -> None:
+        """
+        Build feedback table of today word for each word length, requires an app context.
+        """
+        for word_length in self.whitelists_by_word_length:
+            self.get_feedback_table(self.get_today_word(word_length))
+
+    def check_attempt(self, attempt: str) -> bytes | None:
+        """
+        Args:
+            attempt: player attempt (valid AttemptRequest attempt)
+
+        Returns:
+            Error (ErrorResponse JSON) if attempt is not in whitelist, None otherwise
+        """
+        start = time.perf_counter()
+        whitelist = self.whitelists_by_word_length.get(len(attempt))
+        whitelisted = attempt.lower() in whitelist
+        observe_stage(Stage.WHITELIST_LOOKUP, start)
+        if not whitelisted:
+            count_attempt(len(attempt), ErrorCode.ATTEMPT_NOT_IN_WHITELIST.name)
+            return encode_not_in_whitelist_error(attempt)
+        return None
+
+    def _attempt_result(self, attempt: str, word: str) -> list[LPS]:
+        """Attempt (lowercase) result, from today word feedback table if precomputed"""
+        attempt_result = None
+        if self.precomputed_feedback:
+            # None if attempt was checked against whitelists which were reloaded since then
+            attempt_result = self.get_feedback_table(word).attempt_result(attempt)
+        if attempt_result is None:
+            attempt_result = compute_attempt_result(attempt, word)
+        return attempt_result
+
+    def compute_attempt_result(self, attempt: str, word: str) -> bytes:
+        """
+        Args:
+            attempt: player attempt (whitelisted, see check_attempt)
+            word: today word
+
+        Returns:
+            Attempt result (AttemptResponse JSON)
+        """
+        start = time.perf_counter()
+        attempt = attempt.lower()
+        attempt_result = self._attempt_result(attempt, word)
+        observe_stage(Stage.ATTEMPT_RESULT, start)
+        count_attempt(len(attempt), "ok")
+        start = time.perf_counter()
+        data = encode_attempt_response(attempt_result)
+        observe_stage(Stage.SERIALIZATION, start)
+        return data
+
+    def process(
+        self, attempt: str, today_words_by_word_length: dict[int, str]
+    ) -> tuple[int, bytes]:
+        """
+        Compute attempt result against today word, requires an app context.
+
+        Args:
+            attempt: player attempt (valid AttemptRequest attempt)
+            today_words_by_word_length: today words already resolved, updated when today word is resolved
+
+        Returns:
+            HTTP status code (200 or 422) and attempt result (AttemptResponse JSON) or error if attempt is not in
+            whitelist (ErrorResponse JSON)
+        """
+        error = self.check_attempt(attempt)
+        if error is not None:
+            return 422, error
+        word = today_words_by_word_length.get(len(attempt))
+        if word is None:
+            word = self.get_today_word(len(attempt))
+            today_words_by_word_length[len(attempt)] = word
+        return 200, self.compute_attempt_result(attempt, word)
+
+    def _hard_mode_constraints(
+        self, word_length: int, previous_attempts: list[str], word: str
+    ) -> HardModeConstraints:
+        """Hard mode constraints compiled from previous attempts results against today word"""
+        return HardModeConstraints(
+            word_length,
+            (
+                (previous_attempt, self._attempt_result(previous_attempt, word))
+                for previous_attempt in map(str.lower, previous_attempts)
+            ),
+        )
+
+    def process_hard_mode(
+        self, attempt: str, previous_attempts: list[str]
+    ) -> tuple[int, bytes]:
+        """
+        Compute attempt result against today word if attempt satisfies hard mode constraints, requires an app context.
+
+        Previous attempts results are computed again against today word (clients cannot forge them) and compiled
+        into HardModeConstraints, attempt is then checked in a single pass over its letters.
+
+        Args:
+            attempt: player attempt (valid HardAttemptRequest attempt)
+            previous_attempts: player previous attempts (valid HardAttemptRequest previous attempts)
+
+        Returns:
+            HTTP status code (200 or 422) and attempt result (AttemptResponse JSON) or error if attempt is not in
+            whitelist or violates hard mode constraints (ErrorResponse JSON)
+        """
+        error = self.check_attempt(attempt)
+        if error is not None:
+            return 422, error
+        word = self.get_today_word(len(attempt))
+        start = time.perf_counter()
+        constraints = self._hard_mode_constraints(len(attempt), previous_attempts, word)
+        violation = constraints.violation(attempt.lower())
+        observe_stage(Stage.HARD_MODE_CHECK, start)
+        if violation is not None:
+            count_attempt(len(attempt), ErrorCode.ATTEMPT_VIOLATES_HARD_MODE.name)
+            return 422, ErrorResponse(
+                code=ErrorCode.ATTEMPT_VIOLATES_HARD_MODE,
+                error_msg=f"'{attempt}' violates hard mode ({violation})",
+            ).model_dump_json().encode()
+        return 200, self.compute_attempt_result(attempt, word)
+
+    def query_candidates(
+        self, word_length: int, previous_attempts: list[str], offset: int, limit: int
+    ) -> bytes:
+        """
+        Query whitelisted words which could still be today word given results of previous attempts (i.e. words
+        satisfying hard mode constraints), requires an app context.
+
+        Args:
+            word_length: today word length
+            previous_attempts: player previous attempts (valid CandidatesRequest previous attempts)
+            offset: number of candidate words to skip (in whitelist order)
+            limit: max number of candidate words to return
+
+        Returns:
+            Number of candidate words and a page of them (CandidatesResponse JSON)
+        """
+        word = self.get_today_word(word_length)
+        start = time.perf_counter()
+        constraints = self._hard_mode_constraints(word_length, previous_attempts, word)
+        count, words = self.get_candidate_index(word_length).query(
+            constraints, offset, limit
+        )
+        observe_stage(Stage.CANDIDATE_QUERY, start)
+        return CandidatesResponse(count=count, words=words).model_dump_json().encode()
@@ -0,0 +1,513 @@
+"""
+API request and response payloads (pydantic models, documented in OpenAPI spec) and their serialization.
+
+Responses on the attempt path are serialized once and reused as JSON bytes (see encode_* functions).
+"""
+
+import enum
+import functools
+import json
+from typing import Annotated, Any
+
+import pydantic
+
+from wordleapi.core import ATTEMPT_REGEX, AVAILABLE_WORD_LENGTHS
+from wordleapi.core import LetterPositionStatus as LPS
+
+
+class AttemptRequest(pydantic.BaseModel):
+    """Player attempt request to process."""
+
+    attempt: str = pydantic.Field(
+        title="Player attempt",
+        description="Player attempt to process.",
+        pattern=ATTEMPT_REGEX,
+        min_length=min(AVAILABLE_WORD_LENGTHS),
+        max_length=max(AVAILABLE_WORD_LENGTHS),
+    )
+
+    model_config = {
+        "openapi_extra": {
+            "examples": {
+                "req-1": {
+                    "summary": "1 - Valid attempt request (correct guess)",
+                    "value": {"attempt": "ARBRES"},
+                },
+                "req-2": {
+                    "summary": "2 - Valid attempt request (incorrect guess)",
+                    "value": {"attempt": "ARTERE"},
+                },
+                "req-3": {
+                    "summary": "3 - Invalid attempt request (attempt is too short)",
+                    "value": {"attempt": "ARB"},
+                },
+                "req-4": {
+                    "summary": "4 - Invalid attempt request (attempt is not a whitelisted word)",
+                    "value": {"attempt": "ABCDEF"},
+                },
+            }
+        }
+    }
+
+
+class AttemptResponse(pydantic.BaseModel):
+    """Player attempt result response."""
+
+    result: list[LPS] = pydantic.Field(
+        title="Attempt result",
+        description=f"Contains position status for each letter from request attempt:"
+        f"{LPS.__doc__}",
+    )
+
+    model_config = {
+        "openapi_extra": {
+            "description": "Player attempt result",
+            "examples": {
+                "resp-1": {
+                    "summary": "1 - Valid attempt response (correct guess)",
+                    "value": {"result": [0, 0, 0, 0, 0, 0]},
+                },
+                "resp-2": {
+                    "summary": "2 - Valid attempt response (incorrect guess)",
+                    "value": {"result": [0, 0, 2, 1, 1, 2]},
+                },
+            },
+        }
+    }
+
+
+class ErrorCode(enum.Enum):
+    """
+    100 (invalid payload),
+    101 (attempt not in whitelist)
+    102 (HTTP method not allowed)
+    103 (attempt violates hard mode constraints)
+    """
+
+    INVALID_PAYLOAD = 100
+    ATTEMPT_NOT_IN_WHITELIST = 101
+    METHOD_NOT_ALLOWED = 102
+    ATTEMPT_VIOLATES_HARD_MODE = 103
+
+
+class ErrorResponse(pydantic.BaseModel):
+    """API error response."""
+
+    code: ErrorCode = pydantic.Field(
+        title="API error code",
+        description="Computer friendly error code:" f"{ErrorCode.__doc__}",
+    )
+    error_msg: str = pydantic.Field(
+        title="API error message",
+        description="Human readable descriptive error message",
+    )
+
+    model_config = {
+        "openapi_extra": {
+            "description": "An error occurred",
+            "examples": {
+                "resp-3": {
+                    "summary": "3 - Invalid attempt response (attempt is too short) (HTTP 422)",
+                    "value": {
+                        "code": 100,
+                        "error_msg": f"Field 'attempt' is invalid or missing (String should have at least {min(AVAILABLE_WORD_LENGTHS)} characters)",
+                    },
+                },
+                "resp-4": {
+                    "summary": "4 - Invalid attempt response (attempt is not a whitelisted word) (HTTP 422)",
+                    "value": {"code": 101, "error_msg": "'ABCDEF' is not in whitelist"},
+                },
+                "resp-5": {
+                    "summary": "5 - Invalid HTTP method (HTTP 405)",
+                    "value": {
+                        "code": 102,
+                        "error_msg": "Method not allowed, accepted methods are ['OPTIONS', 'POST']",
+                    },
+                },
+                "resp-6": {
+                    "summary": "6 - Hard mode attempt ignores previous results (HTTP 422)",
+                    "value": {
+                        "code": 103,
+                        "error_msg": "'ABIMER' violates hard mode (letter 2 must be 'r')",
+                    },
+                },
+            },
+        }
+    }
+
+
+# Max number of attempts in a batch attempt request
+MAX_BATCH_ATTEMPTS = 100
+
+
+class AttemptsRequest(pydantic.BaseModel):
+    """Batch of player attempts to process."""
+
+    # items are validated one by one (see post_attempts), an invalid item only gets its own error
+    attempts: list[Any] = pydantic.Field(
+        title="Player attempts",
+        description="Player attempts to process, possibly of different lengths. "
+        "Each attempt is validated like AttemptRequest 'attempt' field, "
+        "invalid attempts (e.g. not a string) get an error in response.",
+        min_length=1,
+        max_length=MAX_BATCH_ATTEMPTS,
+    )
+
+    model_config = {
+        "openapi_extra": {
+            "examples": {
+                "req-1": {
+                    "summary": "1 - Valid batch attempt request",
+                    "value": {"attempts": ["ARTERE", "ARBRES", "ARB", "ABCDEF"]},
+                },
+            }
+        }
+    }
+
+
+class AttemptsResponse(pydantic.BaseModel):
+    """Batch of player attempt results."""
+
+    results: list[AttemptResponse | ErrorResponse] = pydantic.Field(
+        title="Attempt results",
+        description="Attempt result or error for each request attempt (in request order)",
+    )
+
+    model_config = {
+        "openapi_extra": {
+            "description": "Player attempt results",
+            "examples": {
+                "resp-1": {
+                    "summary": "1 - Valid batch attempt response",
+                    "value": {
+                        "results": [
+                            {"result": [0, 0, 2, 1, 1, 2]},
+                            {"result": [0, 0, 0, 0, 0, 0]},
+                            {
+                                "code": 100,
+                                "error_msg": f"Field 'attempt' is invalid or missing (String should have at least {min(AVAILABLE_WORD_LENGTHS)} characters)",
+                            },
+                            {"code": 101, "error_msg": "'ABCDEF' is not in whitelist"},
+                        ]
+                    },
+                },
+            },
+        }
+    }
+
+
+# Max number of previous attempts in a hard mode attempt request
+MAX_PREVIOUS_ATTEMPTS = 100
+
+# Player previous attempt, validated like AttemptRequest 'attempt' field
+PreviousAttempt = Annotated[
+    str,
+    pydantic.Field(
+        pattern=ATTEMPT_REGEX,
+        min_length=min(AVAILABLE_WORD_LENGTHS),
+        max_length=max(AVAILABLE_WORD_LENGTHS),
+    ),
+]
+
+
+class HardAttemptRequest(pydantic.BaseModel):
+    """Player attempt request to process in hard mode."""
+
+    attempt: str = pydantic.Field(
+        title="Player attempt",
+        description="Player attempt to process.",
+        pattern=ATTEMPT_REGEX,
+        min_length=min(AVAILABLE_WORD_LENGTHS),
+        max_length=max(AVAILABLE_WORD_LENGTHS),
+    )
+    previous_attempts: list[PreviousAttempt] = pydantic.Field(
+        title="Previous player attempts",
+        description="Player previous attempts of today game (same length as attempt), "
+        "their results are computed again against today word.",
+        max_length=MAX_PREVIOUS_ATTEMPTS,
+    )
+
+    @pydantic.field_validator("previous_attempts")
+    @classmethod
+    def check_previous_attempts_length(
+        cls, previous_attempts: list[str], info: pydantic.ValidationInfo
+    ) -> list[str]:
+        attempt = info.data.get("attempt")
+        if attempt is not None and any(
+            len(previous_attempt) != len(attempt)
+            for previous_attempt in previous_attempts
+        ):
+            raise ValueError("Previous attempts should have the same length as attempt")
+        return previous_attempts
+
+    model_config = {
+        "openapi_extra": {
+            "examples": {
+                "req-1": {
+                    "summary": "1 - Valid hard mode attempt request",
+                    "value": {"attempt": "ARBRES", "previous_attempts": ["ARTERE"]},
+                },
+                "req-2": {
+                    "summary": "2 - Hard mode attempt request ignoring previous results",
+                    "value": {"attempt": "ABIMER", "previous_attempts": ["ARTERE"]},
+                },
+            }
+        }
+    }
+
+
+# Max number of words in a candidates response
+MAX_CANDIDATES_LIMIT = 100
+
+
+class CandidatesRequest(pydantic.BaseModel):
+    """Query of words which could still be today word."""
+
+    word_length: int = pydantic.Field(
+        title="Word length",
+        description="Today word length.",
+        ge=min(AVAILABLE_WORD_LENGTHS),
+        le=max(AVAILABLE_WORD_LENGTHS),
+    )
+    previous_attempts: list[PreviousAttempt] = pydantic.Field(
+        title="Previous player attempts",
+        description="Player previous attempts of today game (of word length), "
+        "their results are computed again against today word.",
+        max_length=MAX_PREVIOUS_ATTEMPTS,
+    )
+    offset: int = pydantic.Field(
+        default=0,
+        title="Offset",
+        description="Number of candidate words to skip (in whitelist order).",
+        ge=0,
+    )
+    limit: int = pydantic.Field(
+        default=0,
+        title="Limit",
+        description="Max number of candidate words to return (only count is returned if 0).",
+        ge=0,
+        le=MAX_CANDIDATES_LIMIT,
+    )
+
+    @pydantic.field_validator("previous_attempts")
+    @classmethod
+    def check_previous_attempts_length(
+        cls, previous_attempts: list[str], info: pydantic.ValidationInfo
+    ) -> list[str]:
+        word_length = info.data.get("word_length")
+        if word_length is not None and any(
+            len(previous_attempt) != word_length
+            for previous_attempt in previous_attempts
+        ):
+            raise ValueError("Previous attempts should have word length")
+        return previous_attempts
+
+    model_config = {
+        "openapi_extra": {
+            "examples": {
+                "req-1": {
+                    "summary": "1 - Candidates count and first page",
+                    "value": {
+                        "word_length": 6,
+                        "previous_attempts": ["ARTERE"],
+                        "limit": 10,
+                    },
+                },
+            }
+        }
+    }
+
+
+class CandidatesResponse(pydantic.BaseModel):
+    """Words which could still be today word."""
+
+    count: int = pydantic.Field(
+        title="Candidates count",
+        description="Number of whitelisted words consistent with results of previous attempts",
+    )
+    words: list[str] = pydantic.Field(
+        title="Candidate words",
+        description="Requested page of candidate words (in whitelist order)",
+    )
+
+    model_config = {
+        "openapi_extra": {
+            "description": "Candidate words",
+            "examples": {
+                "resp-1": {
+                    "summary": "1 - Candidates count and first page",
+                    "value": {
+                        "count": 7,
+                        "words": [
+                            "araser",
+                            "arbres",
+                            "archer",
+                            "arguer",
+                            "ariser",
+                            "arquer",
+                            "arrhes",
+                        ],
+                    },
+                },
+            },
+        }
+    }
+
+
+# Serialized AttemptResponse by attempt result (as bytes, see encode_attempt_response), filled on first use, there is
+# at most 3^len(attempt) results by attempt length
+_attempt_response_json_by_result: dict[bytes, bytes] = {}
+
+# Serialized ATTEMPT_NOT_IN_WHITELIST ErrorResponse split around attempt (attempts only contain ASCII letters, see
+# ATTEMPT_REGEX, so they are never escaped)
+_NOT_IN_WHITELIST_JSON_PREFIX, _NOT_IN_WHITELIST_JSON_SUFFIX = (
+    ErrorResponse(
+        code=ErrorCode.ATTEMPT_NOT_IN_WHITELIST,
+        error_msg="'{attempt}' is not in whitelist",
+    )
+    .model_dump_json()
+    .encode()
+    .split(b"{attempt}")
+)
+
+# Serialized AttemptsResponse split around (empty) results list
+_ATTEMPTS_JSON_PREFIX, _ATTEMPTS_JSON_SUFFIX = (
+    AttemptsResponse(results=[]).model_dump_json().encode().split(b"[]")
+)
+
+
+def encode_attempt_response(result: list[LPS]) -> bytes:
+    """
+    Serialize attempt response, without pydantic serialization once result was serialized.
+
+    Args:
+        result: attempt result
+
+    Returns:
+        AttemptResponse(result=result) JSON (same bytes as model_dump_json)
+    """
+    key = bytes(result)
+    data = _attempt_response_json_by_result.get(key)
+    if data is None:
+        data = AttemptResponse(result=result).model_dump_json().encode()
+        _attempt_response_json_by_result[key] = data
+    return data
+
+
+def encode_not_in_whitelist_error(attempt: str) -> bytes:
+    """
+    Args:
+        attempt: player attempt (valid AttemptRequest attempt)
+
+    Returns:
+        ATTEMPT_NOT_IN_WHITELIST ErrorResponse JSON (same bytes as model_dump_json)
+    """
+    return (
+        _NOT_IN_WHITELIST_JSON_PREFIX + attempt.encode() + _NOT_IN_WHITELIST_JSON_SUFFIX
+    )
+
+
+def encode_attempts_response(results: list[bytes]) -> bytes:
+    """
+    Args:
+        results: attempt results and errors (AttemptResponse or ErrorResponse JSON)
+
+    Returns:
+        AttemptsResponse JSON (same bytes as model_dump_json)
+    """
+    return (
+        _ATTEMPTS_JSON_PREFIX + b"[" + b",".join(results) + b"]" + _ATTEMPTS_JSON_SUFFIX
+    )
+
+
+@functools.cache
+def encode_method_not_allowed_error(valid_methods: tuple[str, ...]) -> bytes:
+    """
+    Args:
+        valid_methods: route accepted methods
+
+    Returns:
+        METHOD_NOT_ALLOWED ErrorResponse JSON (cached by accepted methods)
+    """
+    return (
+        ErrorResponse(
+            code=ErrorCode.METHOD_NOT_ALLOWED,
+            error_msg=f"Method not allowed, accepted methods are {list(valid_methods)}",
+        )
+        .model_dump_json()
+        .encode()
+    )
+
+
+def make_validation_error(e: pydantic.ValidationError) -> ErrorResponse:
+    """
+    Create an API error for a validation error.
+
+    Args:
+        e: The ValidationError object containing the details of the error.
+
+    Returns:
+        ErrorResponse: invalid payload error (first validation error details)
+    """
+    return ErrorResponse(
+        code=ErrorCode.INVALID_PAYLOAD,
+        error_msg=f"Field '{e.errors()[0].get('loc')[0]}' is invalid or missing ({e.errors()[0].get('msg')})",
+    )
+
+
+def _make_attempt_request_error_json(payload: dict) -> bytes:
+    try:
+        AttemptRequest.model_validate(payload)
+    except pydantic.ValidationError as e:
+        return make_validation_error(e).model_dump_json().encode()
+    raise ValueError(f"{payload} is a valid attempt request")
+
+
+_MIN_ATTEMPT_LENGTH = min(AVAILABLE_WORD_LENGTHS)
+_MAX_ATTEMPT_LENGTH = max(AVAILABLE_WORD_LENGTHS)
+
+# Serialized AttemptRequest validation errors (see validate_attempt_request), built from pydantic validation errors
+# so messages are the same
+_MISSING_ATTEMPT_JSON = _make_attempt_request_error_json({})
+_NOT_STR_ATTEMPT_JSON = _make_attempt_request_error_json({"attempt": 0})
+_TOO_SHORT_ATTEMPT_JSON = _make_attempt_request_error_json(
+    {"attempt": "a" * (_MIN_ATTEMPT_LENGTH - 1)}
+)
+_TOO_LONG_ATTEMPT_JSON = _make_attempt_request_error_json(
+    {"attempt": "a" * (_MAX_ATTEMPT_LENGTH + 1)}
+)
+_INVALID_FORMAT_ATTEMPT_JSON = _make_attempt_request_error_json(
+    {"attempt": "1" * _MIN_ATTEMPT_LENGTH}
+)
+
+
+def validate_attempt_request(body: bytes) -> tuple[str | None, bytes | None]:
+    """
+    Validate AttemptRequest JSON without pydantic (fast validation path).
+
+    Same checks, in the same order, and same errors as AttemptRequest validation: attempt type, min length, max
+    length then format (ATTEMPT_REGEX, i.e. ASCII letters only). Body which is not a JSON object is handled like an
+    empty object.
+
+    Args:
+        body: request body
+
+    Returns:
+        Attempt and None if body is valid, None and error (INVALID_PAYLOAD ErrorResponse JSON) otherwise
+    """
+    try:
+        payload = json.loads(body) if body else None
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict) or "attempt" not in payload:
+        return None, _MISSING_ATTEMPT_JSON
+    attempt = payload["attempt"]
+    if not isinstance(attempt, str):
+        return None, _NOT_STR_ATTEMPT_JSON
+    if len(attempt) < _MIN_ATTEMPT_LENGTH:
+        return None, _TOO_SHORT_ATTEMPT_JSON
+    if len(attempt) > _MAX_ATTEMPT_LENGTH:
+        return None, _TOO_LONG_ATTEMPT_JSON
+    if not (attempt.isascii() and attempt.isalpha()):
+        return None, _INVALID_FORMAT_ATTEMPT_JSON
+    return attempt, None
@@ -1,16 +1,118 @@
 import datetime
+import os
 import random
+import time
 
 import pytz
 
+# Random generator used to pick words, seeded once per process (see seed_random) instead of on every pick
+_random = random.Random()
+_random_seed: int | None = None
+
+
+def seed_random(seed: int | None = None) -> None:
+    """
+    Seed random generator used by pick_random_element.
+
+    Forked processes (e.g. gunicorn workers) reseed it with the same seed, so they do not share generator state with
+    their parent.
+
+    Args:
+        seed: seed to make picks reproducible, None to seed from OS entropy
+    """
+    global _random_seed
+    _random_seed = seed
+    _random.seed(seed)
+
+
+os.register_at_fork(after_in_child=lambda: _random.seed(_random_seed))
+
+
+class DayClock:
+    """
+    Current date in a timezone as "yyyyMMdd" string (day key).
+
+    Day key is cached with current day bounds (midnight and next midnight timestamps), it is only recomputed when
+    time leaves them (e.g. at midnight, or when time is moved by freezegun), so getting it is a timestamp comparison.
+    """
+
+    def __init__(self, tz: str = "Europe/Paris", time_fn=None):
+        """
+        Args:
+            tz: timezone name
+            time_fn: returns current timestamp (default to time.time, looked up on each call so freezegun applies)
+        """
+        self._tz = pytz.timezone(tz)
+        self._time_fn = time_fn
+        # (day start timestamp, next day start timestamp, day key), replaced at once
+        self._day = (0.0, 0.0, "")
+
+    def _now(self) -> float:
+        return self._time_fn() if self._time_fn is not None else time.time()
+
+    def _compute_day(self, now: float) -> tuple[float, float, str]:
+        date = datetime.datetime.fromtimestamp(now, self._tz).date()
+        start = self._tz.localize(datetime.datetime.combine(date, datetime.time()))
+        end = self._tz.localize(
+            datetime.datetime.combine(
+                date + datetime.timedelta(days=1), datetime.time()
+            )
+        )
+        return start.timestamp(), end.timestamp(), date.strftime("%Y%m%d")
+
+    def today(self) -> str:
+        """
+        Returns:
+            Current date as "yyyyMMdd" string
+        """
+        now = self._now()
+        start, end, day = self._day
+        if not start <= now < end:
+            start, end, day = self._day = self._compute_day(now)
+        return day
+
+
+# Clock used by now_yyyymmdd (see set_clock)
+_clock = DayClock()
+
+
+def set_clock(clock: DayClock) -> DayClock:
+    """
+    Replace clock used by now_yyyymmdd (e.g. a clock with a fake time function in tests).
+
+    Args:
+        clock: clock to use
+
+    Returns:
+        Previous clock (to restore it)
+    """
+    global _clock
+    previous_clock, _clock = _clock, clock
+    return previous_clock
+
 
 def now_yyyymmdd() -> str:
     """
     Returns:
-        Current date in Paris (France) as "yyyyMMdd" string
+        Current date in Paris (France) as "yyyyMMdd" string, from cached day key of clock (see DayClock)
         (e.g. on 2023/08/07 returns "20230807")
     """
-    return datetime.datetime.now(pytz.timezone("Europe/Paris")).strftime("%Y%m%d")
+    return _clock.today()
+
+
+def add_days(yyyymmdd: str, days: int) -> str:
+    """
+    Args:
+        yyyymmdd: date as "yyyyMMdd" string
+        days: number of days to add (may be negative)
+
+    Returns:
+        Date days after yyyymmdd as "yyyyMMdd" string
+        (e.g. add_days("20230831", 1) returns "20230901")
+    """
+    return (
+        datetime.datetime.strptime(yyyymmdd, "%Y%m%d") + datetime.timedelta(days=days)
+    ).strftime("%Y%m%d")
 
 
 def pick_random_element(seq: list | tuple):
@@ -23,5 +125,4 @@ def pick_random_element(seq: list | tuple):
     Returns:
         Random element from seq
     """
-    random.seed()
-    return seq[random.randrange(len(seq))]
+    return seq[_random.randrange(len(seq))]
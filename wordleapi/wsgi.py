@@ -1,3 +1,9 @@
+import gc
+
 from wordleapi.api import create_app
 
 app = create_app()
+
+# Move startup objects (whitelists, precomputed tables...) to garbage collector permanent generation: when app is
+# preloaded (gunicorn --preload), collections in workers would otherwise write to these pages and copy them
+gc.freeze()